@@ -0,0 +1,102 @@
+
+"""Reply-suggestion latency, backend load and cache hit rate against the local stub model.
+
+    python benchmarks/bench_ai_replies.py [--messages 240] [--rooms 4] [--latency 0.6]
+
+Compares the old behaviour (one backend request per message, every result
+published) with ReplySuggester (cache + coalescing + debounce/cancel) on the
+same bursty, repetitive message stream.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from varta.ai_service import ReplySuggester, StubBackend, build_reply_prompt
+
+PHRASES = ["gg", "ready?", "Ready", "where are you", "need backup", "moving north", "hold position",
+           "eta?", "ack", "nice shot!", "regroup at base", "who has the file", "brb", "lol", "on my way"]
+
+def workload(messages: int, rooms: int, seed: int = 5):
+    """Bursty arrivals; phrase popularity is Zipf-like, so repeats are common."""
+    rng = random.Random(seed)
+    weights = [1.0 / (i + 1) for i in range(len(PHRASES))]
+    t = 0.0
+    events = []
+    for _ in range(messages):
+        t += rng.expovariate(25.0) if rng.random() < 0.7 else rng.expovariate(4.0)
+        text = rng.choices(PHRASES, weights)[0]
+        if rng.random() < 0.3: text = text.upper() + "!"
+        events.append((t, f"GID-{rng.randrange(rooms)}", text))
+    return events
+
+async def drive(events, submit):
+    start = time.perf_counter()
+    for at, room, text in events:
+        delay = start + at - time.perf_counter()
+        if delay > 0: await asyncio.sleep(delay)
+        submit(room, text, time.perf_counter())
+
+async def run_naive(events, backend):
+    published, latencies, tasks = [], [], []
+    last_sent = {}
+    async def request(room, text, sent):
+        await backend.complete(build_reply_prompt(text))
+        latencies.append(time.perf_counter() - sent)
+        published.append((room, sent < last_sent.get(room, 0)))
+    def submit(room, text, sent):
+        last_sent[room] = sent
+        tasks.append(asyncio.ensure_future(request(room, text, sent)))
+    await drive(events, submit)
+    await asyncio.gather(*tasks)
+    stale = sum(1 for _, was_stale in published if was_stale)
+    return {"backend_calls": backend.calls, "published": len(published), "stale_published": stale,
+            "latencies": latencies, "hit_rate": 0.0}
+
+async def run_engine(events, backend):
+    latencies, stale = [], []
+    sent_at = {}
+    # publish runs inside the task suggest() started for that message, which maps it back to its send time.
+    request_sent = {}
+    def publish(room, replies):
+        sent = request_sent[asyncio.current_task()]
+        latencies.append(time.perf_counter() - sent)
+        stale.append(sent < sent_at[room])
+    engine = ReplySuggester(backend, publish)
+    def submit(room, text, sent):
+        sent_at[room] = sent
+        engine.suggest(room, text)
+        request_sent[engine._pending[room]] = sent
+    await drive(events, submit)
+    while engine._pending or engine._inflight: await asyncio.sleep(0.05)
+    return {"backend_calls": backend.calls, "published": engine.stats["published"], "stale_published": sum(stale),
+            "latencies": latencies, "hit_rate": engine.hit_rate(), "stats": engine.stats}
+
+def pct(values, p):
+    if not values: return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=240)
+    parser.add_argument("--rooms", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.6, help="stub model base latency (s)")
+    args = parser.parse_args()
+
+    events = workload(args.messages, args.rooms)
+    print(f"workload: {len(events)} messages over {events[-1][0]:.1f} s in {args.rooms} rooms, stub latency {args.latency:.2f}s+jitter")
+    print(f"{'engine':<10} {'backend calls':>14} {'published':>10} {'stale pub':>10} {'hit rate':>9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for label, runner in (("naive", run_naive), ("suggester", run_engine)):
+        result = asyncio.run(runner(events, StubBackend(latency=args.latency)))
+        lat = result["latencies"]
+        print(f"{label:<10} {result['backend_calls']:>14} {result['published']:>10} {result['stale_published']:>10} "
+              f"{result['hit_rate']:>8.0%} {pct(lat, 0.5) * 1000:>8.0f} {pct(lat, 0.95) * 1000:>8.0f} {max(lat or [0]) * 1000:>8.0f}")
+        if "stats" in result: print(f"{'':<10} {result['stats']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+
+"""Catch-up brief cost over a growing unread window, against the local stub model.
+
+    python benchmarks/bench_catchup.py [--steps 8] [--step-messages 60] [--chunk 40] [--max-tokens 1500]
+
+A room gains --step-messages pulses between catch-up requests while the
+unread start stays put, as when a liaison keeps reopening the brief. Each
+row is one CatchUpSummarizer request: backend calls it made, chunks it
+summarized vs took from the cache, tokens sent and the largest single
+prompt. "one prompt" is the size of sending the whole unread window at once.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from varta.ai_service import SUMMARY_PROMPT, CatchUpSummarizer, StubBackend, estimate_tokens
+from varta.pulse_columns import ColumnarArchive
+
+GID = "GID-CATCHUP"
+WORDS = ["status", "copy", "moving", "to", "sector", "north", "hold", "position", "ack", "eta", "five", "minutes",
+         "ready", "regroup", "at", "base", "who", "has", "the", "file", "need", "backup", "confirm", "route"]
+
+def grow(room, count: int, rng: random.Random):
+    t0 = 1_700_000_000_000
+    for _ in range(count):
+        i = len(room)
+        room.append(f"P-{t0 + i}-{rng.randint(100, 999)}", f"LIA-{200000 + rng.randrange(6)}", f"Liaison {rng.randrange(6)}",
+                    " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 40))), t0 + i * 1000)
+
+async def run(steps: int, step_messages: int, chunk: int, max_tokens: int, unread_from: int):
+    rng = random.Random(7)
+    room = ColumnarArchive().room(GID)
+    grow(room, unread_from, rng)
+    backend = StubBackend(latency=0.0, jitter=0.0)
+    summarizer = CatchUpSummarizer(backend, chunk_size=chunk, max_request_tokens=max_tokens)
+    rows = []
+    for _ in range(steps):
+        grow(room, step_messages, rng)
+        before = dict(summarizer.stats)
+        prompts = len(backend.prompts)
+        await summarizer.summarize(GID, room, unread_from)
+        delta = {k: summarizer.stats[k] - before[k] for k in before}
+        whole = estimate_tokens(SUMMARY_PROMPT + "\n".join(summarizer._line(room[i]) for i in range(unread_from, len(room))))
+        rows.append({"unread": len(room) - unread_from, "calls": delta["backend_calls"], "summarized": delta["chunks_summarized"],
+                     "cached": delta["chunks_cached"], "tokens": delta["tokens_sent"],
+                     "max_prompt": max((estimate_tokens(p) for p in backend.prompts[prompts:]), default=0), "one_prompt": whole})
+    return rows, summarizer.stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=8)
+    parser.add_argument("--step-messages", type=int, default=60)
+    parser.add_argument("--chunk", type=int, default=40)
+    parser.add_argument("--max-tokens", type=int, default=1500)
+    parser.add_argument("--read", type=int, default=100, help="pulses already read before the unread window")
+    args = parser.parse_args()
+
+    rows, stats = asyncio.run(run(args.steps, args.step_messages, args.chunk, args.max_tokens, args.read))
+    print(f"{args.steps} catch-up requests, +{args.step_messages} pulses each, chunks of {args.chunk}, {args.max_tokens} tokens/request cap\n")
+    print(f"{'unread':>7} {'calls':>6} {'summarized':>11} {'cached':>7} {'tokens':>7} {'max prompt':>11} {'one prompt':>11}")
+    for r in rows:
+        print(f"{r['unread']:>7} {r['calls']:>6} {r['summarized']:>11} {r['cached']:>7} {r['tokens']:>7} {r['max_prompt']:>11} {r['one_prompt']:>11}")
+    print(f"\n{stats}")
+
+if __name__ == "__main__":
+    main()
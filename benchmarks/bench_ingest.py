@@ -0,0 +1,86 @@
+
+"""Ingest cost of a message burst: one signal at a time vs batched frames.
+
+    python benchmarks/bench_ingest.py [--messages 2000] [--batch 50] [--frame-ms 16]
+
+Both modes boot a headless client with the burst's room open. "per message"
+publishes every signal as its own REMOTE_SIGNAL (the path each socket
+'message' took before batching); "batched" fires 'message_batch' frames of
+--batch signals at the client socket, as server.js sends them. Each signal
+or frame is its own event-loop turn, like separate socket events.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import headless
+
+GID = "GID-INGEST"
+UID = "LIA-000001"
+
+def make_signals(messages: int):
+    t0 = 1_700_000_000_000
+    return [{"id": f"P-{t0 + i}-{i % 900 + 100}", "roomId": GID, "senderId": f"LIA-{200000 + i % 12}",
+             "senderName": f"Liaison {i % 12}", "content": f"status update {i}", "timestamp": t0 + i, "assetType": "TEXT"}
+            for i in range(messages)]
+
+async def run(mode: str, signals, batch: int, frame_interval: float):
+    env = headless.HeadlessEnv(frame_interval=frame_interval)
+    protocols = {GID: {"gid": GID, "nomenclature": "Ingest", "classification": "ASSEMBLY", "participants": [UID], "description": ""}}
+    main = await headless.boot_app(env, uid=UID, protocols=protocols, module_name=f"varta_ingest_{mode.replace(' ', '_')}")
+    app = main.app
+    app.activate_protocol(GID)
+    await asyncio.sleep(0.1)
+    await app._store.flush()
+
+    events = {"PULSE_ARCHIVED": 0, "PULSES_ARCHIVED": 0}
+    for name in events: main.nexus_bus.subscribe(name, lambda _, name=name: events.__setitem__(name, events[name] + 1))
+    app._ui.reset_stats()
+    writes0, bytes0, html0 = env.storage.writes, env.storage.bytes_written, env.document.html_bytes
+    socket = app._network._socket
+
+    busy = 0.0
+    start = time.perf_counter()
+    if mode == "per message":
+        for signal in signals:
+            t0 = time.perf_counter()
+            main.nexus_bus.publish("REMOTE_SIGNAL", signal)
+            busy += time.perf_counter() - t0
+            await asyncio.sleep(0)
+    else:
+        for i in range(0, len(signals), batch):
+            t0 = time.perf_counter()
+            socket.fire("message_batch", {"roomId": GID, "messages": signals[i:i + batch]})
+            busy += time.perf_counter() - t0
+            await asyncio.sleep(0)
+    await asyncio.sleep(frame_interval * 2 + 0.1)
+    await app._store.flush()
+    wall = time.perf_counter() - start
+
+    stream = app._ui.stats().get("stream", {})
+    return {"mode": mode, "archived": len(app._registry._archives[GID]), "busy_ms": busy * 1000.0, "wall_s": wall,
+            "events": events["PULSE_ARCHIVED"] + events["PULSES_ARCHIVED"], "marks": stream.get("marks", 0),
+            "renders": stream.get("renders", 0), "writes": env.storage.writes - writes0,
+            "storage_mb": (env.storage.bytes_written - bytes0) / 1e6, "html_mb": (env.document.html_bytes - html0) / 1e6,
+            "errors": len(env.console.errors)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--frame-ms", type=float, default=16.0, help="animation frame interval; 0 renders on every loop turn")
+    args = parser.parse_args()
+
+    signals = make_signals(args.messages)
+    rows = [asyncio.run(run(mode, signals, args.batch, args.frame_ms / 1000.0)) for mode in ("per message", "batched")]
+    print(f"{args.messages} signals into one open room, batches of {args.batch}\n")
+    print(f"{'mode':<12} {'archived':>9} {'ingest ms':>10} {'events':>7} {'marks':>6} {'renders':>8} {'writes':>7} {'store MB':>9} {'html MB':>8} {'errors':>7}")
+    for r in rows:
+        print(f"{r['mode']:<12} {r['archived']:>9} {r['busy_ms']:>10.1f} {r['events']:>7} {r['marks']:>6} {r['renders']:>8} "
+              f"{r['writes']:>7} {r['storage_mb']:>9.2f} {r['html_mb']:>8.1f} {r['errors']:>7}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+
+"""Retained memory of a decoded message store: StrategicPulse lists vs columnar rooms.
+
+    python benchmarks/bench_pulse_memory.py [--messages 100000] [--rooms 8] [--senders 40]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from varta.models import StrategicPulse
+from varta.pulse_columns import ColumnarArchive
+
+WORDS = ["status", "copy", "moving", "to", "sector", "north", "hold", "position", "ack", "eta", "five", "minutes", "ready", "🔥", "👍", "confirm", "relay", "assembly", "signal", "clear"]
+
+def build_store(messages: int, rooms: int, senders: int) -> str:
+    rng = random.Random(7)
+    gids = [f"GID-{100000 + i}" for i in range(rooms)]
+    people = [(f"LIA-{200000 + i}", f"Liaison {i}") for i in range(senders)]
+    store = {gid: [] for gid in gids}
+    t0 = 1_700_000_000_000
+    for i in range(messages):
+        gid = rng.choice(gids)
+        uid, name = rng.choice(people)
+        store[gid].append({
+            "id": f"P-{t0 + i}-{rng.randint(100, 999)}", "protocol_code": gid,
+            "origin_uid": uid, "origin_designation": name,
+            "transmission": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))),
+            "timestamp": t0 + i * 250, "asset_type": "TEXT",
+        })
+    return json.dumps(store)
+
+def load_dataclasses(raw: str):
+    return {gid: [StrategicPulse(**p) for p in pulses] for gid, pulses in json.loads(raw).items()}
+
+def load_columnar(raw: str):
+    archive = ColumnarArchive()
+    archive.load_raw(json.loads(raw))
+    return archive
+
+def measure(loader, raw: str):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = loader(raw)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--rooms", type=int, default=8)
+    parser.add_argument("--senders", type=int, default=40)
+    args = parser.parse_args()
+
+    raw = build_store(args.messages, args.rooms, args.senders)
+    print(f"store: {args.messages} messages, {args.rooms} rooms, {args.senders} senders, {len(raw) / 1e6:.1f} MB JSON")
+    rows = []
+    for label, loader in (("dataclass", load_dataclasses), ("columnar", load_columnar)):
+        result, current, peak, elapsed = measure(loader, raw)
+        rows.append((label, current, peak, elapsed))
+        del result
+    base = rows[0][1]
+    print(f"{'layout':<10} {'retained MB':>12} {'peak MB':>10} {'load s':>8} {'vs dataclass':>13}")
+    for label, current, peak, elapsed in rows:
+        print(f"{label:<10} {current / 1e6:>12.1f} {peak / 1e6:>10.1f} {elapsed:>8.2f} {current / base:>12.0%}")
+
+if __name__ == "__main__":
+    main()
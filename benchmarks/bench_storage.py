@@ -0,0 +1,122 @@
+
+"""Storage throughput: legacy whole-store localStorage writes vs the PulseStore backends.
+
+    python benchmarks/bench_storage.py [--messages 5000] [--rooms 8] [--batch 50]
+
+Write modes append the same pulses one at a time; "per pulse" flushes after
+every append, "batched" every ``--batch`` appends (what the write-behind
+timer does under load). The read section compares decoding the legacy store
+at boot with reading the newest page of each room and paging one room.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import headless
+
+headless.install()
+
+from varta.pulse_columns import ColumnarArchive
+from varta.storage import PAGE_SIZE, LocalStorageBackend, MemoryBackend, PulseStore, migrate_legacy
+
+UID = "LIA-000001"
+WORDS = ["status", "copy", "moving", "to", "sector", "north", "hold", "position", "ack", "eta", "five", "minutes", "ready", "🔥", "👍", "confirm"]
+
+def make_pulses(messages: int, rooms: int):
+    rng = random.Random(11)
+    gids = [f"GID-{100000 + i}" for i in range(rooms)]
+    t0 = 1_700_000_000_000
+    return [{"id": f"P-{t0 + i}-{rng.randint(100, 999)}", "protocol_code": gid, "origin_uid": f"LIA-{200000 + rng.randint(0, 39)}",
+             "origin_designation": "Liaison", "transmission": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 12))),
+             "timestamp": t0 + i * 250, "asset_type": "TEXT"}
+            for i, gid in ((i, rng.choice(gids)) for i in range(messages))]
+
+def legacy_writes(pulses):
+    """The pre-PulseStore path: re-serialize the whole archive into one key on every pulse."""
+    storage = headless.Storage()
+    archive = ColumnarArchive()
+    start = time.perf_counter()
+    for p in pulses:
+        archive.room(p["protocol_code"]).append_dict(p)
+        storage.setItem(f"varta_msgstore_{UID}", json.dumps(archive.to_serializable()))
+    return time.perf_counter() - start, storage.writes, storage.bytes_written
+
+async def store_writes(backend, pulses, batch: int):
+    store = await PulseStore(backend, delay=3600).open()
+    start = time.perf_counter()
+    for i, p in enumerate(pulses, 1):
+        store.append(p["protocol_code"], p)
+        if i % batch == 0: await store.flush()
+    await store.flush()
+    return time.perf_counter() - start, store.stats["flushes"]
+
+async def bench_writes(pulses, batch: int):
+    print(f"{'write mode':<28} {'pulses/s':>10} {'commits':>8} {'MB written':>11}")
+    elapsed, writes, written = legacy_writes(pulses)
+    print(f"{'legacy localStorage':<28} {len(pulses) / elapsed:>10.0f} {writes:>8} {written / 1e6:>11.1f}")
+    for label, size in (("per pulse", 1), ("batched", batch)):
+        storage = headless.Storage()
+        elapsed, commits = await store_writes(LocalStorageBackend(storage, UID), pulses, size)
+        print(f"{'localStorage ' + label:<28} {len(pulses) / elapsed:>10.0f} {commits:>8} {storage.bytes_written / 1e6:>11.1f}")
+    for label, size in (("per pulse", 1), ("batched", batch)):
+        backend = MemoryBackend()
+        elapsed, commits = await store_writes(backend, pulses, size)
+        print(f"{'memory (IndexedDB) ' + label:<28} {len(pulses) / elapsed:>10.0f} {commits:>8} {backend.stats['bytes'] / 1e6:>11.1f}")
+
+async def bench_reads(pulses):
+    store = {}
+    for p in pulses: store.setdefault(p["protocol_code"], []).append(p)
+    storage = headless.Storage()
+    storage.setItem(f"varta_msgstore_{UID}", json.dumps(store))
+
+    start = time.perf_counter()
+    ColumnarArchive().load_raw(json.loads(storage.getItem(f"varta_msgstore_{UID}")))
+    legacy = time.perf_counter() - start
+
+    backend = MemoryBackend()
+    start = time.perf_counter()
+    migrated = await migrate_legacy(storage, UID, backend)
+    migrate = time.perf_counter() - start
+
+    pulse_store = await PulseStore(backend).open()
+    archive = ColumnarArchive()
+    start = time.perf_counter()
+    for gid in pulse_store.rooms():
+        _, rows = await pulse_store.read_recent(gid)
+        archive.load_raw({gid: rows})
+    recent = time.perf_counter() - start
+
+    gid = max(pulse_store.rooms(), key=pulse_store.head)
+    start = time.perf_counter()
+    end, pages = pulse_store.head(gid), 0
+    while end > 0:
+        end, _ = await pulse_store.read_recent(gid, end=end)
+        pages += 1
+    paging = time.perf_counter() - start
+
+    print(f"{'read':<28} {'ms':>10}")
+    print(f"{'legacy boot decode':<28} {legacy * 1000:>10.1f}   all {len(pulses)} pulses")
+    print(f"{'one-time migration':<28} {migrate * 1000:>10.1f}   {migrated} pulses")
+    print(f"{'boot: newest page per room':<28} {recent * 1000:>10.1f}   {sum(len(r) for r in archive.values())} pulses, {PAGE_SIZE}/room")
+    print(f"{'page through busiest room':<28} {paging * 1000:>10.1f}   {pulse_store.head(gid)} pulses in {pages} pages")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--rooms", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=50)
+    args = parser.parse_args()
+
+    pulses = make_pulses(args.messages, args.rooms)
+    print(f"{args.messages} pulses across {args.rooms} rooms\n")
+    asyncio.run(bench_writes(pulses, args.batch))
+    print()
+    asyncio.run(bench_reads(pulses))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+
+"""Minimal stand-ins for the PyScript ``js`` / ``pyodide.ffi`` modules.
+
+Just enough DOM, storage and socket surface to boot the varta package outside the
+browser so benchmarks exercise the real client code. Nothing is rendered;
+DOM writes land on plain attributes.
+"""
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import time
+import types
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path: sys.path.insert(0, ROOT)
+
+def _noop(*args, **kwargs):
+    return None
+
+class Style:
+    def __init__(self):
+        self.display = ""
+
+class ClassList:
+    def __init__(self):
+        self._names = set()
+
+    def add(self, *names): self._names.update(names)
+    def remove(self, *names): self._names.difference_update(names)
+    def contains(self, name): return name in self._names
+    def toggle(self, name):
+        if name in self._names: self._names.discard(name)
+        else: self._names.add(name)
+
+class Rect:
+    def __init__(self, width=800.0, height=600.0):
+        self.left = 0.0; self.top = 0.0
+        self.width = width; self.height = height
+
+class Context2D:
+    """Canvas 2D context: every drawing call is accepted and counted."""
+    def __init__(self):
+        self.calls = 0
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls += 1
+        return call
+
+class Element:
+    def __init__(self, document, tag="div", element_id=""):
+        self._document = document
+        self.tagName = tag.upper()
+        self.id = element_id
+        self.style = Style()
+        self.classList = ClassList()
+        self.className = ""
+        self.innerText = ""
+        self.value = ""
+        self.children: List["Element"] = []
+        self.parentElement = None
+        self.width = 800; self.height = 600
+        self.scrollHeight = 0
+        self.offsetWidth = 0
+        self.href = ""; self.download = ""
+        self._innerHTML = ""
+        self._context = None
+
+    @property
+    def innerHTML(self):
+        return self._innerHTML
+
+    @innerHTML.setter
+    def innerHTML(self, value):
+        self._document.html_bytes += len(value)
+        self._innerHTML = value
+
+    def appendChild(self, child):
+        child.parentElement = self
+        self.children.append(child)
+        return child
+
+    def remove(self):
+        if self.parentElement and self in self.parentElement.children:
+            self.parentElement.children.remove(self)
+        self.parentElement = None
+
+    def getBoundingClientRect(self):
+        self._document.layout_reads += 1
+        return Rect()
+
+    def getContext(self, kind):
+        if self._context is None: self._context = Context2D()
+        return self._context
+
+    addEventListener = _noop
+    scrollTo = _noop
+    click = _noop
+
+class Document:
+    def __init__(self):
+        self._by_id: Dict[str, Element] = {}
+        self.html_bytes = 0
+        self.layout_reads = 0
+        self.created = 0
+        canvas = self.getElementById("board-canvas")
+        canvas.parentElement = self.getElementById("nexus-drawing-surface")
+
+    def getElementById(self, element_id):
+        el = self._by_id.get(element_id)
+        if el is None:
+            el = Element(self, "div", element_id)
+            self._by_id[element_id] = el
+        return el
+
+    def createElement(self, tag):
+        self.created += 1
+        return Element(self, tag)
+
+    visibilityState = "visible"
+    addEventListener = _noop
+
+class Storage:
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+        self.writes = 0
+        self.bytes_written = 0
+
+    def getItem(self, key): return self._data.get(key)
+    def setItem(self, key, value):
+        self.writes += 1
+        self.bytes_written += len(value)
+        self._data[key] = str(value)
+    def removeItem(self, key): self._data.pop(key, None)
+    def key(self, i): return list(self._data)[i] if 0 <= i < len(self._data) else None
+    @property
+    def length(self): return len(self._data)
+
+class Console:
+    def __init__(self):
+        self.errors: List[str] = []
+    def error(self, *args): self.errors.append(" ".join(str(a) for a in args))
+    log = warn = info = table = _noop
+
+class FakeSocket:
+    """socket.io client double: handlers are registered by event and driven by the harness."""
+    def __init__(self, sid="SID-HEADLESS"):
+        self.id = sid
+        self.connected = False
+        self.handlers: Dict[str, List[Callable]] = {}
+        self.emitted: List[tuple] = []
+        self.on_emit: Callable = None
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, payload=None):
+        self.emitted.append((event, payload))
+        if self.on_emit: self.on_emit(event, payload)
+
+    def disconnect(self):
+        self.connected = False
+
+    def fire(self, event, *args):
+        for handler in self.handlers.get(event, []): handler(*args)
+
+    def open(self):
+        self.connected = True
+        self.fire("connect")
+
+class SocketIO:
+    def __init__(self, socket_factory):
+        self._factory = socket_factory
+        self.sockets: List[FakeSocket] = []
+
+    def connect(self, endpoint, config=None):
+        socket = self._factory()
+        self.sockets.append(socket)
+        asyncio.get_event_loop().call_soon(socket.open)
+        return socket
+
+class Location:
+    hostname = "localhost"; origin = "http://localhost:3000"; port = "3000"; protocol = "http:"
+    def reload(self): pass
+
+class HeadlessWindow:
+    def __init__(self, env):
+        self._env = env
+        self.location = Location()
+        self.io = SocketIO(env.socket_factory)
+        self.Object = types.SimpleNamespace(fromEntries=dict)
+        self.process = types.SimpleNamespace(env=types.SimpleNamespace(API_KEY=""))
+
+    def addEventListener(self, *args): pass
+
+    def requestAnimationFrame(self, callback):
+        self._env.frames_requested += 1
+        loop = asyncio.get_event_loop()
+        if self._env.frame_interval: loop.call_later(self._env.frame_interval, callback, time.perf_counter() * 1000)
+        else: loop.call_soon(callback, time.perf_counter() * 1000)
+
+class HeadlessEnv:
+    def __init__(self, frame_interval: float = 0.0, socket_factory=FakeSocket):
+        self.frame_interval = frame_interval
+        self.frames_requested = 0
+        self.socket_factory = socket_factory
+        self.document = Document()
+        self.storage = Storage()
+        self.console = Console()
+        self.window = HeadlessWindow(self)
+
+def install(env: HeadlessEnv = None) -> HeadlessEnv:
+    """Register fake ``js`` and ``pyodide.ffi`` modules; call before importing the package."""
+    env = env or HeadlessEnv()
+    js = types.ModuleType("js")
+    js.window = env.window; js.document = env.document; js.localStorage = env.storage; js.console = env.console
+    js.navigator = types.SimpleNamespace(); js.Image = object; js.FileReader = object; js.GoogleGenAI = None
+    pyodide = types.ModuleType("pyodide")
+    ffi = types.ModuleType("pyodide.ffi")
+    ffi.to_js = lambda value, **kwargs: value
+    ffi.create_proxy = lambda fn: fn
+    pyodide.ffi = ffi
+    sys.modules["js"] = js
+    sys.modules["pyodide"] = pyodide
+    sys.modules["pyodide.ffi"] = ffi
+    return env
+
+def load_main(env: HeadlessEnv, module_name: str = "varta_headless"):
+    """Import a fresh copy of the varta package as ``module_name`` bound to ``env`` and launch it.
+
+    Distinct names give isolated clients. Lazy feature modules are imported
+    up front (but attached on first use as usual) so their ``js`` globals
+    bind to this client's env rather than whichever env was installed last.
+    """
+    install(env)
+    folder = os.path.join(ROOT, "varta")
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(folder, "__init__.py"), submodule_search_locations=[folder])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = package
+    spec.loader.exec_module(package)
+    app = package.launch()
+    for feature in sys.modules[f"{module_name}.controller"].LAZY_FEATURES:
+        importlib.import_module(f"{module_name}.{feature}")
+    return types.SimpleNamespace(app=app, package=package, nexus_bus=sys.modules[f"{module_name}.mesh"].nexus_bus)
+
+async def boot_app(env: HeadlessEnv, uid="LIA-000001", designation="Headless", protocols: dict = None,
+                   module_name: str = "varta_headless", timeout=10.0):
+    """Launch the app under ``env`` with a stored identity and wait until its socket is live."""
+    env.storage.setItem("varta_liaison_signature", json.dumps({"uid": uid, "designation": designation, "avatar_proxy": "",
+                                                               "liaison_status": "Authorized", "last_seen": 0.0}))
+    if protocols:
+        env.storage.setItem(f"varta_protocols_{uid}", json.dumps(protocols))
+    main = load_main(env, module_name)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        sock = main.app._network._socket
+        if main.app._registry is not None and sock is not None and sock.connected: break
+        await asyncio.sleep(0.02)
+    else:
+        raise RuntimeError("headless app did not finish booting")
+    return main
@@ -0,0 +1,161 @@
+
+"""Replay a recorded signal trace through the real client code, headless.
+
+Record in the browser console with ``app.start_trace()`` / ``app.stop_trace()``,
+then:
+
+    python benchmarks/replay_trace.py varta_trace_1700000000.jsonl [--speed max|recorded|<factor>]
+    python benchmarks/replay_trace.py --synthesize 20000 > trace.jsonl
+
+Signals enter at the socket ``message`` handler of LiaisonNetwork, so the
+ServiceMesh fan-out, PulseRegistry ingest, discovery and board handlers and
+the render scheduler all run as in the browser. The busiest room in the
+trace is activated so board and cursor pulses are not discarded.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless
+from varta.room_channels import route_channel, split_channel
+from varta.signal_trace import SignalRecorder, load_trace
+
+REPLAY_UID = "LIA-000000"
+
+def synthesize(count: int, rooms: int = 6, peers: int = 30, seed: int = 11) -> str:
+    """A mixed chat / board / cursor / beacon session for trying the tool without a capture."""
+    rng = random.Random(seed)
+    gids = [f"GID-{300000 + i}" for i in range(rooms)]
+    people = [(f"LIA-{400000 + i}", f"Peer {i}") for i in range(peers)]
+    clock = [1_700_000_000.0]
+    recorder = SignalRecorder(clock=lambda: clock[0])
+    recorder.start(redact=False)
+    for i in range(count):
+        clock[0] += rng.expovariate(40.0)
+        uid, name = rng.choice(people)
+        gid = gids[0] if rng.random() < 0.5 else rng.choice(gids)
+        roll = rng.random()
+        if roll < 0.03:
+            content = json.dumps({"type": "BEACON", "identity": {"uid": uid, "designation": name, "avatar_proxy": "", "liaison_status": "Authorized", "last_seen": 0.0}, "timestamp": clock[0]})
+            gid = "varta_global_signaling"
+        elif roll < 0.45:
+            content = json.dumps({"type": "MOUSE_PULSE", "x": rng.uniform(0, 800), "y": rng.uniform(0, 600), "uid": uid, "name": name})
+        elif roll < 0.75:
+            content = json.dumps({"type": "BOARD_PULSE", "kind": "line", "x": rng.uniform(0, 800), "y": rng.uniform(0, 600), "color": "#1e40af", "size": 6, "tool": "brush"})
+        elif roll < 0.85:
+            content = rng.choice(["👍", "🔥", "🚀", "✨"])
+        else:
+            content = " ".join(rng.choice(["copy", "moving", "hold", "ready", "eta", "five", "ack", "clear"]) for _ in range(rng.randint(2, 10)))
+        recorder.record({"id": f"P-{int(clock[0] * 1000)}-{i}", "roomId": route_channel(gid, content), "senderId": uid, "senderName": name,
+                         "content": content, "timestamp": int(clock[0] * 1000), "assetType": "TEXT"})
+    return recorder.stop()
+
+class HandlerTimings:
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def wrap(self, label, callback):
+        if asyncio.iscoroutinefunction(callback): return callback
+        samples = self.samples[label]
+        def timed(data):
+            start = time.perf_counter()
+            try:
+                return callback(data)
+            finally:
+                samples.append((time.perf_counter() - start) * 1000.0)
+        return timed
+
+    def instrument(self, mesh):
+        for event, callbacks in mesh._registry.items():
+            for i, cb in enumerate(callbacks):
+                name = getattr(cb, "__qualname__", repr(cb)).replace(".<locals>", "")
+                callbacks[i] = self.wrap(f"{event} -> {name}", cb)
+
+def percentile(values, pct):
+    if not values: return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+async def replay(events, speed, frame_interval):
+    env = headless.HeadlessEnv(frame_interval=frame_interval)
+    rooms = Counter(split_channel(s.get("roomId"))[0] for _, s in events if s.get("roomId") != "varta_global_signaling")
+    protocols = {gid: {"gid": gid, "nomenclature": f"Replay {gid[-4:]}", "classification": "ASSEMBLY",
+                       "participants": [REPLAY_UID], "description": "Replay"} for gid in rooms}
+    main = await headless.boot_app(env, uid=REPLAY_UID, designation="Replay", protocols=protocols)
+    app = main.app
+    if rooms: app.activate_protocol(rooms.most_common(1)[0][0])
+    await asyncio.sleep(0.05)
+
+    timings = HandlerTimings()
+    timings.instrument(main.nexus_bus)
+    app._ui.reset_stats()
+    socket = app._network._socket
+    writes0, bytes0, html0 = env.storage.writes, env.storage.bytes_written, env.document.html_bytes
+
+    ingest = []
+    start = time.perf_counter()
+    for i, (dt, signal) in enumerate(events):
+        if speed:
+            delay = start + dt / 1000.0 / speed - time.perf_counter()
+            if delay > 0: await asyncio.sleep(delay)
+        t0 = time.perf_counter()
+        socket.fire("message", signal)
+        ingest.append((time.perf_counter() - t0) * 1000.0)
+        if not speed and i % 64 == 0: await asyncio.sleep(0)
+    await asyncio.sleep(0.05)
+    await app._store.flush()
+    wall = time.perf_counter() - start
+
+    return {
+        "signals": len(events), "wall_s": wall, "throughput": len(events) / wall if wall else 0.0,
+        "ingest": ingest, "handlers": timings.samples, "renders": app._ui.stats(), "frames": app._ui.frames,
+        "storage_writes": env.storage.writes - writes0, "storage_bytes": env.storage.bytes_written - bytes0,
+        "html_bytes": env.document.html_bytes - html0, "errors": env.console.errors,
+    }
+
+def report(result):
+    print(f"signals        {result['signals']}")
+    print(f"wall time      {result['wall_s']:.2f} s")
+    print(f"throughput     {result['throughput']:.0f} signals/s")
+    print(f"ingest ms      mean {sum(result['ingest']) / max(1, len(result['ingest'])):.3f}  p95 {percentile(result['ingest'], 0.95):.3f}  max {max(result['ingest'] or [0]):.3f}")
+    print(f"storage        {result['storage_writes']} writes, {result['storage_bytes'] / 1e6:.1f} MB")
+    print(f"innerHTML      {result['html_bytes'] / 1e6:.1f} MB over {result['frames']} frames")
+    print()
+    print(f"{'handler':<62} {'calls':>7} {'mean ms':>9} {'p95 ms':>8} {'max ms':>8} {'total ms':>10}")
+    for label, samples in sorted(result["handlers"].items(), key=lambda kv: -sum(kv[1])):
+        if not samples: continue
+        print(f"{label[:62]:<62} {len(samples):>7} {sum(samples) / len(samples):>9.3f} {percentile(samples, 0.95):>8.3f} {max(samples):>8.3f} {sum(samples):>10.1f}")
+    print()
+    print(f"{'component':<12} {'marks':>7} {'renders':>8} {'avg ms':>8} {'max ms':>8} {'total ms':>10}")
+    for name, s in result["renders"].items():
+        if s["marks"]: print(f"{name:<12} {s['marks']:>7} {s['renders']:>8} {s['avg_ms']:>8.3f} {s['max_ms']:>8.2f} {s['total_ms']:>10.1f}")
+    if result["errors"]:
+        print(f"\n{len(result['errors'])} console errors, first: {result['errors'][0]}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a VartaSphere signal trace headlessly.")
+    parser.add_argument("trace", nargs="?", help="trace file recorded with app.stop_trace()")
+    parser.add_argument("--speed", default="max", help="'max', 'recorded', or a time-scale factor (e.g. 4)")
+    parser.add_argument("--frame-ms", type=float, default=16.0, help="animation frame interval; 0 renders on every loop turn")
+    parser.add_argument("--synthesize", type=int, metavar="N", help="write an N-signal synthetic trace to stdout and exit")
+    args = parser.parse_args()
+
+    if args.synthesize:
+        sys.stdout.write(synthesize(args.synthesize))
+        return
+    if not args.trace: parser.error("a trace file is required (or --synthesize N)")
+    with open(args.trace, encoding="utf-8") as fh:
+        header, events = load_trace(fh.read())
+    speed = 0.0 if args.speed == "max" else 1.0 if args.speed == "recorded" else float(args.speed)
+    print(f"trace: {len(events)} signals, redacted={header.get('redacted')}, speed={args.speed}")
+    report(asyncio.run(replay(events, speed, args.frame_ms / 1000.0)))
+
+if __name__ == "__main__":
+    main()
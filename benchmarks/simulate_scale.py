@@ -0,0 +1,282 @@
+
+"""Signaling scale simulator: N virtual liaisons running the real client code.
+
+Each liaison is its own headless copy of the varta package (see headless.py) whose
+socket talks to an in-process hub with the same room semantics as server.js:
+``join_room``/``leave_room`` manage membership, ``send_message`` on
+``varta_global_signaling`` goes to every socket, anything else goes to the
+room's members (sender included), and ``::board`` channels keep the stroke
+log that ``fetch_board`` returns. Chat rooms are framed like the server does:
+messages within MESSAGE_BATCH_S go out as one ``message_batch``.
+
+    python benchmarks/simulate_scale.py --scenario idle --clients 10,100,1000
+    python benchmarks/simulate_scale.py --scenario chat --clients 50,200 --duration 15
+    python benchmarks/simulate_scale.py --scenario whiteboard --clients 16,64
+    python benchmarks/simulate_scale.py --scenario whiteboard --clients 64 --memberships 8
+
+Scenarios:
+  idle        presence only: the discovery beacon every liaison already runs
+  chat        assemblies of --room-size members chatting and reacting
+  whiteboard  rooms of 8 with two drawers and moving cursors; --memberships K also
+              makes every liaison a background member of K-1 other boards
+
+Traffic is accounted for every socket. Only --observe sockets actually run
+their handlers for deliveries, so large N measures protocol volume without
+needing N real-time browsers in one process. Bytes are JSON payload sizes,
+excluding socket.io framing.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import headless
+
+GLOBAL_ROOM = "varta_global_signaling"
+MESSAGE_BATCH_S = 0.020
+MESSAGE_BATCH_LIMIT = 200
+EMOJI = ["👍", "🔥", "🚀", "✨", "❤️"]
+WORDS = ["copy", "moving", "hold", "ready", "eta", "five", "ack", "clear", "north", "relay"]
+_run_ids = itertools.count()
+
+class Meter:
+    __slots__ = ("msgs_in", "bytes_in", "msgs_out", "bytes_out")
+
+    def __init__(self):
+        self.msgs_in = 0; self.bytes_in = 0
+        self.msgs_out = 0; self.bytes_out = 0
+
+class HubSocket(headless.FakeSocket):
+    def __init__(self, hub, sid):
+        super().__init__(sid)
+        self.hub = hub
+        self.meter = Meter()
+        self.observed = False
+        self.on_emit = lambda event, payload: hub.handle(self, event, payload)
+
+class SignalHub:
+    """In-process equivalent of server.js: rooms, global signaling broadcast, per-socket metering."""
+
+    def __init__(self):
+        self.sockets = []
+        self.rooms = defaultdict(set)
+        self.boards = defaultdict(list)
+        self.outbox = {}
+        self.meter = Meter()
+        self._sids = itertools.count(1)
+
+    def socket_factory(self):
+        sock = HubSocket(self, f"SID-{next(self._sids)}")
+        self.sockets.append(sock)
+        return sock
+
+    def reset(self):
+        self.meter = Meter()
+        for sock in self.sockets: sock.meter = Meter()
+
+    def handle(self, sock, event, payload):
+        if event == "join_room":
+            self.rooms[payload.get("id")].add(sock)
+        elif event == "leave_room":
+            rid = payload.get("id")
+            self.rooms[rid].discard(sock)
+            if not self.rooms[rid] and "::" not in rid: self.boards.pop(f"{rid}::board", None)
+        elif event == "fetch_board":
+            history = {"roomId": payload.get("id"), "pulses": list(self.boards.get(payload.get("id"), ()))}
+            if sock.observed: asyncio.get_event_loop().call_soon(sock.fire, "board_history", history)
+        elif event == "send_message":
+            size = len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+            sock.meter.msgs_out += 1; sock.meter.bytes_out += size
+            self.meter.msgs_in += 1; self.meter.bytes_in += size
+            rid = payload.get("roomId")
+            if rid.endswith("::board"): self._record_board(rid, payload)
+            if rid == GLOBAL_ROOM or "::" in rid or rid.startswith("varta_probe_"): self._broadcast(rid, "message", payload, size)
+            else: self._queue(rid, payload)
+
+    def _queue(self, rid, payload):
+        pending = self.outbox.get(rid)
+        if pending is None:
+            pending = self.outbox[rid] = ([], asyncio.get_event_loop().call_later(MESSAGE_BATCH_S, self._flush_room, rid))
+        pending[0].append(payload)
+        if len(pending[0]) >= MESSAGE_BATCH_LIMIT: self._flush_room(rid)
+
+    def _flush_room(self, rid):
+        pending = self.outbox.pop(rid, None)
+        if pending is None: return
+        messages, timer = pending
+        timer.cancel()
+        event, frame = ("message", messages[0]) if len(messages) == 1 else ("message_batch", {"roomId": rid, "messages": messages})
+        self._broadcast(rid, event, frame, len(json.dumps(frame, ensure_ascii=False).encode("utf-8")))
+
+    def _broadcast(self, rid, event, payload, size):
+        targets = self.sockets if rid == GLOBAL_ROOM else list(self.rooms.get(rid, ()))
+        observed = []
+        for target in targets:
+            if not target.connected: continue
+            target.meter.msgs_in += 1; target.meter.bytes_in += size
+            if target.observed: observed.append(target)
+        self.meter.msgs_out += len(targets); self.meter.bytes_out += size * len(targets)
+        if observed: asyncio.get_event_loop().call_soon(self._deliver, observed, event, payload)
+
+    def _record_board(self, rid, payload):
+        if json.loads(payload.get("content")).get("kind") == "clear": self.boards.pop(rid, None)
+        else: self.boards[rid].append(payload)
+
+    @staticmethod
+    def _deliver(targets, event, payload):
+        for target in targets:
+            if target.connected: target.fire(event, payload)
+
+class Liaison:
+    def __init__(self, index, env, main):
+        self.index = index
+        self.env = env
+        self.main = main
+        self.app = main.app
+        self.socket = self.app._network._socket
+
+def _protocol(gid, members, label):
+    return {"gid": gid, "nomenclature": f"{label} {gid[-4:]}", "classification": "ASSEMBLY", "participants": members, "description": "Simulated"}
+
+def plan_rooms(n, scenario, room_size, memberships=1):
+    size = 8 if scenario == "whiteboard" else room_size
+    uids = [f"LIA-{500000 + i}" for i in range(n)]
+    rooms = {}
+    for start in range(0, n, size):
+        gid = f"GID-{700000 + start // size}"
+        rooms[gid] = uids[start:start + size]
+    membership = {}
+    for gid, members in rooms.items():
+        for uid in members: membership[uid] = gid
+    gids = list(rooms)
+    background = {uid: [gids[(gids.index(membership[uid]) + k) % len(gids)] for k in range(1, min(memberships, len(gids)))] for uid in uids}
+    return uids, rooms, membership, background
+
+async def boot_liaisons(hub, n, scenario, room_size, observe, memberships=1):
+    uids, rooms, membership, background = plan_rooms(n, scenario, room_size, memberships)
+    run = next(_run_ids)
+
+    async def boot(i, uid):
+        env = headless.HeadlessEnv(frame_interval=0.016, socket_factory=hub.socket_factory)
+        env.document.getElementById("board-brush-size").value = "6"
+        env.document.getElementById("board-brush-color").value = "#1e40af"
+        gid = membership[uid]
+        protocols = {g: _protocol(g, rooms[g], "Sim") for g in [gid] + background[uid]}
+        main = await headless.boot_app(env, uid=uid, designation=f"Sim {i}", module_name=f"varta_sim_{run}_{i}",
+                                       protocols=protocols, timeout=60.0)
+        main.app.activate_protocol(gid)
+        return Liaison(i, env, main)
+
+    liaisons = await asyncio.gather(*(boot(i, uid) for i, uid in enumerate(uids)))
+    for liaison in liaisons[:observe]: liaison.socket.observed = True
+    return liaisons, rooms
+
+async def chat_driver(liaison, rng, rate):
+    app = liaison.app
+    field = liaison.env.document.getElementById("transmission-payload")
+    while True:
+        await asyncio.sleep(rng.expovariate(rate))
+        if rng.random() < 0.3:
+            app.send_global_emoji(rng.choice(EMOJI))
+        else:
+            field.value = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 12)))
+            app.dispatch_strategic_pulse()
+
+async def board_driver(liaison, rng, drawing, hz):
+    app = liaison.app
+    board = app._feature("paint")
+    event = SimpleNamespace(clientX=rng.uniform(0, 800), clientY=rng.uniform(0, 600))
+    if drawing:
+        app._paint_active = True
+        board._handle_draw_start(event)
+    while True:
+        await asyncio.sleep(1.0 / hz)
+        event.clientX = min(800, max(0, event.clientX + rng.uniform(-12, 12)))
+        event.clientY = min(600, max(0, event.clientY + rng.uniform(-12, 12)))
+        board._handle_board_move(event)
+
+async def lag_probe(samples, interval=0.1):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - start - interval)
+
+async def run_scale(n, args):
+    hub = SignalHub()
+    liaisons, rooms = await boot_liaisons(hub, n, args.scenario, args.room_size, min(n, args.observe), args.memberships)
+    drivers = []
+    if args.scenario == "chat":
+        drivers = [asyncio.ensure_future(chat_driver(l, random.Random(l.index), args.chat_rate)) for l in liaisons]
+    elif args.scenario == "whiteboard":
+        by_uid = {l.app._signature.uid: l for l in liaisons}
+        for members in rooms.values():
+            for pos, uid in enumerate(members):
+                drawer = pos < 2
+                drivers.append(asyncio.ensure_future(board_driver(by_uid[uid], random.Random(uid), drawer, args.draw_hz if drawer else args.cursor_hz)))
+    lags = []
+    probe = asyncio.ensure_future(lag_probe(lags))
+
+    await asyncio.sleep(args.warmup)
+    hub.reset(); lags.clear()
+    start = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    elapsed = time.perf_counter() - start
+    snapshot = hub.meter, [s.meter for s in hub.sockets]
+    for task in drivers + [probe]: task.cancel()
+    errors = sum(len(l.env.console.errors) for l in liaisons)
+    return n, elapsed, snapshot, lags, errors
+
+def summarize(n, elapsed, snapshot, lags, errors):
+    hub, meters = snapshot
+    per_in = sorted(m.msgs_in / elapsed for m in meters)
+    per_in_bytes = sorted(m.bytes_in / elapsed for m in meters)
+    per_out = sorted(m.msgs_out / elapsed for m in meters)
+    mean = lambda xs: sum(xs) / len(xs) if xs else 0.0
+    return {
+        "clients": n,
+        "hub_in_msgs": hub.msgs_in / elapsed, "hub_out_msgs": hub.msgs_out / elapsed,
+        "hub_out_bytes": hub.bytes_out / elapsed,
+        "client_in_msgs": mean(per_in), "client_in_msgs_max": per_in[-1] if per_in else 0.0,
+        "client_in_bytes": mean(per_in_bytes), "client_out_msgs": mean(per_out),
+        "lag_ms": max(lags or [0.0]) * 1000.0, "errors": errors,
+    }
+
+def print_table(scenario, rows):
+    print(f"scenario: {scenario}")
+    print(f"{'N':>6} {'hub in/s':>10} {'hub out/s':>11} {'hub out KB/s':>13} {'client in/s':>12} {'max in/s':>9} {'client in KB/s':>15} {'client out/s':>13} {'max lag ms':>11}")
+    for r in rows:
+        print(f"{r['clients']:>6} {r['hub_in_msgs']:>10.1f} {r['hub_out_msgs']:>11.1f} {r['hub_out_bytes'] / 1024:>13.1f} "
+              f"{r['client_in_msgs']:>12.1f} {r['client_in_msgs_max']:>9.1f} {r['client_in_bytes'] / 1024:>15.2f} "
+              f"{r['client_out_msgs']:>13.2f} {r['lag_ms']:>11.1f}" + (f"  ({r['errors']} client errors)" if r["errors"] else ""))
+    if any(r["lag_ms"] > 250 for r in rows):
+        print("note: event-loop lag above 250 ms means the simulator itself saturated; rates at that N are lower bounds.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate N VartaSphere liaisons against an in-process signaling hub.")
+    parser.add_argument("--scenario", choices=["idle", "chat", "whiteboard"], default="idle")
+    parser.add_argument("--clients", default="10,100", help="comma-separated client counts")
+    parser.add_argument("--duration", type=float, default=11.0, help="measured seconds per run (beacons fire every 5 s)")
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--room-size", type=int, default=20, help="assembly size for idle/chat")
+    parser.add_argument("--chat-rate", type=float, default=0.1, help="messages per second per liaison")
+    parser.add_argument("--draw-hz", type=float, default=60.0, help="pointer events per second while drawing")
+    parser.add_argument("--cursor-hz", type=float, default=20.0, help="pointer events per second for watchers")
+    parser.add_argument("--memberships", type=int, default=1, help="rooms each liaison belongs to (one active)")
+    parser.add_argument("--observe", type=int, default=40, help="liaisons that execute their inbound handlers")
+    args = parser.parse_args()
+
+    rows = []
+    for n in [int(x) for x in args.clients.split(",") if x.strip()]:
+        rows.append(summarize(*asyncio.run(run_scale(n, args))))
+    print_table(args.scenario, rows)
+
+if __name__ == "__main__":
+    main()
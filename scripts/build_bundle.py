@@ -0,0 +1,43 @@
+
+"""Pack the ``varta`` package into varta.zip for PyScript.
+
+    python scripts/build_bundle.py [--out varta.zip]
+
+index.html maps the archive to ``./*`` in its files config, so the browser
+fetches one file and PyScript unpacks ``varta/`` next to main.py. Entries
+are written in sorted order with a fixed timestamp, so an unchanged tree
+produces a byte-identical archive.
+"""
+import argparse
+import os
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "varta"
+EPOCH = (1980, 1, 1, 0, 0, 0)
+
+def package_files():
+    for folder, dirs, files in os.walk(os.path.join(ROOT, PACKAGE)):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"): yield os.path.join(folder, name)
+
+def build(out: str) -> int:
+    count = 0
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+        for path in package_files():
+            info = zipfile.ZipInfo(os.path.relpath(path, ROOT).replace(os.sep, "/"), EPOCH)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, "rb") as fh: bundle.writestr(info, fh.read())
+            count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=os.path.join(ROOT, f"{PACKAGE}.zip"))
+    args = parser.parse_args()
+    count = build(args.out)
+    print(f"{args.out}: {count} modules, {os.path.getsize(args.out) / 1024:.1f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,62 @@ app.get('/env-config.js', (req, res) => {
   `);
 });
 
+// Ephemeral board channels ("<gid>::board") keep a bounded stroke log since the last
+// clear, so a client that only subscribes while viewing a room can catch up on open.
+// A log is dropped once its chat room (not just the board channel, which only
+// holds whoever is viewing it) has no members left; at most BOARD_ROOMS_LIMIT
+// logs are kept, the least recently drawn in going first.
+const BOARD_HISTORY_LIMIT = 2000;
+const BOARD_ROOMS_LIMIT = 500;
+const boardHistory = new Map();
+
+function recordBoardPulse(rid, data) {
+  let kind = null;
+  try { kind = JSON.parse(data.content).kind; } catch (e) { return; }
+  if (kind === 'clear') {
+    boardHistory.delete(rid);
+    return;
+  }
+  const log = boardHistory.get(rid) || [];
+  log.push(data);
+  if (log.length > BOARD_HISTORY_LIMIT) log.splice(0, log.length - BOARD_HISTORY_LIMIT);
+  // Re-inserting keeps the Map in least-recently-drawn order.
+  boardHistory.delete(rid);
+  boardHistory.set(rid, log);
+  if (boardHistory.size > BOARD_ROOMS_LIMIT) boardHistory.delete(boardHistory.keys().next().value);
+}
+
+// Fires when the last socket leaves or disconnects from a room.
+io.of('/').adapter.on('delete-room', (room) => {
+  if (!room.includes('::')) boardHistory.delete(`${room}::board`);
+});
+
+// Durable chat rooms are broadcast in frames: messages for a room that arrive within
+// MESSAGE_BATCH_MS go out as one 'message_batch' event ({ roomId, messages }).
+// A lone message is still sent as a plain 'message'.
+const MESSAGE_BATCH_MS = 20;
+const MESSAGE_BATCH_LIMIT = 200;
+const outbox = new Map();
+
+function flushRoom(rid) {
+  const pending = outbox.get(rid);
+  if (!pending) return;
+  outbox.delete(rid);
+  clearTimeout(pending.timer);
+  if (pending.messages.length === 1) io.to(rid).emit('message', pending.messages[0]);
+  else io.to(rid).emit('message_batch', { roomId: rid, messages: pending.messages });
+}
+
+function queueRoomMessage(rid, data) {
+  let pending = outbox.get(rid);
+  if (!pending) {
+    pending = { messages: [], timer: setTimeout(() => flushRoom(rid), MESSAGE_BATCH_MS) };
+    outbox.set(rid, pending);
+  }
+  pending.messages.push(data);
+  if (pending.messages.length >= MESSAGE_BATCH_LIMIT) flushRoom(rid);
+}
+
 io.on('connection', (socket) => {
   console.log(`[Liaison Connect] SID: ${socket.id}`);
 
@@ -34,8 +90,20 @@ io.on('connection', (socket) => {
     console.log(`[Room Action] SID ${socket.id} joined ${data.id}`);
   });
 
+  socket.on('leave_room', (data) => {
+    if (typeof data?.id !== 'string') return;
+    socket.leave(data.id);
+    console.log(`[Room Action] SID ${socket.id} left ${data.id}`);
+  });
+
+  socket.on('fetch_board', (data) => {
+    if (typeof data?.id !== 'string') return;
+    socket.emit('board_history', { roomId: data.id, pulses: boardHistory.get(data.id) || [] });
+  });
+
   socket.on('send_message', (data) => {
-    const rid = data.roomId;
+    const rid = data?.roomId;
+    if (typeof rid !== 'string') return;
     console.log(`[Transmission] Origin: ${data.senderId} | Target: ${rid}`);
     
     // Crucial: 'varta_global_signaling' is the discovery channel. 
@@ -43,8 +111,10 @@ io.on('connection', (socket) => {
     if (rid === "varta_global_signaling") {
         io.emit('message', data);
     } else {
-        // Direct room broadcast for established protocol channels.
-        io.to(rid).emit('message', data);
+        if (rid.endsWith('::board')) recordBoardPulse(rid, data);
+        // Live channels (cursor, board) and link probes go out immediately; chat rooms are framed.
+        if (rid.includes('::') || rid.startsWith('varta_probe_')) io.to(rid).emit('message', data);
+        else queueRoomMessage(rid, data);
     }
   });
 
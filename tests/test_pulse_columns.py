@@ -0,0 +1,12 @@
+from varta.pulse_columns import ColumnarArchive
+
+def test_bad_timestamp_leaves_room_readable():
+    room = ColumnarArchive().room("GID-1")
+    assert room.append("P-1", "LIA-1", "Alpha", "first", 1_700_000_000_000)
+    assert room.append("P-2", "LIA-2", "Bravo", "clock", "12:00")
+    assert room.append("P-3", "LIA-2", "Bravo", "overflow", 1e30)
+
+    assert [len(room.ids), len(room.timestamps), len(room.senders), len(room.assets)] == [3, 3, 3, 3]
+    assert [p.timestamp for p in room] == [1_700_000_000_000, 0, 0]
+    assert room[-1].transmission == "overflow"
+    assert [p.id for p in room[1:]] == ["P-2", "P-3"]
@@ -1,2 +0,0 @@
-
-# UI logic consolidated into main.py
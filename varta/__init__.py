@@ -0,0 +1,23 @@
+"""VartaSphere client.
+
+Boot imports only the chat and presence core (controller, registry,
+network and their helpers). Paint, AI assist, file transfer and the
+profile dashboard are imported by the controller on first use.
+"""
+import asyncio
+
+def launch():
+    """Start the app as ``window.app``, timing every package import on the way."""
+    from .startup import StartupProfiler
+    profiler = StartupProfiler(__name__)
+    profiler.install()
+    from js import window, console
+    try: profiler.mark("python_start_ms", float(window.performance.now()))
+    except: pass
+    from .controller import SystemController
+    app = SystemController(profiler)
+    window.app = app
+    summary = profiler.booted()
+    console.log(f"[Startup] core: {summary['modules']} modules in {summary['core_import_ms']:.0f} ms (app.startup_report() for detail)")
+    asyncio.ensure_future(app.synchronize_nexus())
+    return app
@@ -0,0 +1,315 @@
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# --- [Reply Suggestion Backends] ---
+
+REPLY_MODEL = "gemini-3-flash-preview"
+
+SUMMARY_PROMPT = "Summarize this chat excerpt for a liaison catching up. Keep names, decisions, open questions. Max 4 short lines.\n\n"
+REDUCE_PROMPT = "Merge these consecutive chat summaries (oldest first) into one catch-up brief. Keep names, decisions, open questions. Max 6 short lines.\n\n"
+
+def build_reply_prompt(text: str) -> str:
+    return f"Analyze: '{text}'. Suggest 3 tactical gaming-style replies. JSON: {{\"replies\": [\"...\", \"...\", \"...\"]}}"
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+class GeminiBackend:
+    """One GoogleGenAI client for the session instead of one per request."""
+
+    def __init__(self, api_key: str, model: str = REPLY_MODEL):
+        from js import GoogleGenAI, Object
+        from pyodide.ffi import to_js
+        self._to_js = lambda d: to_js(d, dict_converter=Object.fromEntries)
+        self._client = GoogleGenAI.new(self._to_js({"apiKey": api_key}))
+        self._model = model
+
+    async def complete(self, prompt: str, json_mode: bool = True) -> str:
+        response = await self._client.models.generateContent(self._to_js({
+            "model": self._model,
+            "contents": prompt,
+            "config": {"responseMimeType": "application/json" if json_mode else "text/plain"}
+        }))
+        return response.text
+
+class StubBackend:
+    """Offline stand-in with model-like latency, for tests and benchmarks."""
+
+    def __init__(self, latency: float = 0.6, jitter: float = 0.3):
+        self._latency = latency
+        self._jitter = jitter
+        self.calls = 0
+        self.prompts: List[str] = []
+
+    async def complete(self, prompt: str, json_mode: bool = True) -> str:
+        self.calls += 1
+        self.prompts.append(prompt)
+        digest = hashlib.sha1(prompt.encode("utf-8")).digest()
+        await asyncio.sleep(self._latency + self._jitter * (digest[0] / 255.0))
+        seed = digest.hex()[:4]
+        if not json_mode:
+            # Extractive "summary": first words of the first and last body lines.
+            body = [l for l in prompt.splitlines()[2:] if l.strip()]
+            if not body: return ""
+            return f"{len(body)} items ({seed}): {body[0][:60]} … {body[-1][:60]}"
+        return json.dumps({"replies": [f"Copy that ({seed})", f"Moving now ({seed})", f"Hold position ({seed})"]})
+
+# --- [Reply Suggestion Engine] ---
+
+def normalize_message(text: str) -> str:
+    text = " ".join(str(text or "").lower().split())
+    return text.rstrip("!?.… ") or text
+
+class ReplySuggester:
+    """Cached, coalesced and debounced reply suggestions, one live request per room.
+
+    Results are cached per (normalized text, room context) with LRU eviction
+    and a TTL. Identical in-flight requests share one backend call. A newer
+    message in a room cancels that room's pending request, and results that
+    arrive after the user has moved on are cached but never published.
+    """
+
+    def __init__(self, backend, publish: Callable[[str, List[str]], None], max_entries: int = 256,
+                 ttl: float = 600.0, debounce: float = 0.35, clock=time.monotonic):
+        self._backend = backend
+        self._publish = publish
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._debounce = debounce
+        self._clock = clock
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, List[str]]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._generation: Dict[str, int] = {}
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "backend_calls": 0,
+                      "cancelled": 0, "stale": 0, "published": 0, "errors": 0}
+
+    def _cache_get(self, key) -> Optional[List[str]]:
+        hit = self._cache.get(key)
+        if hit is None: return None
+        stored, replies = hit
+        if self._clock() - stored > self._ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return replies
+
+    def _cache_put(self, key, replies: List[str]):
+        self._cache[key] = (self._clock(), replies)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    async def _fetch(self, text: str, key) -> List[str]:
+        self.stats["backend_calls"] += 1
+        try:
+            raw = await self._backend.complete(build_reply_prompt(text))
+            replies = [str(r) for r in json.loads(raw).get("replies", [])][:3]
+            self._cache_put(key, replies)
+            return replies
+        finally:
+            self._inflight.pop(key, None)
+
+    async def replies_for(self, text: str, context: str = "") -> List[str]:
+        """Cache, then an identical in-flight call, then the backend."""
+        key = (normalize_message(text), context)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(text, key))
+            self._inflight[key] = future
+        else:
+            self.stats["coalesced"] += 1
+        # Shielded so one cancelled room does not abort a call others are waiting on.
+        return await asyncio.shield(future)
+
+    def suggest(self, room: str, text: str, context: Optional[str] = None):
+        """Debounced entry point for each new message shown in ``room``."""
+        self.stats["requests"] += 1
+        generation = self._generation.get(room, 0) + 1
+        self._generation[room] = generation
+        previous = self._pending.pop(room, None)
+        if previous and not previous.done():
+            previous.cancel()
+            self.stats["cancelled"] += 1
+        self._pending[room] = asyncio.ensure_future(self._run(room, text, room if context is None else context, generation))
+
+    def withdraw(self, room: str):
+        """Drop interest in ``room`` (e.g. the user switched away)."""
+        self._generation[room] = self._generation.get(room, 0) + 1
+        task = self._pending.pop(room, None)
+        if task and not task.done():
+            task.cancel()
+            self.stats["cancelled"] += 1
+
+    async def _run(self, room, text, context, generation):
+        try:
+            if self._debounce and self._cache_get((normalize_message(text), context)) is None:
+                await asyncio.sleep(self._debounce)
+            replies = await self.replies_for(text, context)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.stats["errors"] += 1
+            return
+        if self._generation.get(room) != generation:
+            self.stats["stale"] += 1
+            return
+        if self._pending.get(room) is asyncio.current_task():
+            del self._pending[room]
+        self.stats["published"] += 1
+        self._publish(room, replies)
+
+    def hit_rate(self) -> float:
+        lookups = self.stats["cache_hits"] + self.stats["coalesced"] + self.stats["backend_calls"]
+        return (self.stats["cache_hits"] + self.stats["coalesced"]) / lookups if lookups else 0.0
+
+# --- [Catch-Up Summaries] ---
+
+class CatchUpSummarizer:
+    """Map-reduce summaries of a room backlog with per-chunk caching.
+
+    History is cut into fixed, index-aligned chunks of ``chunk_size`` pulses,
+    so a chunk's range never moves; summaries are cached per (start, end)
+    and checked against the chunk's last pulse id. ``offset`` is how many
+    pulses were put ahead of the history since the cache was started
+    (older pages loaded in); positions are counted from there. Only the growing tail
+    chunk and anything after it is sent again on the next request. Every
+    backend request stays under ``max_request_tokens``.
+    """
+
+    def __init__(self, backend, chunk_size: int = 40, max_request_tokens: int = 1500, max_line_chars: int = 280):
+        self._backend = backend
+        self._chunk_size = chunk_size
+        self._max_request_tokens = max_request_tokens
+        self._max_line_chars = max_line_chars
+        self._chunks: Dict[str, Dict[Tuple[int, int], Tuple[str, str]]] = {}
+        self._briefs: Dict[str, Tuple[Tuple[int, int, str], str]] = {}
+        self.stats = {"requests": 0, "backend_calls": 0, "chunks_summarized": 0, "chunks_cached": 0, "tokens_sent": 0}
+
+    def _line(self, pulse) -> str:
+        if pulse.asset_type == "FILE":
+            text = "[file] " + pulse.transmission.split("|", 1)[0].replace("Shared Protocol Asset: ", "")
+        else:
+            text = " ".join(pulse.transmission.split())
+        if len(text) > self._max_line_chars: text = text[:self._max_line_chars - 1] + "…"
+        return f"{pulse.origin_designation}: {text}"
+
+    def _fit(self, header: str, lines: List[str]) -> str:
+        """Keep the newest lines that fit the token budget, noting how many were dropped."""
+        budget = self._max_request_tokens - estimate_tokens(header) - 16
+        kept = []
+        for line in reversed(lines):
+            cost = estimate_tokens(line) + 1
+            if cost > budget: break
+            kept.append(line)
+            budget -= cost
+        kept.reverse()
+        dropped = len(lines) - len(kept)
+        note = [f"({dropped} earlier lines omitted)"] if dropped else []
+        return header + "\n".join(note + kept)
+
+    async def _complete(self, prompt: str) -> str:
+        self.stats["backend_calls"] += 1
+        self.stats["tokens_sent"] += estimate_tokens(prompt)
+        return (await self._backend.complete(prompt, json_mode=False)).strip()
+
+    async def _chunk_summary(self, room: str, pulses, start: int, end: int, offset: int = 0) -> str:
+        cache = self._chunks.setdefault(room, {})
+        last_id = pulses[end - 1].id
+        key = (start - offset, end - offset)
+        hit = cache.get(key)
+        if hit and hit[0] == last_id:
+            self.stats["chunks_cached"] += 1
+            return hit[1]
+        summary = await self._complete(self._fit(SUMMARY_PROMPT, [self._line(pulses[i]) for i in range(start, end)]))
+        # A finished chunk supersedes the partial tail summaries that preceded it.
+        for k in [k for k in cache if k[0] == key[0] and k[1] < key[1]]: del cache[k]
+        cache[key] = (last_id, summary)
+        self.stats["chunks_summarized"] += 1
+        return summary
+
+    async def _reduce(self, summaries: List[str]) -> str:
+        while len(summaries) > 1:
+            merged, batch = [], []
+            budget = self._max_request_tokens - estimate_tokens(REDUCE_PROMPT)
+            for text in summaries:
+                if batch and sum(estimate_tokens(t) + 1 for t in batch) + estimate_tokens(text) > budget:
+                    merged.append(batch); batch = []
+                batch.append(text)
+            merged.append(batch)
+            if len(merged) == len(summaries):
+                # Every summary alone fills the budget; pair them up so the loop still converges.
+                merged = [summaries[i:i + 2] for i in range(0, len(summaries), 2)]
+            summaries = await asyncio.gather(*(self._merge(b) for b in merged))
+        return summaries[0] if summaries else ""
+
+    async def _merge(self, batch: List[str]) -> str:
+        if len(batch) == 1: return batch[0]
+        return await self._complete(self._fit(REDUCE_PROMPT, batch))
+
+    async def summarize(self, room: str, pulses, since: int, offset: int = 0) -> str:
+        """Brief covering ``pulses[since:]`` (with the start of its chunk as context)."""
+        self.stats["requests"] += 1
+        total = len(pulses)
+        since = max(0, min(since, total))
+        if since >= total: return ""
+        stamp = (since - offset, total - offset, pulses[total - 1].id)
+        brief = self._briefs.get(room)
+        if brief and brief[0] == stamp: return brief[1]
+        size = self._chunk_size
+        ranges = [(max(0, k * size + offset), min((k + 1) * size + offset, total))
+                  for k in range((since - offset) // size, (total - 1 - offset) // size + 1)]
+        summaries = await asyncio.gather(*(self._chunk_summary(room, pulses, a, b, offset) for a, b in ranges))
+        text = await self._reduce(list(summaries))
+        self._briefs[room] = (stamp, text)
+        return text
+
+class AIService:
+    def __init__(self, publish: Callable[[str, List[str]], None] = None, backend=None):
+        if publish is None:
+            from .mesh import nexus_bus
+            publish = lambda room, replies: nexus_bus.publish("AI_SUGGESTIONS", (room, replies))
+        if backend is None:
+            from js import window
+            api_key = window.process.env.API_KEY if hasattr(window, "process") else ""
+            backend = GeminiBackend(api_key) if api_key else None
+        self.enabled = backend is not None
+        self._suggester = ReplySuggester(backend, publish) if backend else None
+        self._catchup = CatchUpSummarizer(backend) if backend else None
+
+    def suggest(self, room: str, text: str):
+        if self._suggester: self._suggester.suggest(room, text)
+
+    def withdraw(self, room: str):
+        if self._suggester: self._suggester.withdraw(room)
+
+    async def catch_up(self, room: str, pulses, since: int, offset: int = 0) -> str:
+        if not self._catchup: return ""
+        try:
+            return await self._catchup.summarize(room, pulses, since, offset)
+        except Exception as e:
+            from js import console
+            console.warn(f"[AI] Catch-up Error: {str(e)}")
+            return ""
+
+    async def generate_replies(self, text, context: str = ""):
+        if not self._suggester: return []
+        try:
+            return await self._suggester.replies_for(text, context)
+        except Exception as e:
+            from js import console
+            console.warn(f"[AI] Gemini Error: {str(e)}")
+            return []
+
+    @property
+    def stats(self) -> dict:
+        return dict(self._suggester.stats) if self._suggester else {}
@@ -0,0 +1,111 @@
+
+import asyncio
+import html
+from typing import Dict, List, Optional
+from js import console
+from .ai_service import AIService
+from .mesh import nexus_bus
+
+# --- [AI Assist] ---
+
+class AssistPanel:
+    """Reply suggestions and catch-up briefs for the active room."""
+
+    CATCHUP_MIN_UNREAD = 12
+
+    def __init__(self, app):
+        self._app = app
+        self._ai: Optional[AIService] = None
+        self._suggestions: List[str] = []
+        # Unread start per room, relative to the registry's index_base so paging in older history keeps it.
+        self._catchup_since: Dict[str, int] = {}
+        self._catchup_text: Dict[str, str] = {}
+        nexus_bus.subscribe("AI_SUGGESTIONS", self._handle_suggestions)
+
+    def switch_room(self, previous_gid, gid):
+        if self._ai: self._ai.withdraw(previous_gid)
+        self._suggestions = []
+        summary = self._app._registry.room_summary(gid)
+        room = self._app._registry._archives.get(gid)
+        if room and summary.unread:
+            self._catchup_since[gid] = max(0, len(room) - summary.unread) - self._app._registry.index_base(gid)
+            self._catchup_text.pop(gid, None)
+        self._app._ui.mark("suggestions", "catchup")
+
+    def _ai_service(self) -> Optional[AIService]:
+        if self._ai is None:
+            try:
+                self._ai = AIService(publish=lambda room, replies: nexus_bus.publish("AI_SUGGESTIONS", (room, replies)))
+            except Exception as e:
+                console.warn(f"[AI] Suggestions unavailable: {str(e)}")
+                self._ai = False
+        return self._ai or None
+
+    def _request_reply_suggestions(self, pulse):
+        if pulse.protocol_code != self._app._active_gid: return
+        ai = self._ai_service()
+        if not ai or not ai.enabled: return
+        if pulse.origin_uid == self._app._signature.uid:
+            ai.withdraw(pulse.protocol_code)
+            self._handle_suggestions((pulse.protocol_code, []))
+        elif pulse.asset_type == "TEXT" and any(ch.isalnum() for ch in pulse.transmission):
+            ai.suggest(pulse.protocol_code, pulse.transmission)
+
+    def _handle_suggestions(self, data):
+        room, replies = data
+        if room != self._app._active_gid: return
+        self._suggestions = list(replies)
+        self._app._ui.mark("suggestions")
+
+    def _render_suggestions(self):
+        cont = self._app._get_safe_element("pip-suggestions")
+        if not cont: return
+        if not self._suggestions:
+            cont.classList.add("hidden")
+            cont.innerHTML = ""
+            return
+        cont.classList.remove("hidden")
+        cont.innerHTML = "".join(f"""<button onclick="app.use_suggestion({i})" class="px-3 py-1 rounded-full bg-blue-50 border border-blue-100 text-[10px] font-bold text-blue-700 hover:bg-blue-100 truncate max-w-full">{html.escape(text)}</button>""" for i, text in enumerate(self._suggestions))
+
+    def _render_catchup(self):
+        cont = self._app._get_safe_element("pip-catchup")
+        if not cont: return
+        gid = self._app._active_gid
+        room = self._app._registry._archives.get(gid) if self._app._registry and gid else None
+        since = self._catchup_since.get(gid)
+        if since is not None: since += self._app._registry.index_base(gid)
+        ai = self._ai_service() if since is not None else None
+        if not room or since is None or not ai or not ai.enabled or len(room) - since < self.CATCHUP_MIN_UNREAD:
+            cont.classList.add("hidden")
+            return
+        cont.classList.remove("hidden")
+        brief = self._catchup_text.get(gid)
+        if brief is None:
+            cont.innerHTML = f"""<button onclick="app.request_catch_up()" class="w-full py-2 rounded-xl bg-blue-50 border border-blue-100 text-[10px] font-black uppercase tracking-widest text-blue-700 hover:bg-blue-100">Catch Up · {len(room) - since} unread</button>"""
+        else:
+            body = html.escape(brief).replace("\n", "<br>") if brief else "Summarizing backlog…"
+            cont.innerHTML = f"""<div class="p-3 rounded-xl bg-blue-50 border border-blue-100 text-[11px] text-blue-900 leading-relaxed"><p class="text-[8px] font-black uppercase tracking-widest text-blue-500 mb-1">Catch-Up Brief</p>{body}</div>"""
+
+    def request_catch_up(self):
+        gid = self._app._active_gid
+        ai = self._ai_service()
+        if not gid or not ai or gid not in self._catchup_since: return
+        self._catchup_text[gid] = ""
+        self._app._ui.mark("catchup")
+        async def run():
+            room = self._app._registry._archives.get(gid, [])
+            base = self._app._registry.index_base(gid)
+            brief = await ai.catch_up(gid, room, self._catchup_since[gid] + base, offset=base)
+            self._catchup_text[gid] = brief or "No summary available."
+            if gid == self._app._active_gid: self._app._ui.mark("catchup")
+        asyncio.ensure_future(run())
+
+    def use_suggestion(self, index):
+        if not 0 <= index < len(self._suggestions): return
+        inp = self._app._get_safe_element("transmission-payload")
+        if inp:
+            inp.value = self._suggestions[index]
+            self._app.dispatch_strategic_pulse()
+
+def attach(app):
+    return AssistPanel(app)
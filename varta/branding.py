@@ -0,0 +1,23 @@
+
+# --- [Branding & Visuals] ---
+
+def get_varta_logo_svg(size="w-12 h-12"):
+    return f"""
+    <div class="flex items-center space-x-4">
+        <div class="radar-container">
+            <div class="radar-wave"></div>
+            <div class="radar-wave"></div>
+            <div class="radar-wave"></div>
+        </div>
+        <svg class="{size}" viewBox="0 0 100 100" fill="none" xmlns="http://www.w3.org/2000/svg">
+            <defs>
+                <linearGradient id="logoGrad" x1="0%" y1="0%" x2="100%" y2="100%">
+                    <stop offset="0%" style="stop-color:#3b82f6;stop-opacity:1" />
+                    <stop offset="100%" style="stop-color:#1e40af;stop-opacity:1" />
+                </linearGradient>
+            </defs>
+            <path d="M50 5L10 25V75L50 95L90 75V25L50 5Z" fill="url(#logoGrad)" />
+            <path d="M35 40L50 60L65 40" stroke="white" stroke-width="8" stroke-linecap="round" stroke-linejoin="round" />
+        </svg>
+    </div>
+    """
@@ -0,0 +1,705 @@
+
+import asyncio
+import importlib
+import json
+import random
+import time
+from dataclasses import asdict
+from typing import Dict, Callable, Any, Optional
+from js import window, document, localStorage, console
+from pyodide.ffi import to_js, create_proxy
+from .branding import get_varta_logo_svg
+from .mesh import nexus_bus
+from .models import LiaisonSignature, CommunicationProtocol
+from .network import LiaisonNetwork
+from .pop_engine import PopEngine
+from .reactions import ROOM_TARGET, ReactionBatcher, parse_counts, reaction_payload
+from .registry import PulseRegistry, shared_with_tabs
+from .render_scheduler import RenderScheduler
+from .startup import StartupProfiler, resource_timings
+from .storage import PulseStore, open_store
+from .tab_coordinator import TabCoordinator
+
+# --- [System Controller] ---
+
+# Imported on first use rather than at boot; each module exposes ``attach(app)``.
+LAZY_FEATURES = ("paint", "assist", "files", "dashboard")
+
+class SystemController:
+    def __init__(self, startup: Optional[StartupProfiler] = None):
+        self._startup = startup
+        self._features: Dict[str, Any] = {}
+        self._signature: Optional[LiaisonSignature] = None
+        self._protocols: Dict[str, CommunicationProtocol] = {}
+        self._active_gid: Optional[str] = None
+        self._active_nav: str = "nexus"
+        self._sidebar_expanded: bool = True
+        self._discovered_nodes: Dict[str, LiaisonSignature] = {}
+        self._network = LiaisonNetwork()
+        self._store: Optional[PulseStore] = None
+        self._registry: Optional[PulseRegistry] = None
+        self._tabs: Optional[TabCoordinator] = None
+        self._paint_active = False
+        self._pops = PopEngine(document)
+        self._reaction_batches = ReactionBatcher(self._send_reactions)
+        self._frame_proxies: Dict[Callable, Any] = {}
+        self._ui = RenderScheduler(self._schedule_frame, lambda name, e: console.error(f"Render Error: {name} - {str(e)}"))
+        for name, renderer in [
+            ("header", self._render_nexus_header), ("navigation", self._render_navigation),
+            ("directory", self._render_directory), ("viewport", self._render_viewport),
+            ("canvas", self._when_loaded("paint", "_resize_canvas")), ("landing", self._render_nexus_landing),
+            ("dashboard", lambda: self._feature("dashboard").render()), ("stream", self._render_pulse_stream),
+            ("footer", self._render_footer_status), ("suggestions", self._when_loaded("assist", "_render_suggestions")),
+            ("catchup", self._when_loaded("assist", "_render_catchup")), ("reactions", self._render_reactions),
+        ]:
+            self._ui.register(name, renderer)
+
+    def _get_safe_element(self, element_id: str):
+        return document.getElementById(element_id)
+
+    def _feature(self, name):
+        feature = self._features.get(name)
+        if feature is None:
+            module = importlib.import_module(f".{name}", __package__)
+            feature = self._features[name] = module.attach(self)
+        return feature
+
+    def _when_loaded(self, name, method):
+        """Renderer for a lazy feature: a no-op until something has imported it."""
+        def render():
+            feature = self._features.get(name)
+            if feature: getattr(feature, method)()
+        return render
+
+    def _assist(self):
+        # The AI module is never imported when no Gemini key is configured.
+        try: configured = bool(window.process.env.API_KEY)
+        except: configured = False
+        return self._feature("assist") if configured else None
+
+    def _schedule_frame(self, callback):
+        # One long-lived proxy per callback instead of a fresh one every frame.
+        proxy = self._frame_proxies.get(callback)
+        if proxy is None:
+            proxy = create_proxy(callback)
+            self._frame_proxies[callback] = proxy
+        window.requestAnimationFrame(proxy)
+
+    async def synchronize_nexus(self):
+        boot_cont = self._get_safe_element("boot-logo-container")
+        if boot_cont: boot_cont.innerHTML = get_varta_logo_svg("w-24 h-24")
+        await asyncio.sleep(0.8)
+        cached = localStorage.getItem("varta_liaison_signature")
+        if cached:
+            try:
+                self._signature = LiaisonSignature(**json.loads(cached))
+                await self._authorize_access()
+            except:
+                self._request_onboarding()
+        else:
+            self._request_onboarding()
+
+    def _request_onboarding(self):
+        self._get_safe_element("boot-screen").classList.add("hidden")
+        onboarding = self._get_safe_element("liaison-onboarding")
+        if onboarding:
+            onboarding.classList.remove("hidden")
+            onboarding.innerHTML = f"""
+            <div class="max-w-md w-full glass-panel rounded-[4rem] p-16 text-center shadow-2xl animate-interface">
+                <div class="flex justify-center mb-10">{get_varta_logo_svg("w-20 h-20")}</div>
+                <h1 class="text-4xl font-bold branding-font text-blue-800 mb-8 uppercase">VartaSphere</h1>
+                <input id="designation-input" type="text" placeholder="Identity Name..." class="w-full bg-slate-50 border rounded-2xl px-8 py-5 text-center text-slate-800 outline-none mb-10 transition-all font-bold focus:border-blue-500 shadow-sm">
+                <button onclick="app.submit_onboarding()" class="w-full py-6 bg-blue-600 text-white rounded-[2.5rem] font-bold uppercase tracking-widest text-[11px] active:scale-95 shadow-lg">Enter Nexus</button>
+            </div>
+            """
+
+    def submit_onboarding(self):
+        inp = self._get_safe_element("designation-input")
+        if not inp or not inp.value.strip(): return
+        uid = f"LIA-{random.randint(100000, 999999)}"
+        self._signature = LiaisonSignature(uid=uid, designation=inp.value.strip(), avatar_proxy=f"https://api.dicebear.com/7.x/initials/svg?seed={inp.value.strip()}")
+        localStorage.setItem("varta_liaison_signature", json.dumps(asdict(self._signature)))
+        asyncio.ensure_future(self._authorize_access())
+
+    async def _authorize_access(self):
+        self._get_safe_element("boot-screen").classList.add("hidden")
+        self._get_safe_element("liaison-onboarding").classList.add("hidden")
+        shell = self._get_safe_element("app-shell")
+        if shell:
+            shell.classList.remove("hidden")
+            shell.classList.add("opacity-100")
+        
+        self._store = await open_store(window, localStorage, self._signature.uid, console.log)
+        await self._load_protocols()
+        self._registry = PulseRegistry(self._network, self._store, self._signature.uid, self._signature.designation)
+        await self._registry.load()
+        # IndexedDB commits are async: start them when the tab is hidden, while the page is still alive.
+        document.addEventListener("visibilitychange", create_proxy(lambda e: document.visibilityState == "hidden" and self._store.flush_now()))
+        window.addEventListener("pagehide", create_proxy(lambda e: self._store.flush_now()))
+        self._init_tab_coordination()
+        
+        nexus_bus.subscribe("PULSE_ARCHIVED", lambda p: self._ui.mark("directory", "stream") if p.protocol_code == self._active_gid else self._ui.mark("directory"))
+        nexus_bus.subscribe("SYNC_ESTABLISHED", lambda _: self._ui.mark("footer"))
+        nexus_bus.subscribe("LINK_STATS", lambda _: self._ui.mark("footer"))
+        nexus_bus.subscribe("PULSE_ARCHIVED", self._request_reply_suggestions)
+        nexus_bus.subscribe("PULSES_ARCHIVED", self._handle_archived_range)
+        nexus_bus.subscribe("REMOTE_SIGNAL", self._handle_signaling)
+        nexus_bus.subscribe("REMOTE_BOARD_PULSE", self._handle_remote_draw)
+        nexus_bus.subscribe("REMOTE_MOUSE_PULSE", self._handle_remote_mouse)
+        nexus_bus.subscribe("BOARD_HISTORY", self._handle_board_history)
+        nexus_bus.subscribe("REMOTE_POP_PULSE", self._handle_remote_pop)
+        nexus_bus.subscribe("REMOTE_REACTION_PULSE", self._handle_remote_reaction)
+        
+        self._refresh_ui()
+        # Start the autonomous background beaconing
+        asyncio.ensure_future(self._start_discovery_beacon())
+
+    def _init_tab_coordination(self):
+        """Share one socket per liaison across tabs; standalone when BroadcastChannel is missing."""
+        if not hasattr(window, "BroadcastChannel"):
+            asyncio.ensure_future(self._network.establish_synchronization())
+            return
+        channel = window.BroadcastChannel.new(f"varta_tabs_{self._signature.uid}")
+        self._tabs = TabCoordinator(self._signature.uid, localStorage, channel, self._handle_tab_role, self._handle_tab_message)
+        self._network._relay = self._tabs
+        channel.onmessage = create_proxy(lambda e: self._tabs.receive(e.data))
+        window.addEventListener("pagehide", create_proxy(lambda e: self._tabs.resign()))
+        asyncio.ensure_future(self._tabs.run())
+
+    def _handle_tab_role(self, leader):
+        if leader:
+            asyncio.ensure_future(self._registry.take_over_persistence())
+            self._save_protocols()
+            self._network.focus_room(self._active_gid)
+            asyncio.ensure_future(self._network.establish_synchronization())
+        else:
+            self._registry.release_persistence()
+            self._network.release()
+            self._network.focus_room(self._active_gid)
+        self._ui.mark("footer")
+
+    def _handle_tab_message(self, kind, body, origin_tab):
+        if kind == "signal" and not self._tabs.is_leader:
+            nexus_bus.publish("REMOTE_SIGNAL", body.get("data"))
+        elif kind == "signal_batch" and not self._tabs.is_leader:
+            nexus_bus.publish("REMOTE_SIGNAL_BATCH", body.get("data") or [])
+        elif kind == "emit" and self._tabs.is_leader:
+            signal, payload = body.get("signal"), body.get("payload")
+            # Relayed on to the other followers by transmit_protocol; the leader archives it here.
+            self._network.transmit_protocol(signal, payload, origin_tab=origin_tab)
+            if signal == "send_message" and shared_with_tabs(payload):
+                nexus_bus.publish("REMOTE_SIGNAL", payload)
+        elif kind == "protocols":
+            if self._merge_protocols(body) and self._tabs.is_leader:
+                self._save_protocols()
+        elif kind == "leader":
+            # A new leader starts with no subscriptions; tell it which room this tab shows.
+            if not self._tabs.is_leader: self._network.focus_room(self._active_gid)
+            self._ui.mark("footer")
+        elif kind == "focus" and self._tabs.is_leader:
+            self._network.focus_room(body.get("gid"), owner=origin_tab)
+        elif kind == "board_history" and not self._tabs.is_leader:
+            self._network._publish_board_history(body)
+        elif kind == "link" and not self._tabs.is_leader:
+            self._network._link.apply_snapshot(body)
+            self._ui.mark("footer")
+
+    async def _start_discovery_beacon(self):
+        """Autonomous signal emission to ripple through the nexus pond."""
+        while True:
+            if self._network.owns_persistence() and self._network._socket and self._network._socket.connected:
+                payload = {
+                    "type": "BEACON",
+                    "identity": asdict(self._signature),
+                    "timestamp": time.time()
+                }
+                self._network.transmit_protocol("send_message", {
+                    "roomId": "varta_global_signaling",
+                    "senderId": self._signature.uid,
+                    "senderName": self._signature.designation,
+                    "content": json.dumps(payload),
+                    "timestamp": int(time.time()*1000)
+                })
+            await asyncio.sleep(5.0)
+
+    def _handle_signaling(self, data):
+        if not isinstance(data, dict): return
+        rid = data.get("roomId")
+        if rid != "varta_global_signaling": return
+        try:
+            payload = json.loads(data.get("content"))
+            msg_type = payload.get("type")
+            sender_id = data.get("senderId")
+            
+            if msg_type == "BEACON" and sender_id != self._signature.uid:
+                id_data = payload.get("identity")
+                # Store discovered nodes for quick access
+                node = LiaisonSignature(**id_data)
+                node.last_seen = time.time()
+                self._discovered_nodes[sender_id] = node
+                self._ui.mark("directory")
+        except: pass
+
+    def toggle_sidebar(self):
+        self._sidebar_expanded = not self._sidebar_expanded
+        self._ui.mark("directory", "canvas")
+
+    def _refresh_ui(self):
+        self._ui.mark("header", "navigation", "directory", "viewport", "footer")
+
+    def start_trace(self, redact=True):
+        """Record incoming signals for offline replay (benchmarks/replay_trace.py)."""
+        self._network._recorder.start(redact=bool(redact))
+        console.log(f"Signal trace recording (redacted={bool(redact)})")
+
+    def stop_trace(self):
+        recorder = self._network._recorder
+        if not recorder.active: return
+        count = len(recorder)
+        blob = window.Blob.new([recorder.stop()], to_js({"type": "application/x-ndjson"}, dict_converter=window.Object.fromEntries))
+        link = document.createElement("a")
+        link.href = window.URL.createObjectURL(blob)
+        link.download = f"varta_trace_{int(time.time())}.jsonl"
+        link.click()
+        window.URL.revokeObjectURL(link.href)
+        console.log(f"Signal trace saved: {count} signals")
+
+    def link_stats(self):
+        """Smoothed RTT, transport and current send rates, for the dev console: app.link_stats()."""
+        stats = self._network.link_stats()
+        console.table(to_js(stats, dict_converter=window.Object.fromEntries))
+        return stats
+
+    def startup_report(self):
+        """Fetch, compile and import time per module, for the dev console: app.startup_report()."""
+        rows = self._startup.report(resource_timings(window)) if self._startup else []
+        console.table(to_js(rows, dict_converter=window.Object.fromEntries))
+        return rows
+
+    def storage_stats(self):
+        """Active storage backend and write-behind counters, for the dev console: app.storage_stats()."""
+        stats = {"backend": self._store.name, **self._store.stats} if self._store else {}
+        console.table(to_js(stats, dict_converter=window.Object.fromEntries))
+        return stats
+
+    def render_report(self):
+        """Per-component render counts and timings, for the dev console: app.render_report()."""
+        stats = self._ui.stats()
+        console.table(to_js(stats, dict_converter=window.Object.fromEntries))
+        return stats
+
+    def _render_footer_status(self):
+        f_info = self._get_safe_element("footer-status-info")
+        if f_info:
+            link = self._network.link_stats()
+            status = "STABLE" if self._network.is_linked() else "OFFLINE"
+            if status == "STABLE" and link["level"] in ["fair", "poor"]: status = "DEGRADED"
+            dot = {"STABLE": "bg-green-500", "DEGRADED": "bg-amber-500", "OFFLINE": "bg-red-500"}[status]
+            detail = f"<span>{int(link['rtt_ms'])}MS</span>" if link["rtt_ms"] is not None and status != "OFFLINE" else ""
+            if link["transport"] and status != "OFFLINE": detail += f"<span>{link['transport'].upper()}</span>"
+            f_info.innerHTML = f"<span>NEXUS SYNC V45.0</span><div class='flex items-center space-x-2'><span class='status-dot {dot}'></span><span>{status}</span>{detail}</div>"
+
+    def _render_nexus_header(self):
+        container = self._get_safe_element("navbar-container")
+        if container:
+            container.innerHTML = f"""<div class="flex items-center space-x-6">{get_varta_logo_svg("w-9 h-9")}<span class="branding-font font-bold text-lg tracking-[0.25em] text-blue-800">VARTASPHERE</span></div>"""
+
+    def _render_navigation(self):
+        top_cont = self._get_safe_element("nav-top")
+        bottom_cont = self._get_safe_element("nav-bottom")
+        if not top_cont or not bottom_cont: return
+        
+        top_ops = [
+            ("chat", "Chat", "M8 10h.01M12 10h.01M16 10h.01M9 16H5a2 2 0 01-2-2V6a2 2 0 012-2h14a2 2 0 012 2v8a2 2 0 01-2 2h-5l-5 5v-5z"),
+            ("groupe", "Group", "M17 20h5v-2a3 3 0 00-5.356-1.857M17 20H7m10 0v-2c0-.656-.126-1.283-.356-1.857M7 20H2v-2a3 3 0 015.356-1.857M7 20v-2c0-.656.126-1.283.356-1.857m0 0a5.002 5.002 0 019.288 0M15 7a3 3 0 11-6 0 3 3 0 016 0zm6 3a2 2 0 11-4 0 2 2 0 014 0zM7 10a2 2 0 11-4 0 2 2 0 014 0z"),
+            ("paint", "Paint", "M15.232 5.232l3.536 3.536m-2.036-5.036a2.5 2.5 0 113.536 3.536L6.5 21.036H3v-3.572L16.732 3.732z")
+        ]
+        bottom_ops = [
+            ("profil", "Profile", "M16 7a4 4 0 11-8 0 4 4 0 018 0zM12 14a7 7 0 00-7 7h14a7 7 0 00-7-7z")
+        ]
+        
+        def gen_html(ops):
+            html = ""
+            for id, label, path in ops:
+                active = ""
+                if id == "paint": active = "active" if self._paint_active else ""
+                else: active = "active" if self._active_nav == id else ""
+                
+                html += f"""<div onclick="app.handle_nav('{id}')" class="nav-anchor {active}"><svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="{path}"></path></svg><span class="text-[8px] mt-2 font-bold uppercase tracking-widest">{label}</span></div>"""
+            return html
+            
+        top_cont.innerHTML = gen_html(top_ops)
+        bottom_cont.innerHTML = gen_html(bottom_ops)
+
+    def _render_directory(self):
+        cont = self._get_safe_element("sidebar-container")
+        if not cont: return
+        if self._sidebar_expanded: cont.classList.remove("collapsed")
+        else: cont.classList.add("collapsed")
+        
+        filter_type = "ASSEMBLY" if self._active_nav == "groupe" else "P2P"
+        links = [l for l in self._protocols.values() if l.classification == filter_type]
+        if self._registry:
+            order = self._registry.order_by_activity([l.gid for l in links])
+            links = [self._protocols[gid] for gid in order]
+        title = "P2P HUB" if filter_type == "P2P" else "ASSEMBLIES"
+        
+        # Add discovered "Beaconing" nodes to the Chat list
+        discovered_html = ""
+        if filter_type == "P2P":
+            # Filter nodes seen in the last 20 seconds
+            active_nodes = [n for n in self._discovered_nodes.values() if time.time() - n.last_seen < 20]
+            if active_nodes:
+                discovered_html = '<p class="text-[9px] font-black uppercase text-blue-600 mt-6 mb-2 tracking-widest">Available Nodes (Live)</p>'
+                for node in active_nodes:
+                    # Don't show if already in protocols
+                    if not any(protocol.gid.startswith(f"P2P-") and node.uid in protocol.participants for protocol in self._protocols.values()):
+                        discovered_html += f"""
+                        <div onclick="app.quick_handshake('{node.uid}')" class="w-full flex items-center p-4 rounded-2xl border border-blue-100 bg-blue-50/50 cursor-pointer hover:bg-blue-100 transition-all mb-2 animate-pulse">
+                            <div class="w-10 h-10 rounded-xl bg-blue-600 text-white flex items-center justify-center font-black text-lg">{node.designation[0].upper()}</div>
+                            <div class="ml-4 overflow-hidden">
+                                <p class="text-[12px] font-extrabold truncate uppercase">{node.designation}</p>
+                                <p class="text-[8px] text-blue-400 font-mono">NEURAL BEACON ACTIVE</p>
+                            </div>
+                        </div>"""
+
+        cont.innerHTML = f"""
+        <div class="h-full flex flex-col w-[320px]">
+            <div class="p-8 border-b flex justify-between items-center bg-slate-50 flex-shrink-0">
+                <h2 class="text-[10px] font-bold branding-font uppercase tracking-widest text-blue-900">{title}</h2>
+                <div class="flex items-center space-x-2">
+                    <button onclick='app.open_protocol_init()' class='w-8 h-8 flex items-center justify-center bg-blue-600 text-white rounded-xl shadow-lg'>
+                        <svg class='w-4 h-4' fill='none' stroke='currentColor' viewBox='0 0 24 24'><path stroke-linecap='round' stroke-linejoin='round' stroke-width='2' d='M12 4v16m8-8H4'></path></svg>
+                    </button>
+                    <button onclick='app.toggle_sidebar()' class='p-2 hover:bg-slate-200 rounded-lg text-slate-400'>
+                        <svg class='w-4 h-4' fill='none' stroke='currentColor' viewBox='0 0 24 24'><path stroke-linecap='round' stroke-linejoin='round' stroke-width='2' d='M6 18L18 6M6 6l12 12'></path></svg>
+                    </button>
+                </div>
+            </div>
+            <div class="flex-grow overflow-y-auto p-6 space-y-3 custom-scrollbar">
+                {discovered_html}
+                <p class="text-[9px] font-black uppercase text-slate-400 mt-6 mb-2 tracking-widest">Saved Protocols</p>
+                {"".join([self._get_protocol_card(l) for l in links]) if links else f'<div class="text-center py-20 text-slate-300 font-bold uppercase text-[9px] tracking-widest">Protocol Search Active</div>'}
+            </div>
+        </div>"""
+
+    def quick_handshake(self, uid):
+        """Instantly initialize a link with a beaconing node."""
+        gid = f"P2P-{sorted([self._signature.uid, uid])[0][-4:]}-{sorted([self._signature.uid, uid])[1][-4:]}"
+        node = self._discovered_nodes.get(uid)
+        link = CommunicationProtocol(gid=gid, nomenclature=node.designation if node else f"Node {uid[-4:]}", classification="P2P", participants=[self._signature.uid, uid])
+        self._protocols[gid] = link
+        self._save_protocols()
+        self._network.transmit_protocol("join_room", {"id": gid})
+        self.activate_protocol(gid)
+
+    def _get_protocol_card(self, protocol):
+        is_active = protocol.gid == self._active_gid
+        active = "bg-blue-600 text-white shadow-xl scale-105" if is_active else "bg-white border-transparent hover:border-slate-200 hover:bg-slate-50 text-slate-700"
+        sub_text = "text-blue-200" if is_active else "text-slate-400"
+        summary = self._registry.room_summary(protocol.gid) if self._registry else None
+        
+        detail = protocol.gid
+        badge = ""
+        if summary and summary.last_preview:
+            detail = f"{summary.last_sender}: {summary.last_preview}" if summary.last_sender else summary.last_preview
+        if summary and summary.unread and not is_active:
+            tone = "bg-red-500" if summary.mention else "bg-blue-600"
+            count = "99+" if summary.unread > 99 else summary.unread
+            badge = f"""<span class="ml-auto flex-shrink-0 min-w-[1.25rem] h-5 px-1.5 rounded-full {tone} text-white text-[9px] font-black flex items-center justify-center">{'@' if summary.mention else ''}{count}</span>"""
+        
+        return f"""
+        <div onclick="app.activate_protocol('{protocol.gid}')" title="{protocol.gid}" class="w-full flex items-center p-4 rounded-2xl border cursor-pointer transition-all {active}">
+            <div class="w-10 h-10 flex-shrink-0 rounded-xl bg-white/20 flex items-center justify-center font-black text-lg border border-white/20">{protocol.nomenclature[0].upper()}</div>
+            <div class="ml-4 overflow-hidden">
+                <p class="text-[12px] font-extrabold truncate uppercase tracking-tight">{protocol.nomenclature}</p>
+                <p class="text-[8px] {sub_text} font-mono truncate">{detail}</p>
+            </div>
+            {badge}
+        </div>"""
+
+    def _render_viewport(self):
+        for vid in ["board", "nexus", "signature", "toolkit"]:
+            el = self._get_safe_element(f"view-{vid}")
+            if el: el.classList.add("hidden")
+        
+        target = "nexus"
+        if self._active_nav in ["chat", "groupe", "paint"]:
+            target = "board" if self._active_gid else "nexus"
+        elif self._active_nav == "profil": target = "signature"
+        
+        v = self._get_safe_element(f"view-{target}")
+        if v: v.classList.remove("hidden")
+        
+        # Restore Active Pulse indicator
+        pulse_ind = self._get_safe_element("pulse-status-indicator")
+        if pulse_ind:
+            pulse_ind.style.display = "flex" if self._active_gid else "none"
+
+        if target == "board": self._ui.mark("canvas")
+        if target == "nexus": self._ui.mark("landing")
+        if target == "signature": self._ui.mark("dashboard")
+
+        f_normal = self._get_safe_element("footer-normal-mode")
+        f_paint = self._get_safe_element("footer-paint-tools")
+        if self._paint_active:
+            if f_normal: f_normal.classList.add("hidden")
+            if f_paint: f_paint.classList.remove("hidden")
+        else:
+            if f_normal: f_normal.classList.remove("hidden")
+            if f_paint: f_paint.classList.add("hidden")
+
+        pip = self._get_safe_element("pip-chat-window")
+        if pip:
+            if self._active_gid:
+                pip.style.display = "flex"
+                label = self._get_safe_element("pip-mode-label")
+                protocol = self._protocols.get(self._active_gid)
+                if label and protocol: label.innerText = f"PULSE: {protocol.nomenclature}"
+                self._ui.mark("stream")
+            else:
+                pip.style.display = "none"
+
+    def handle_nav(self, nav_id):
+        if nav_id == "paint":
+            self._paint_active = not self._paint_active
+        else:
+            if self._active_nav == nav_id:
+                self._sidebar_expanded = not self._sidebar_expanded
+            else:
+                self._active_nav = nav_id
+                self._sidebar_expanded = True
+            
+        self._ui.mark("navigation", "directory", "viewport")
+
+    def _handle_remote_pop(self, data_tuple):
+        rid, payload = data_tuple
+        if rid != self._active_gid: return
+        self._spawn_pop_visual(payload.get("text"), payload.get("name"))
+
+    def _spawn_pop_visual(self, content, author):
+        self._pops.emit(content, author)
+
+    def react(self, emoji, target=ROOM_TARGET):
+        """Count a reaction locally now; peers get it in the next batched REACTION_PULSE."""
+        if not self._active_gid: return False
+        self._registry.record_reactions(self._active_gid, [[target, emoji, 1]], persist=False)
+        self._reaction_batches.add(self._active_gid, target, emoji)
+        self._spawn_pop_visual(emoji, "ME")
+        self._ui.mark("reactions" if target == ROOM_TARGET else "stream")
+        return True
+
+    def _send_reactions(self, gid, counts):
+        self._registry.dispatch_pulse(self._signature, gid, json.dumps(reaction_payload(counts)))
+        self._registry._save_reactions()
+
+    def _handle_remote_reaction(self, data_tuple):
+        rid, payload = data_tuple
+        counts = parse_counts(payload)
+        if not counts: return
+        self._registry.record_reactions(rid, counts)
+        if rid != self._active_gid: return
+        for target, emoji, n in counts: self._pops.emit(emoji, "", n)
+        self._ui.mark(*{"reactions" if target == ROOM_TARGET else "stream" for target, _, _ in counts})
+
+    def _render_reactions(self):
+        cont = self._get_safe_element("pip-reactions")
+        if not cont: return
+        top = self._registry.reactions(self._active_gid, ROOM_TARGET) if self._registry and self._active_gid else []
+        if not top:
+            cont.classList.add("hidden")
+            return
+        cont.classList.remove("hidden")
+        cont.innerHTML = "".join(f"""<button onclick="app.send_global_emoji('{emoji}')" class="px-2 py-0.5 rounded-full bg-white border text-[11px] font-bold text-slate-600 hover:border-blue-300">{emoji} {n}</button>""" for emoji, n in top)
+
+    def send_global_emoji(self, emoji):
+        if not self.react(emoji):
+            console.warn("Nexus Alert: No active protocol for reaction transmission.")
+
+    def _handle_archived_range(self, archived):
+        gid, start, end = archived
+        self._ui.mark("directory")
+        if gid != self._active_gid: return
+        self._ui.mark("stream")
+        self._request_reply_suggestions(self._registry._archives[gid][end - 1])
+
+    def _request_reply_suggestions(self, pulse):
+        if pulse.protocol_code != self._active_gid: return
+        assist = self._assist()
+        if assist: assist._request_reply_suggestions(pulse)
+
+    def request_catch_up(self):
+        assist = self._features.get("assist")
+        if assist: assist.request_catch_up()
+
+    def use_suggestion(self, index):
+        assist = self._features.get("assist")
+        if assist: assist.use_suggestion(index)
+
+    def _handle_remote_draw(self, data_tuple): self._feature("paint")._handle_remote_draw(data_tuple)
+    def _handle_remote_mouse(self, data_tuple): self._feature("paint")._handle_remote_mouse(data_tuple)
+    def _handle_board_history(self, data_tuple): self._feature("paint")._handle_board_history(data_tuple)
+    def set_paint_tool(self, tool): self._feature("paint").set_paint_tool(tool)
+    def trigger_clear_board(self): self._feature("paint").trigger_clear_board()
+    def handle_file_select(self, event, context): self._feature("files").handle_file_select(event, context)
+
+    def dispatch_strategic_pulse(self):
+        inp = self._get_safe_element("transmission-payload")
+        if inp.value.strip():
+            msg = inp.value.strip()
+            self._registry.dispatch_pulse(self._signature, self._active_gid, msg)
+            self._spawn_pop_visual(msg, "ME")
+            inp.value = ""
+
+    def activate_protocol(self, gid):
+        if gid != self._active_gid:
+            self._feature("paint").switch_room(self._active_gid)
+            self._network.focus_room(gid)
+            assist = self._assist()
+            if assist: assist.switch_room(self._active_gid, gid)
+        self._active_gid = gid
+        self._registry.mark_active(gid)
+        self._sidebar_expanded = False
+        self._ui.mark("directory", "viewport", "reactions")
+
+    def open_protocol_init(self):
+        modal = self._get_safe_element("modal-container")
+        if not modal: return
+        modal.classList.remove("hidden")
+        
+        # Strictly separated Modal content logic
+        if self._active_nav == "groupe":
+            modal_content = f"""
+            <h3 class="text-xl font-bold branding-font text-center mb-10 uppercase text-blue-800">Assembly Link</h3>
+            <div class="space-y-10">
+                <div class="space-y-4">
+                    <p class="text-[10px] font-bold uppercase text-slate-400 pl-4 tracking-widest">Create Assembly</p>
+                    <input id="assembly-name-input" type="text" placeholder="Assembly Designation..." class="w-full bg-slate-50 border rounded-2xl px-6 py-4 outline-none focus:border-blue-400 font-bold shadow-sm">
+                    <button onclick="app.finalize_group()" class="w-full py-4 bg-blue-600 text-white rounded-2xl font-black uppercase text-[10px] tracking-widest hover:bg-blue-700 transition-colors">Initialize Assembly</button>
+                </div>
+                <div class="relative py-2"><div class="absolute inset-0 flex items-center"><div class="w-full border-t border-slate-100"></div></div><div class="relative flex justify-center"><span class="px-4 bg-white text-slate-300 font-bold text-[9px]">OR SYNCHRONIZE GID</span></div></div>
+                <div class="space-y-4">
+                    <p class="text-[10px] font-bold uppercase text-slate-400 pl-4 tracking-widest">Join GID</p>
+                    <input id="assembly-join-input" type="text" placeholder="GID Protocol..." class="w-full bg-slate-50 border rounded-2xl px-6 py-4 outline-none focus:border-blue-400 font-mono font-bold uppercase shadow-sm">
+                    <button onclick="app.join_assembly()" class="w-full py-4 bg-slate-800 text-white rounded-2xl font-black uppercase text-[10px] tracking-widest hover:bg-black transition-colors">Synchronize GID</button>
+                </div>
+            </div>
+            """
+        else: # Chat Hub (P2P) Handshake
+            modal_content = f"""
+            <h3 class="text-xl font-bold branding-font text-center mb-10 uppercase text-blue-800">Liaison Handshake</h3>
+            <div class="space-y-10">
+                <div class="space-y-4">
+                    <p class="text-[10px] font-bold uppercase text-slate-400 pl-4 tracking-widest">Neural Link Connection</p>
+                    <input id="p2p-uid-input" type="text" placeholder="LIA-XXXXXX UID..." class="w-full bg-slate-50 border rounded-2xl px-6 py-4 outline-none focus:border-blue-400 font-mono font-bold uppercase shadow-sm">
+                    <button onclick="app.finalize_p2p()" class="w-full py-4 bg-blue-600 text-white rounded-2xl font-black uppercase text-[10px] tracking-widest hover:bg-blue-700 transition-colors">Establish Neural Link</button>
+                </div>
+                <div class="bg-blue-50 p-6 rounded-2xl">
+                    <p class="text-[9px] text-blue-600 font-bold uppercase mb-2">Protocol Note</p>
+                    <p class="text-[11px] text-blue-800 leading-relaxed">Discovery beacons allow you to see nodes appearing live in the directory. You can also manually link via UID above.</p>
+                </div>
+            </div>
+            """
+
+        modal.innerHTML = f"""
+        <div class="max-w-md w-full glass-panel rounded-[3rem] p-12 shadow-2xl animate-interface">
+            {modal_content}
+            <button class="w-full mt-10 text-slate-400 text-[10px] font-bold uppercase hover:text-red-500 transition-colors" onclick="app.close_nexus_modal()">Abort Action</button>
+        </div>"""
+
+    def finalize_group(self):
+        name = self._get_safe_element("assembly-name-input").value.strip()
+        if not name: return
+        gid = f"GID-{random.randint(100000, 999999)}"
+        link = CommunicationProtocol(gid=gid, nomenclature=name, classification="ASSEMBLY", participants=[self._signature.uid])
+        self._protocols[gid] = link
+        self._save_protocols()
+        self._network.transmit_protocol("join_room", {"id": gid})
+        self.close_nexus_modal(); self.activate_protocol(gid)
+
+    def finalize_p2p(self):
+        uid = self._get_safe_element("p2p-uid-input").value.strip().upper()
+        if not uid: return
+        gid = f"P2P-{sorted([self._signature.uid, uid])[0][-4:]}-{sorted([self._signature.uid, uid])[1][-4:]}"
+        link = CommunicationProtocol(gid=gid, nomenclature=f"Liaison {uid[-6:]}", classification="P2P", participants=[self._signature.uid, uid])
+        self._protocols[gid] = link
+        self._save_protocols()
+        self._network.transmit_protocol("join_room", {"id": gid})
+        self.close_nexus_modal(); self.activate_protocol(gid)
+
+    def join_assembly(self):
+        gid = self._get_safe_element("assembly-join-input").value.strip().upper()
+        if not gid: return
+        link = CommunicationProtocol(gid=gid, nomenclature=f"Assembly {gid[-4:]}", classification="ASSEMBLY", participants=[self._signature.uid])
+        self._protocols[gid] = link
+        self._save_protocols()
+        self._network.transmit_protocol("join_room", {"id": gid})
+        self.close_nexus_modal(); self.activate_protocol(gid)
+
+    def close_nexus_modal(self): self._get_safe_element("modal-container").classList.add("hidden")
+    
+    def _render_pulse_stream(self):
+        cont = self._get_safe_element("pip-messages")
+        if not cont: return
+        cont.innerHTML = ""
+        if self._registry.has_earlier(self._active_gid):
+            cont.innerHTML += """<div class="flex justify-center"><button onclick="app.load_earlier()" class="px-4 py-1 rounded-full bg-white border text-[10px] font-bold uppercase text-slate-500 hover:text-blue-600">Load earlier</button></div>"""
+        pulses = self._registry._archives.get(self._active_gid, [])
+        for p in pulses:
+            own = p.origin_uid == self._signature.uid
+            content_html = ""
+            if p.asset_type == "FILE":
+                content_html = self._feature("files").render_asset(p)
+            else:
+                content_html = p.transmission
+            tally = self._registry.reactions(self._active_gid, p.id)
+            chips = f"""<div class="flex gap-1 mt-1 {'justify-end' if own else ''}">{"".join(f'<span class="px-1.5 rounded-full bg-white border text-[10px] text-slate-600">{e} {n}</span>' for e, n in tally)}</div>""" if tally else ""
+
+            cont.innerHTML += f"""<div class="flex {'justify-end' if own else 'justify-start'} animate-interface"><div class="max-w-[85%]"><div class="sender-tag text-[8px] font-bold uppercase text-blue-800 mb-1 pl-1">{p.origin_designation}</div><div ondblclick="app.react('👍', '{p.id}')" class="px-5 py-3 rounded-2xl text-[12px] shadow-sm {'bg-blue-600 text-white' if own else 'bg-white border text-slate-700'}" style="border-radius: {'1.5rem 0.5rem 1.5rem 1.5rem' if own else '0.5rem 1.5rem 1.5rem 1.5rem'}">{content_html}</div>{chips}</div></div>"""
+        cont.scrollTo(0, cont.scrollHeight)
+
+    def load_earlier(self):
+        """Page the next older slice of the active room in from storage."""
+        gid = self._active_gid
+        async def page():
+            if await self._registry.load_earlier(gid) and gid == self._active_gid: self._ui.mark("stream")
+        if gid: asyncio.ensure_future(page())
+
+    def _render_nexus_landing(self):
+        cont = self._get_safe_element("view-nexus")
+        if cont: cont.innerHTML = f"""<div class="max-w-4xl mx-auto py-32 text-center animate-interface"><div class="flex justify-center mb-16">{get_varta_logo_svg("w-32 h-32")}</div><h1 class="text-5xl font-bold branding-font mb-8 tracking-tighter text-blue-800">NEXUS CORE</h1><p class="text-slate-400 uppercase tracking-[0.5em] text-[10px] font-bold">Node Identity: {self._signature.uid if self._signature else 'None'}</p></div>"""
+
+    async def _load_protocols(self):
+        try:
+            data = await self._store.get_meta("protocols")
+            for k, v in (data or {}).items(): self._protocols[k] = CommunicationProtocol(**v)
+        except: pass
+
+    def _merge_protocols(self, data) -> bool:
+        changed = False
+        for k, v in (data or {}).items():
+            if k not in self._protocols:
+                self._protocols[k] = CommunicationProtocol(**v)
+                self._network.transmit_protocol("join_room", {"id": k})
+                changed = True
+        if changed: self._ui.mark("directory")
+        return changed
+
+    def _save_protocols(self): 
+        if not self._signature or not self._store: return
+        snapshot = {k: asdict(v) for k, v in self._protocols.items()}
+        if self._tabs: self._tabs.post("protocols", snapshot)
+        if self._network.owns_persistence():
+            self._store.put_meta("protocols", snapshot)
+
+    def deauthorize_liaison(self): self._feature("dashboard").deauthorize_liaison()
+    def toggle_pip_visibility(self): 
+        pip = self._get_safe_element("pip-chat-window")
+        if pip: pip.style.display = "none" if pip.style.display == "flex" else "flex"
+    def intercept_transmission(self, e): 
+        if e.key == "Enter": self.dispatch_strategic_pulse()
+    def toggle_pip_emojis(self):
+        p = self._get_safe_element("pip-emoji-picker")
+        if p: p.classList.toggle("hidden")
+    def send_pip_emoji(self, emoji):
+        if self.react(emoji): self.toggle_pip_emojis()
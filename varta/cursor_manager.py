@@ -0,0 +1,124 @@
+
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+# --- [Remote Cursor Manager] ---
+
+class RemoteCursor:
+    __slots__ = ("element", "x", "y", "target_x", "target_y", "last_update", "placed")
+
+    def __init__(self, element):
+        self.element = element
+        self.x = 0.0
+        self.y = 0.0
+        self.target_x = 0.0
+        self.target_y = 0.0
+        self.last_update = 0.0
+        self.placed = False
+
+class CursorManager:
+    """Tracks peer cursors and applies their positions once per animation frame.
+
+    Incoming positions are in canvas pixels; the canvas-to-display scale is
+    read from layout only after ``invalidate_layout`` (resize), not per pulse.
+    """
+
+    def __init__(self, document, container_id: str, canvas_getter: Callable,
+                 schedule_frame: Callable[[Callable], None], idle_timeout: float = 10.0,
+                 smoothing: Optional[float] = 0.35, clock=time.monotonic):
+        self._document = document
+        self._container_id = container_id
+        self._canvas_getter = canvas_getter
+        self._schedule_frame = schedule_frame
+        self._idle_timeout = idle_timeout
+        self._smoothing = smoothing
+        self._clock = clock
+        self._cursors: Dict[str, RemoteCursor] = {}
+        self._scale = None
+        self._frame_requested = False
+        self._sweep_task = None
+
+    def invalidate_layout(self):
+        self._scale = None
+        if self._cursors:
+            for c in self._cursors.values(): c.placed = False
+            self._request_frame()
+
+    def update(self, uid, x, y, name):
+        if not uid or x is None or y is None: return
+        cursor = self._cursors.get(uid)
+        if cursor is None:
+            cursor = self._create(uid, name)
+            if cursor is None: return
+        cursor.target_x = float(x); cursor.target_y = float(y)
+        cursor.last_update = self._clock()
+        self._request_frame()
+        self._ensure_sweep()
+
+    def remove(self, uid):
+        cursor = self._cursors.pop(uid, None)
+        if cursor: cursor.element.remove()
+
+    def clear(self):
+        for uid in list(self._cursors.keys()): self.remove(uid)
+
+    def _create(self, uid, name) -> Optional[RemoteCursor]:
+        cont = self._document.getElementById(self._container_id)
+        if not cont: return None
+        el = self._document.createElement("div")
+        el.id = f"cursor-{uid}"
+        el.style.position = "absolute"; el.style.left = "0px"; el.style.top = "0px"
+        el.style.pointerEvents = "none"; el.style.zIndex = "100"; el.style.willChange = "transform"
+        el.innerHTML = f'<svg width="16" height="16" viewBox="0 0 20 20" fill="none"><path d="M0 0L19 7L11 9L9 17L0 0Z" fill="#1e40af" stroke="white" stroke-width="1"/></svg><div style="position:absolute;left:10px;top:10px;background:#1e40af;color:white;font-size:8px;padding:2px 4px;border-radius:4px;white-space:nowrap;">{name}</div>'
+        cont.appendChild(el)
+        cursor = RemoteCursor(el)
+        self._cursors[uid] = cursor
+        return cursor
+
+    def _request_frame(self):
+        if self._frame_requested: return
+        self._frame_requested = True
+        self._schedule_frame(self.on_frame)
+
+    def _display_scale(self):
+        if self._scale is None:
+            canvas = self._canvas_getter()
+            if not canvas or not canvas.width or not canvas.height: return None
+            rect = canvas.getBoundingClientRect()
+            self._scale = (rect.width / canvas.width, rect.height / canvas.height)
+        return self._scale
+
+    def on_frame(self, *args):
+        self._frame_requested = False
+        scale = self._display_scale()
+        if scale is None: return
+        sx, sy = scale
+        moving = False
+        for cursor in self._cursors.values():
+            tx = cursor.target_x * sx; ty = cursor.target_y * sy
+            if not cursor.placed or not self._smoothing:
+                nx, ny = tx, ty
+            else:
+                nx = cursor.x + (tx - cursor.x) * self._smoothing
+                ny = cursor.y + (ty - cursor.y) * self._smoothing
+                if abs(tx - nx) < 0.5 and abs(ty - ny) < 0.5: nx, ny = tx, ty
+                else: moving = True
+            if not cursor.placed or nx != cursor.x or ny != cursor.y:
+                cursor.element.style.transform = f"translate3d({nx:.1f}px, {ny:.1f}px, 0)"
+                cursor.x, cursor.y, cursor.placed = nx, ny, True
+        if moving: self._request_frame()
+
+    def _ensure_sweep(self):
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.ensure_future(self._sweep())
+
+    async def _sweep(self):
+        while self._cursors:
+            await asyncio.sleep(self._idle_timeout / 2)
+            cutoff = self._clock() - self._idle_timeout
+            for uid in [u for u, c in self._cursors.items() if c.last_update < cutoff]:
+                self.remove(uid)
+
+    def active_count(self) -> int:
+        return len(self._cursors)
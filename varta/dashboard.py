@@ -0,0 +1,21 @@
+
+from js import window, localStorage
+
+# --- [Signature Dashboard] ---
+
+class SignatureDashboard:
+    """Profile view for the local liaison."""
+
+    def __init__(self, app):
+        self._app = app
+
+    def render(self):
+        cont = self._app._get_safe_element("view-signature")
+        if cont: cont.innerHTML = f"""<div class="max-w-md w-full glass-panel rounded-[4rem] p-16 text-center animate-interface shadow-2xl"><img src="{self._app._signature.avatar_proxy}" class="w-44 h-44 mx-auto rounded-[3rem] shadow-xl border-8 border-white mb-12" /><h2 class="text-3xl font-bold branding-font mb-3 uppercase text-blue-900">{self._app._signature.designation}</h2><p class="text-slate-400 text-xs mb-10">{self._app._signature.uid}</p><button onclick="app.deauthorize_liaison()" class="w-full py-6 bg-red-50 text-red-600 border border-red-100 rounded-3xl text-[12px] font-bold uppercase tracking-widest hover:bg-red-600 hover:text-white transition-all shadow-sm">Deauthorize Profile</button></div>"""
+
+    def deauthorize_liaison(self):
+        localStorage.removeItem("varta_liaison_signature")
+        window.location.reload()
+
+def attach(app):
+    return SignatureDashboard(app)
@@ -0,0 +1,38 @@
+
+from js import FileReader
+from pyodide.ffi import create_proxy
+
+# --- [File Transfer] ---
+
+class FileTransfer:
+    """Sends picked files as FILE pulses (data URLs) and renders received ones."""
+
+    def __init__(self, app):
+        self._app = app
+
+    def handle_file_select(self, event, context):
+        files = event.target.files
+        if not files or not files.length: return
+        file = files[0]
+        reader = FileReader.new()
+        
+        def on_load(e):
+            base64_data = reader.result
+            if self._app._active_gid:
+                self._app._registry.dispatch_pulse(self._app._signature, self._app._active_gid, f"Shared Protocol Asset: {file.name}|{base64_data}", asset_type="FILE")
+        
+        reader.onload = create_proxy(on_load)
+        reader.readAsDataURL(file)
+
+    def render_asset(self, pulse) -> str:
+        try:
+            name, data = pulse.transmission.split("|", 1)
+            name = name.replace("Shared Protocol Asset: ", "")
+            if "data:image" in data:
+                return f'<div class="mb-2"><img src="{data}" class="rounded-lg max-h-40 w-full object-cover border" /></div><a href="{data}" download="{name}" class="text-[10px] font-bold underline text-blue-800">Download Asset</a>'
+            return f'<div class="flex items-center space-x-2"><svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path d="M7 21h10a2 2 0 002-2V9.414a1 1 0 00-.293-.707l-5.414-5.414A1 1 0 0012.586 3H7a2 2 0 00-2 2v14a2 2 0 002 2z"></path></svg><a href="{data}" download="{name}" class="text-[11px] font-bold underline truncate text-blue-800">{name}</a></div>'
+        except:
+            return pulse.transmission
+
+def attach(app):
+    return FileTransfer(app)
@@ -0,0 +1,89 @@
+
+import time
+from typing import Dict, Optional
+
+# --- [Link Quality & Adaptive Rates] ---
+
+# Seconds between cursor sends / stroke batch flushes at each link level.
+CURSOR_INTERVALS = {"good": 1 / 30, "fair": 1 / 12, "poor": 1 / 5, "offline": 1 / 5}
+STROKE_INTERVALS = {"good": 0.03, "fair": 0.08, "poor": 0.2, "offline": 0.2}
+
+class LinkMonitor:
+    """Smoothed RTT, jitter, probe loss and send backlog, mapped to a link level.
+
+    RTT comes from PING probes echoed through the signaling server; each
+    sample is folded into an EWMA so one slow probe does not flip the level.
+    """
+
+    def __init__(self, alpha: float = 0.25, clock=time.monotonic):
+        self._alpha = alpha
+        self._clock = clock
+        self._outstanding: Dict[int, float] = {}
+        self._nonce = 0
+        self.rtt_ms: Optional[float] = None
+        self.jitter_ms = 0.0
+        self.backlog = 0
+        self.transport = ""
+        self.connected = False
+        self.sent = 0
+        self.lost = 0
+        self._recent_loss = 0.0
+
+    def next_probe(self) -> int:
+        self._nonce += 1
+        self._outstanding[self._nonce] = self._clock()
+        self.sent += 1
+        return self._nonce
+
+    def probe_echoed(self, nonce) -> Optional[float]:
+        sent = self._outstanding.pop(nonce, None)
+        if sent is None: return None
+        sample = (self._clock() - sent) * 1000.0
+        if self.rtt_ms is None:
+            self.rtt_ms = sample
+        else:
+            self.jitter_ms += self._alpha * (abs(sample - self.rtt_ms) - self.jitter_ms)
+            self.rtt_ms += self._alpha * (sample - self.rtt_ms)
+        self._recent_loss *= (1 - self._alpha)
+        return sample
+
+    def expire_probes(self, timeout: float) -> int:
+        cutoff = self._clock() - timeout
+        stale = [n for n, sent in self._outstanding.items() if sent < cutoff]
+        for n in stale: del self._outstanding[n]
+        self.lost += len(stale)
+        for _ in stale: self._recent_loss += self._alpha * (1 - self._recent_loss)
+        return len(stale)
+
+    def observe(self, connected: bool, transport: str = "", backlog: int = 0):
+        self.connected = connected
+        self.transport = transport or self.transport
+        self.backlog = backlog
+
+    @property
+    def level(self) -> str:
+        if not self.connected: return "offline"
+        rtt = self.rtt_ms or 0.0
+        if rtt > 400 or self.backlog > 10 or self._recent_loss > 0.3: return "poor"
+        if rtt > 150 or self.backlog > 2 or self._recent_loss > 0.05 or self.jitter_ms > 80: return "fair"
+        return "good"
+
+    @property
+    def cursor_interval(self) -> float:
+        return CURSOR_INTERVALS[self.level]
+
+    @property
+    def stroke_interval(self) -> float:
+        return STROKE_INTERVALS[self.level]
+
+    def snapshot(self) -> dict:
+        return {"level": self.level, "rtt_ms": round(self.rtt_ms, 1) if self.rtt_ms is not None else None,
+                "jitter_ms": round(self.jitter_ms, 1), "backlog": self.backlog, "transport": self.transport,
+                "connected": self.connected, "probes_sent": self.sent, "probes_lost": self.lost,
+                "cursor_hz": round(1 / self.cursor_interval, 1), "stroke_batch_ms": int(self.stroke_interval * 1000)}
+
+    def apply_snapshot(self, snap: dict):
+        """Mirror a leader tab's link state in a follower that has no socket of its own."""
+        self.rtt_ms = snap.get("rtt_ms"); self.jitter_ms = snap.get("jitter_ms", 0.0)
+        self.backlog = snap.get("backlog", 0); self.transport = snap.get("transport", "")
+        self.connected = snap.get("connected", False)
@@ -0,0 +1,28 @@
+
+import asyncio
+from typing import Any, Callable, Dict, List
+from js import console
+
+# --- [System Event Bus] ---
+
+class ServiceMesh:
+    def __init__(self):
+        self._registry: Dict[str, List[Callable]] = {}
+
+    def subscribe(self, event: str, callback: Callable):
+        if event not in self._registry:
+            self._registry[event] = []
+        self._registry[event].append(callback)
+
+    def publish(self, event: str, data: Any = None):
+        if event in self._registry:
+            for callback in self._registry[event]:
+                if asyncio.iscoroutinefunction(callback):
+                    asyncio.ensure_future(callback(data))
+                else:
+                    try:
+                        callback(data)
+                    except Exception as e:
+                        console.error(f"Mesh Publish Error: {str(event)} - {str(e)}")
+
+nexus_bus = ServiceMesh()
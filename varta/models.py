@@ -0,0 +1,31 @@
+
+from dataclasses import dataclass
+from typing import List
+
+# --- [Core Data Structures] ---
+
+@dataclass
+class LiaisonSignature:
+    uid: str
+    designation: str
+    avatar_proxy: str = ""
+    liaison_status: str = "Authorized"
+    last_seen: float = 0.0
+
+@dataclass
+class StrategicPulse:
+    id: str
+    protocol_code: str
+    origin_uid: str
+    origin_designation: str
+    transmission: str
+    timestamp: int
+    asset_type: str = "TEXT" # TEXT or FILE
+
+@dataclass
+class CommunicationProtocol:
+    gid: str
+    nomenclature: str
+    classification: str # P2P or ASSEMBLY
+    participants: List[str]
+    description: str = "Secure Liaison Link"
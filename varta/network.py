@@ -0,0 +1,211 @@
+
+import asyncio
+import json
+import time
+from typing import Optional
+from js import window
+from pyodide.ffi import to_js, create_proxy
+from .link_quality import LinkMonitor
+from .mesh import nexus_bus
+from .registry import shared_with_tabs
+from .room_channels import InterestSet, live_channel, split_channel
+from .signal_trace import SignalRecorder
+from .tab_coordinator import TabCoordinator
+
+# --- [Signaling Network] ---
+
+# Chat signals arriving within one frame are handed to the registry together.
+INGEST_WINDOW = 0.016
+
+def _js(value):
+    """Plain JS objects rather than Maps: socket.io only reads and serializes object properties."""
+    return to_js(value, dict_converter=window.Object.fromEntries)
+
+class LiaisonNetwork:
+    def __init__(self):
+        self._socket = None
+        self._relay: Optional[TabCoordinator] = None
+        self._recorder = SignalRecorder()
+        self._link = LinkMonitor()
+        self._probe_task = None
+        self._interest = InterestSet()
+        self._inbox = []
+        self._inbox_timer = None
+
+    def is_linked(self):
+        if self._socket and self._socket.connected: return True
+        return bool(self._relay and not self._relay.is_leader and self._relay.leader_present())
+
+    def owns_persistence(self):
+        return self._relay is None or self._relay.is_leader
+
+    async def establish_synchronization(self):
+        for _ in range(30):
+            if hasattr(window, "io"): break
+            await asyncio.sleep(0.2)
+        if not hasattr(window, "io"): return
+
+        hostname = window.location.hostname
+        origin = window.location.origin
+        base_endpoint = origin
+        if hostname in ["localhost", "127.0.0.1"] and window.location.port != "3000":
+             base_endpoint = f"{window.location.protocol}//{hostname}:3000"
+        
+        # Websocket first; tryAllTransports falls back to long-polling where websockets are blocked.
+        config = _js({"transports": ["websocket", "polling"], "tryAllTransports": True, "reconnection": True})
+        try:
+            self._socket = window.io.connect(base_endpoint, config)
+            def on_handshake(*args):
+                nexus_bus.publish("SYNC_ESTABLISHED", self._socket.id)
+                self._socket.emit("join_room", _js({"id": "varta_global_signaling"}))
+                self._socket.emit("join_room", _js({"id": self._probe_room()}))
+                for gid in window.app._protocols.keys():
+                    self._socket.emit("join_room", _js({"id": gid}))
+                for channel in sorted(self._interest.channels()):
+                    self._socket.emit("join_room", _js({"id": channel}))
+                for gid in self._interest.rooms():
+                    self._socket.emit("fetch_board", _js({"id": live_channel(gid, "board")}))
+            def on_signal(signal, *args):
+                try:
+                    data = signal.to_py() if hasattr(signal, 'to_py') else signal
+                    self._recorder.record(data)
+                    if data.get("roomId") == self._probe_room():
+                        self._handle_probe_echo(data)
+                        return
+                    if data.get("senderId") == window.app._signature.uid: return
+                    rid, kind = split_channel(data.get("roomId"))
+                    if kind is None and rid != "varta_global_signaling":
+                        self._queue_signals([data])
+                        return
+                    nexus_bus.publish("REMOTE_SIGNAL", data)
+                    if self._relay: self._relay.post("signal", {"data": data})
+                except:
+                    pass
+            def on_signal_batch(frame, *args):
+                try:
+                    data = frame.to_py() if hasattr(frame, 'to_py') else frame
+                    own = window.app._signature.uid
+                    signals = []
+                    for signal in data.get("messages") or []:
+                        self._recorder.record(signal)
+                        if signal.get("senderId") != own: signals.append(signal)
+                    self._queue_signals(signals, drain=True)
+                except:
+                    pass
+            self._socket.on("connect", create_proxy(on_handshake))
+            def on_board_history(history, *args):
+                try:
+                    data = history.to_py() if hasattr(history, 'to_py') else history
+                    self._publish_board_history(data)
+                    if self._relay: self._relay.post("board_history", data)
+                except:
+                    pass
+            self._socket.on("message", create_proxy(on_signal))
+            self._socket.on("message_batch", create_proxy(on_signal_batch))
+            self._socket.on("board_history", create_proxy(on_board_history))
+            if self._probe_task is None or self._probe_task.done():
+                self._probe_task = asyncio.ensure_future(self._probe_link())
+        except:
+            pass
+
+    def _queue_signals(self, signals, drain=False):
+        """Hold chat signals for ``INGEST_WINDOW`` so a burst reaches the registry as one batch."""
+        self._inbox.extend(signals)
+        if drain: self._drain_inbox()
+        elif self._inbox and self._inbox_timer is None:
+            self._inbox_timer = asyncio.get_event_loop().call_later(INGEST_WINDOW, self._drain_inbox)
+
+    def _drain_inbox(self):
+        if self._inbox_timer is not None:
+            self._inbox_timer.cancel()
+            self._inbox_timer = None
+        signals, self._inbox = self._inbox, []
+        if not signals: return
+        nexus_bus.publish("REMOTE_SIGNAL_BATCH", signals)
+        if self._relay: self._relay.post("signal_batch", {"data": signals})
+
+    def _probe_room(self):
+        return f"varta_probe_{window.app._signature.uid}"
+
+    async def _probe_link(self, interval=4.0):
+        """PING ourselves through a private room; the server's room echo measures the round trip."""
+        while self._socket is not None:
+            sock = self._socket
+            self._link.expire_probes(interval * 2)
+            self._link.observe(bool(sock.connected), self._transport_name(), self._send_backlog())
+            if sock.connected:
+                uid = window.app._signature.uid
+                sock.emit("send_message", _js({
+                    "roomId": self._probe_room(),
+                    "senderId": uid,
+                    "content": json.dumps({"type": "PING", "senderId": uid, "targetId": uid, "nonce": self._link.next_probe()}),
+                    "timestamp": int(time.time()*1000)
+                }))
+            self._publish_link_stats()
+            await asyncio.sleep(interval)
+
+    def _handle_probe_echo(self, data):
+        try:
+            probe = json.loads(data.get("content"))
+            if probe.get("type") == "PING" and self._link.probe_echoed(probe.get("nonce")) is not None:
+                self._publish_link_stats()
+        except:
+            pass
+
+    def _transport_name(self):
+        try: return str(self._socket.io.engine.transport.name)
+        except: return ""
+
+    def _send_backlog(self):
+        backlog = 0
+        try: backlog += int(self._socket.sendBuffer.length)
+        except: pass
+        try: backlog += int(self._socket.io.engine.writeBuffer.length)
+        except: pass
+        return backlog
+
+    def _publish_link_stats(self):
+        snapshot = self._link.snapshot()
+        nexus_bus.publish("LINK_STATS", snapshot)
+        if self._relay and self._relay.is_leader: self._relay.post("link", snapshot)
+
+    def link_stats(self):
+        return self._link.snapshot()
+
+    def focus_room(self, gid, owner=None):
+        """Subscribe cursor/stroke channels for the room on screen and drop the previous one's."""
+        if self._relay and not self._relay.is_leader:
+            self._relay.post("focus", {"gid": gid})
+            return
+        owner = owner or (self._relay.tab_id if self._relay else "local")
+        if self._interest.focused(owner) == gid: return
+        joins, leaves = self._interest.focus(owner, gid)
+        if not (self._socket and self._socket.connected): return
+        for channel in leaves: self._socket.emit("leave_room", _js({"id": channel}))
+        for channel in joins: self._socket.emit("join_room", _js({"id": channel}))
+        # Background rooms never streamed strokes; replay the server's log for this one.
+        if gid: self._socket.emit("fetch_board", _js({"id": live_channel(gid, "board")}))
+
+    def _publish_board_history(self, data):
+        gid, _ = split_channel(data.get("roomId"))
+        pulses = []
+        for signal in data.get("pulses") or []:
+            try: pulses.append(json.loads(signal.get("content")))
+            except: pass
+        nexus_bus.publish("BOARD_HISTORY", (gid, pulses))
+
+    def transmit_protocol(self, signal, payload, origin_tab=None):
+        if self._socket and self._socket.connected: 
+            self._socket.emit(signal, _js(payload))
+        elif self._relay and not self._relay.is_leader:
+            self._relay.post("emit", {"signal": signal, "payload": payload})
+            return
+        if self._relay and self._relay.is_leader and signal == "send_message" and shared_with_tabs(payload):
+            self._relay.post("signal", {"data": payload, "origin_tab": origin_tab})
+
+    def release(self):
+        self._interest.reset()
+        if self._socket:
+            try: self._socket.disconnect()
+            except: pass
+            self._socket = None
@@ -0,0 +1,217 @@
+
+import asyncio
+import json
+import time
+from typing import List
+from js import window, document
+from pyodide.ffi import create_proxy
+from .cursor_manager import CursorManager
+
+# --- [Shared Board] ---
+
+class BoardPad:
+    """Whiteboard for the active room: local strokes, remote strokes and live cursors."""
+
+    def __init__(self, app):
+        self._app = app
+        self._is_drawing = False
+        self._paint_tool = "brush"
+        # Outbound board traffic is paced by link quality: cursors are throttled, stroke points batched.
+        self._cursor_last = 0.0
+        self._cursor_pending = None
+        self._cursor_timer = None
+        self._stroke_points: List[List[float]] = []
+        self._stroke_style = None
+        self._stroke_timer = None
+        self._ctx = None
+        self._canvas = None
+        self._resize_observer = None
+        self._cursors = CursorManager(document, "remote-cursors-container", lambda: self._canvas, app._schedule_frame)
+        self._init_board()
+
+    def switch_room(self, previous_gid):
+        self._flush_stroke()
+        self._announce_cursor_leave(previous_gid)
+        self.clear_board_local()
+        self._cursors.clear()
+
+    def _init_board(self):
+        self._canvas = self._app._get_safe_element("board-canvas")
+        if not self._canvas: return
+        self._ctx = self._canvas.getContext("2d")
+        
+        self._canvas.addEventListener("mousedown", create_proxy(lambda e: self._handle_draw_start(e)))
+        self._canvas.addEventListener("mouseup", create_proxy(lambda e: self._handle_draw_stop(e)))
+        self._canvas.addEventListener("mousemove", create_proxy(lambda e: self._handle_board_move(e)))
+        window.addEventListener("resize", create_proxy(lambda e: self._app._ui.mark("canvas")))
+        # Layout changes without a window resize (the sidebar animating its width) move the canvas too.
+        if hasattr(window, "ResizeObserver"):
+            self._resize_observer = window.ResizeObserver.new(create_proxy(lambda *args: self._app._ui.mark("canvas")))
+            self._resize_observer.observe(self._canvas)
+        else:
+            sidebar = self._app._get_safe_element("sidebar-container")
+            if sidebar: sidebar.addEventListener("transitionend", create_proxy(lambda e: self._app._ui.mark("canvas")))
+        window.addEventListener("pagehide", create_proxy(lambda e: self._leave_board(self._app._active_gid)))
+
+    def _resize_canvas(self):
+        if not self._canvas: return
+        self._cursors.invalidate_layout()
+        rect = self._canvas.parentElement.getBoundingClientRect()
+        if rect.width > 0 and rect.height > 0:
+            if self._canvas.width != int(rect.width) or self._canvas.height != int(rect.height):
+                try: temp = self._ctx.getImageData(0, 0, self._canvas.width, self._canvas.height)
+                except: temp = None
+                self._canvas.width = int(rect.width)
+                self._canvas.height = int(rect.height)
+                if temp: self._ctx.putImageData(temp, 0, 0)
+
+    def _get_canvas_coords(self, e):
+        rect = self._canvas.getBoundingClientRect()
+        # Ensure scale is accurate for precise drawing
+        scale_x = self._canvas.width / rect.width
+        scale_y = self._canvas.height / rect.height
+        return (e.clientX - rect.left) * scale_x, (e.clientY - rect.top) * scale_y
+
+    def _handle_draw_start(self, e):
+        if not self._app._paint_active: return
+        self._is_drawing = True
+        self._ctx.beginPath()
+        x, y = self._get_canvas_coords(e)
+        self._ctx.moveTo(x, y)
+        self._draw(e)
+
+    def _handle_draw_stop(self, e): 
+        self._is_drawing = False
+        self._ctx.beginPath()
+        self._flush_stroke()
+
+    def _handle_board_move(self, e):
+        if not self._canvas: return
+        x, y = self._get_canvas_coords(e)
+        if self._app._active_gid:
+            self._cursor_pending = (self._app._active_gid, round(x, 1), round(y, 1))
+            wait = self._app._network._link.cursor_interval - (time.monotonic() - self._cursor_last)
+            if wait <= 0: self._flush_cursor()
+            elif self._cursor_timer is None: self._cursor_timer = asyncio.get_event_loop().call_later(wait, self._flush_cursor)
+        if self._is_drawing: self._draw(e)
+
+    def _flush_cursor(self):
+        self._cursor_timer = None
+        if not self._cursor_pending: return
+        gid, x, y = self._cursor_pending
+        self._cursor_pending = None
+        self._cursor_last = time.monotonic()
+        if gid != self._app._active_gid: return
+        self._app._registry.dispatch_pulse(self._app._signature, gid, json.dumps({"type": "MOUSE_PULSE", "x": x, "y": y, "uid": self._app._signature.uid, "name": self._app._signature.designation}))
+
+    def _queue_stroke_point(self, x, y, color, size):
+        style = (self._app._active_gid, color, size, self._paint_tool)
+        if style != self._stroke_style: self._flush_stroke()
+        self._stroke_style = style
+        self._stroke_points.append([round(x, 1), round(y, 1)])
+        if self._stroke_timer is None:
+            self._stroke_timer = asyncio.get_event_loop().call_later(self._app._network._link.stroke_interval, self._flush_stroke)
+
+    def _flush_stroke(self):
+        if self._stroke_timer is not None:
+            self._stroke_timer.cancel()
+            self._stroke_timer = None
+        if not self._stroke_points: return
+        points, self._stroke_points = self._stroke_points, []
+        gid, color, size, tool = self._stroke_style
+        if gid != self._app._active_gid: return
+        self._app._registry.dispatch_pulse(self._app._signature, gid, json.dumps({
+            "type": "BOARD_PULSE", "kind": "path", "points": points,
+            "color": color, "size": size, "tool": tool
+        }))
+
+    def _draw(self, e):
+        if not self._is_drawing: return
+        x, y = self._get_canvas_coords(e)
+        size = int(self._app._get_safe_element("board-brush-size").value)
+        color = self._app._get_safe_element("board-brush-color").value
+        
+        self._ctx.lineWidth = size
+        self._ctx.lineCap = "round"
+        self._ctx.lineJoin = "round"
+        
+        if self._paint_tool == "eraser":
+            self._ctx.globalCompositeOperation = "destination-out"
+        else:
+            self._ctx.globalCompositeOperation = "source-over"
+            self._ctx.strokeStyle = color
+            
+        self._ctx.lineTo(x, y)
+        self._ctx.stroke()
+        self._ctx.beginPath()
+        self._ctx.moveTo(x, y)
+        
+        if self._app._active_gid:
+            self._queue_stroke_point(x, y, color if self._paint_tool == "brush" else "transparent", size)
+
+    def _handle_remote_draw(self, data_tuple):
+        rid, payload = data_tuple
+        if rid != self._app._active_gid: return
+        if payload.get("kind") == "clear":
+            self.clear_board_local()
+            return
+        kind = payload.get("kind")
+        if kind in ["line", "path"]:
+            points = (payload.get("points") or []) if kind == "path" else [[payload.get("x"), payload.get("y")]]
+            self._ctx.lineWidth = payload.get("size")
+            self._ctx.lineCap = "round"
+            self._ctx.lineJoin = "round"
+            tool = payload.get("tool", "brush")
+            if tool == "eraser": self._ctx.globalCompositeOperation = "destination-out"
+            else:
+                self._ctx.globalCompositeOperation = "source-over"
+                self._ctx.strokeStyle = payload.get("color")
+            for x, y in points:
+                self._ctx.lineTo(x, y)
+                self._ctx.stroke()
+                self._ctx.beginPath()
+                self._ctx.moveTo(x, y)
+
+    def set_paint_tool(self, tool):
+        self._paint_tool = tool
+        for t in ["brush", "eraser"]:
+            btn = self._app._get_safe_element(f"tool-{t}")
+            if btn:
+                if t == tool: btn.classList.add("active")
+                else: btn.classList.remove("active")
+
+    def trigger_clear_board(self):
+        self.clear_board_local()
+        if self._app._active_gid: self._app._registry.dispatch_pulse(self._app._signature, self._app._active_gid, json.dumps({"type": "BOARD_PULSE", "kind": "clear"}))
+
+    def clear_board_local(self):
+        if self._ctx:
+            self._ctx.globalCompositeOperation = "source-over"
+            self._ctx.clearRect(0, 0, self._canvas.width, self._canvas.height)
+
+    def _handle_remote_mouse(self, data_tuple):
+        rid, payload = data_tuple
+        if rid != self._app._active_gid: return
+        if payload.get("leave"):
+            self._cursors.remove(payload.get("uid"))
+            return
+        self._cursors.update(payload.get("uid"), payload.get("x"), payload.get("y"), payload.get("name"))
+
+    def _handle_board_history(self, data_tuple):
+        rid, pulses = data_tuple
+        if rid != self._app._active_gid or not self._ctx: return
+        self.clear_board_local()
+        for payload in pulses: self._handle_remote_draw((rid, payload))
+        self._ctx.beginPath()
+
+    def _leave_board(self, gid):
+        self._flush_stroke()
+        self._announce_cursor_leave(gid)
+        self._app._network.focus_room(None)
+
+    def _announce_cursor_leave(self, gid):
+        if gid and self._app._registry:
+            self._app._registry.dispatch_pulse(self._app._signature, gid, json.dumps({"type": "MOUSE_PULSE", "uid": self._app._signature.uid, "leave": True}))
+
+def attach(app):
+    return BoardPad(app)
@@ -0,0 +1,164 @@
+
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+# --- [Pop Overlay Engine] ---
+
+class PopSlot:
+    __slots__ = ("element", "key", "text", "author", "count", "born", "deadline", "dirty", "placed")
+
+    def __init__(self, element):
+        self.element = element
+        self.key = None
+        self.text = ""
+        self.author = ""
+        self.count = 0
+        self.born = 0.0
+        self.deadline = 0.0
+        self.dirty = False
+        self.placed = False
+
+class PopEngine:
+    """Pooled overlay bubbles driven by one scheduler task.
+
+    Elements are created once (up to ``pool_size``) and recycled; identical
+    reactions arriving within ``coalesce_window`` collapse into one bubble
+    with a counter instead of spawning new nodes.
+    """
+
+    def __init__(self, document, overlay_id: str = "pop-overlay", pool_size: int = 24,
+                 lifetime: float = 5.0, coalesce_window: float = 1.5, tick: float = 0.1,
+                 clock=time.monotonic):
+        self._document = document
+        self._overlay_id = overlay_id
+        self._pool_size = pool_size
+        self._lifetime = lifetime
+        self._coalesce_window = coalesce_window
+        self._tick = tick
+        self._clock = clock
+        self._free: List[PopSlot] = []
+        self._live: List[PopSlot] = []
+        self._by_key: Dict[Tuple, PopSlot] = {}
+        self._pending: Dict[Tuple, List] = {}
+        self._created = 0
+        self._pump_task = None
+        self.stats = {"emitted": 0, "coalesced": 0, "recycled": 0, "dropped": 0}
+
+    @staticmethod
+    def _is_reaction(text: str) -> bool:
+        return 0 < len(text) <= 4 and not any(ch.isalnum() for ch in text)
+
+    def _key_for(self, text: str, author: str) -> Tuple:
+        # Reactions merge across senders; regular pops only with an exact repeat.
+        return (text,) if self._is_reaction(text) else (author, text)
+
+    def emit(self, text, author, count: int = 1):
+        text = str(text or ""); author = str(author or "")
+        if not text: return
+        self.stats["emitted"] += 1
+        key = self._key_for(text, author)
+        now = self._clock()
+
+        slot = self._by_key.get(key)
+        if slot and now - slot.born < self._coalesce_window:
+            # The bubble keeps its one animation run, so its deadline stays put too.
+            slot.count += count
+            slot.dirty = True
+            self.stats["coalesced"] += 1
+            return
+
+        pending = self._pending.get(key)
+        if pending:
+            pending[2] += count
+            self.stats["coalesced"] += 1
+            return
+
+        if len(self._pending) >= self._pool_size:
+            # Shed the least-reacted pending pop (oldest on ties), never a busy counter.
+            weakest = min(self._pending, key=lambda k: self._pending[k][2])
+            del self._pending[weakest]
+            self.stats["dropped"] += 1
+        self._pending[key] = [text, author, count]
+        self._ensure_pump()
+
+    def _ensure_pump(self):
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.ensure_future(self._pump())
+
+    async def _pump(self):
+        while self._pending or self._live:
+            self.step()
+            await asyncio.sleep(self._tick)
+
+    def step(self, now: Optional[float] = None):
+        """One scheduler pass: expire, place pending pops, then flush DOM writes."""
+        now = self._clock() if now is None else now
+
+        if self._live and any(s.deadline <= now for s in self._live):
+            still_live = []
+            for slot in self._live:
+                if slot.deadline <= now: self._release(slot)
+                else: still_live.append(slot)
+            self._live = still_live
+
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            for key, (text, author, count) in pending.items():
+                slot = self._acquire()
+                if slot is None:
+                    self.stats["dropped"] += 1
+                    continue
+                slot.key = key; slot.text = text; slot.author = author; slot.count = count
+                slot.born = now; slot.deadline = now + self._lifetime; slot.dirty = True; slot.placed = True
+                self._by_key[key] = slot
+                self._live.append(slot)
+
+        for slot in self._live:
+            if slot.dirty: self._paint(slot)
+
+    def _acquire(self) -> Optional[PopSlot]:
+        if self._free: return self._free.pop()
+        if self._created < self._pool_size:
+            overlay = self._document.getElementById(self._overlay_id)
+            if not overlay: return None
+            el = self._document.createElement("div")
+            el.className = "nexus-pop-item"
+            el.style.display = "none"
+            overlay.appendChild(el)
+            self._created += 1
+            return PopSlot(el)
+        if not self._live: return None
+        # Pool exhausted: the oldest bubble makes way for the newest one.
+        slot = self._live.pop(0)
+        self._by_key.pop(slot.key, None)
+        self.stats["recycled"] += 1
+        return slot
+
+    def _release(self, slot: PopSlot):
+        if self._by_key.get(slot.key) is slot: del self._by_key[slot.key]
+        slot.element.style.display = "none"
+        slot.key = None; slot.dirty = False
+        self._free.append(slot)
+
+    def _paint(self, slot: PopSlot):
+        el = slot.element
+        # Reaction keys merge senders, so they carry no author label.
+        label = slot.text if len(slot.key) == 1 or not slot.author else f"{slot.author}: {slot.text}"
+        el.innerText = f"{label} ×{slot.count}" if slot.count > 1 else label
+        slot.dirty = False
+        # Counter bumps only change the text; restarting the animation would force a layout and keep the bubble from fading.
+        if not slot.placed: return
+        slot.placed = False
+        if el.style.display == "none":
+            el.style.left = f"{random.randint(15, 75)}%"
+            el.style.top = f"{random.randint(15, 75)}%"
+        # Restart the CSS keyframes on a reused node.
+        el.style.animation = "none"
+        el.offsetWidth
+        el.style.animation = ""
+        el.style.display = ""
+
+    def active_count(self) -> int:
+        return len(self._live)
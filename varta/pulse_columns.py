@@ -0,0 +1,176 @@
+
+from array import array
+from typing import Dict, Iterator, List
+
+# --- [Columnar Pulse Archives] ---
+
+ASSET_TYPES = ("TEXT", "FILE")
+_TS_MIN, _TS_MAX = -(1 << 63), (1 << 63) - 1
+
+def _timestamp(value) -> int:
+    """Epoch ms as stored in the signed 64-bit column; anything unusable becomes 0."""
+    try:
+        ts = int(value or 0)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+    return ts if _TS_MIN <= ts <= _TS_MAX else 0
+
+class InternTable:
+    """Append-only string table; each distinct value is stored once."""
+    __slots__ = ("values", "_index")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.values.append(value)
+            self._index[value] = idx
+        return idx
+
+class PulseView:
+    """Read-only record materialized from a room's columns on demand."""
+    __slots__ = ("id", "protocol_code", "origin_uid", "origin_designation", "transmission", "timestamp", "asset_type")
+
+    def __init__(self, id, protocol_code, origin_uid, origin_designation, transmission, timestamp, asset_type):
+        self.id = id
+        self.protocol_code = protocol_code
+        self.origin_uid = origin_uid
+        self.origin_designation = origin_designation
+        self.transmission = transmission
+        self.timestamp = timestamp
+        self.asset_type = asset_type
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "protocol_code": self.protocol_code, "origin_uid": self.origin_uid,
+                "origin_designation": self.origin_designation, "transmission": self.transmission,
+                "timestamp": self.timestamp, "asset_type": self.asset_type}
+
+class RoomColumns:
+    """One room's history as parallel arrays sharing the archive's intern tables."""
+    __slots__ = ("gid", "_uids", "_names", "ids", "transmissions", "timestamps", "senders", "designations", "assets", "_id_index")
+
+    def __init__(self, gid: str, uids: InternTable, names: InternTable):
+        self.gid = gid
+        self._uids = uids
+        self._names = names
+        self.ids: List[str] = []
+        self.transmissions: List[str] = []
+        self.timestamps = array("q")
+        self.senders = array("I")
+        self.designations = array("I")
+        self.assets = array("B")
+        self._id_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, pulse_id) -> bool:
+        return pulse_id in self._id_index
+
+    def append(self, id, origin_uid, origin_designation, transmission, timestamp, asset_type="TEXT") -> bool:
+        if id in self._id_index: return False
+        # Coerce every field before touching a column so a bad remote value can't leave them misaligned.
+        ts = _timestamp(timestamp)
+        asset = ASSET_TYPES.index(asset_type) if asset_type in ASSET_TYPES else 0
+        sender = self._uids.intern(origin_uid)
+        designation = self._names.intern(origin_designation)
+        self._id_index[id] = len(self.ids)
+        self.ids.append(id)
+        self.transmissions.append(transmission)
+        self.timestamps.append(ts)
+        self.senders.append(sender)
+        self.designations.append(designation)
+        self.assets.append(asset)
+        return True
+
+    def append_dict(self, p: dict) -> bool:
+        return self.append(p.get("id"), p.get("origin_uid"), p.get("origin_designation"),
+                           p.get("transmission"), p.get("timestamp"), p.get("asset_type", "TEXT"))
+
+    def prepend_dicts(self, rows: List[dict]) -> int:
+        """Put an older page of history ahead of the current one; returns how many rows were new."""
+        older = RoomColumns(self.gid, self._uids, self._names)
+        for p in rows:
+            if p.get("id") not in self._id_index: older.append_dict(p)
+        if not len(older): return 0
+        self.ids = older.ids + self.ids
+        self.transmissions = older.transmissions + self.transmissions
+        for name in ("timestamps", "senders", "designations", "assets"):
+            column = getattr(older, name)
+            column.extend(getattr(self, name))
+            setattr(self, name, column)
+        self._id_index = {pid: i for i, pid in enumerate(self.ids)}
+        return len(older)
+
+    def view(self, i: int) -> PulseView:
+        return PulseView(self.ids[i], self.gid, self._uids.values[self.senders[i]],
+                         self._names.values[self.designations[i]], self.transmissions[i],
+                         self.timestamps[i], ASSET_TYPES[self.assets[i]])
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.view(j) for j in range(*i.indices(len(self)))]
+        if i < 0: i += len(self)
+        if not 0 <= i < len(self): raise IndexError(i)
+        return self.view(i)
+
+    def __iter__(self) -> Iterator[PulseView]:
+        for i in range(len(self.ids)):
+            yield self.view(i)
+
+    def to_dicts(self) -> List[dict]:
+        return [self.view(i).to_dict() for i in range(len(self.ids))]
+
+class ColumnarArchive:
+    """Mapping of gid -> RoomColumns with interned sender and room strings."""
+
+    def __init__(self):
+        self._rooms: Dict[str, RoomColumns] = {}
+        self._gids = InternTable()
+        self._uids = InternTable()
+        self._names = InternTable()
+
+    def room(self, gid: str) -> RoomColumns:
+        cols = self._rooms.get(gid)
+        if cols is None:
+            gid = self._gids.values[self._gids.intern(gid)]
+            cols = RoomColumns(gid, self._uids, self._names)
+            self._rooms[gid] = cols
+        return cols
+
+    def get(self, gid, default=None):
+        return self._rooms.get(gid, default)
+
+    def __contains__(self, gid) -> bool:
+        return gid in self._rooms
+
+    def __getitem__(self, gid) -> RoomColumns:
+        return self._rooms[gid]
+
+    def __iter__(self):
+        return iter(self._rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def keys(self):
+        return self._rooms.keys()
+
+    def items(self):
+        return self._rooms.items()
+
+    def values(self):
+        return self._rooms.values()
+
+    def load_raw(self, raw_data: dict):
+        """Decode the persisted {gid: [pulse dict, ...]} layout straight into columns."""
+        for gid, pulses in raw_data.items():
+            room = self.room(gid)
+            for p in pulses: room.append_dict(p)
+
+    def to_serializable(self) -> dict:
+        return {gid: cols.to_dicts() for gid, cols in self._rooms.items()}
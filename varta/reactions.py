@@ -0,0 +1,94 @@
+
+import asyncio
+from typing import Callable, Dict, List, Tuple
+
+# --- [Reaction Tallies] ---
+
+# Target for reactions aimed at the room itself rather than one message.
+ROOM_TARGET = "*"
+MAX_BATCH_COUNT = 999
+
+def reaction_payload(counts: List[list]) -> dict:
+    return {"type": "REACTION_PULSE", "counts": counts}
+
+def parse_counts(payload: dict) -> List[list]:
+    """``[[target, emoji, n], ...]`` from a REACTION_PULSE, dropping anything malformed."""
+    counts = []
+    for entry in payload.get("counts") or []:
+        try:
+            target, emoji, n = entry
+            n = int(n)
+        except:
+            continue
+        if not (isinstance(target, str) and isinstance(emoji, str)) or len(target) > 64 or n <= 0: continue
+        # Emoji only: no ASCII, so a remote value can never break out of the markup it is rendered into.
+        if 0 < len(emoji) <= 8 and all(ord(ch) > 127 for ch in emoji):
+            counts.append([target, emoji, min(n, MAX_BATCH_COUNT)])
+    return counts
+
+class ReactionTally:
+    """Emoji counters per room and target, persisted as ``{gid: {target: {emoji: n}}}``.
+
+    Only the newest ``max_targets`` message targets per room are kept; the
+    room counter itself is never evicted.
+    """
+
+    def __init__(self, max_targets: int = 200):
+        self._rooms: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._max_targets = max_targets
+
+    def add(self, gid: str, target: str, emoji: str, count: int = 1):
+        targets = self._rooms.setdefault(gid, {})
+        counts = targets.get(target)
+        if counts is None:
+            counts = targets[target] = {}
+            if len(targets) > self._max_targets: self._evict(targets)
+        counts[emoji] = counts.get(emoji, 0) + count
+
+    def _evict(self, targets: Dict[str, Dict[str, int]]):
+        for target in targets:
+            if target != ROOM_TARGET:
+                del targets[target]
+                return
+
+    def apply(self, gid: str, counts: List[list]):
+        for target, emoji, n in counts: self.add(gid, target, emoji, n)
+
+    def counts(self, gid: str, target: str = ROOM_TARGET) -> Dict[str, int]:
+        return self._rooms.get(gid, {}).get(target, {})
+
+    def top(self, gid: str, target: str = ROOM_TARGET, limit: int = 6) -> List[Tuple[str, int]]:
+        return sorted(self.counts(gid, target).items(), key=lambda kv: -kv[1])[:limit]
+
+    def load(self, data: dict):
+        for gid, targets in (data or {}).items():
+            self._rooms[gid] = {t: {e: int(n) for e, n in c.items()} for t, c in targets.items()}
+
+    def to_serializable(self) -> dict:
+        return self._rooms
+
+class ReactionBatcher:
+    """Coalesces outgoing reactions into one ``send(gid, counts)`` per room every ``window`` seconds."""
+
+    def __init__(self, send: Callable[[str, List[list]], None], window: float = 0.4):
+        self._send = send
+        self._window = window
+        self._pending: Dict[str, Dict[Tuple[str, str], int]] = {}
+        self._timer = None
+        self.stats = {"reactions": 0, "batches": 0}
+
+    def add(self, gid: str, target: str, emoji: str):
+        room = self._pending.setdefault(gid, {})
+        room[(target, emoji)] = room.get((target, emoji), 0) + 1
+        self.stats["reactions"] += 1
+        if self._timer is None:
+            self._timer = asyncio.get_event_loop().call_later(self._window, self.flush)
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        for gid, room in pending.items():
+            self._send(gid, [[target, emoji, n] for (target, emoji), n in room.items()])
+            self.stats["batches"] += 1
@@ -0,0 +1,224 @@
+
+import json
+import random
+import time
+from dataclasses import asdict
+from .mesh import nexus_bus
+from .models import StrategicPulse
+from .pulse_columns import ColumnarArchive
+from .reactions import ReactionTally
+from .room_channels import route_channel, split_channel
+from .room_summary import RoomSummaryIndex
+from .storage import PAGE_SIZE
+
+# --- [Persistence & Registry] ---
+
+TECHNICAL_PULSES = ("BOARD_PULSE", "MOUSE_PULSE", "POP_PULSE", "REACTION_PULSE")
+
+def pulse_type(content):
+    try:
+        return json.loads(content).get("type")
+    except:
+        return None
+
+def is_technical_content(content) -> bool:
+    return pulse_type(content) in TECHNICAL_PULSES
+
+def shared_with_tabs(payload) -> bool:
+    """Chat and reaction sends, which sibling tabs only hear over the tab channel: the socket never echoes them."""
+    content = payload.get("content")
+    return payload.get("roomId") != "varta_global_signaling" and (not is_technical_content(content) or pulse_type(content) == "REACTION_PULSE")
+
+class PulseRegistry:
+    def __init__(self, network, store, uid, designation=""):
+        self._network = network
+        self._store = store
+        self._uid = uid
+        self._archives = ColumnarArchive()
+        # Sequence number of the oldest stored pulse held in memory, per room.
+        self._first_seq = {}
+        self._paged_in = {}
+        self._summaries = RoomSummaryIndex(uid, designation)
+        self._reactions = ReactionTally()
+        nexus_bus.subscribe("REMOTE_SIGNAL", self._ingest_signal)
+        nexus_bus.subscribe("REMOTE_SIGNAL_BATCH", self.ingest_batch)
+
+    async def load(self):
+        """Decode the newest page of every stored room, the room index and reaction tallies."""
+        summaries = await self._load_summaries()
+        await self._load_msgstore()
+        if summaries is None: self._summaries.rebuild(self._archives)
+        await self._load_reactions()
+
+    async def _load_summaries(self):
+        try:
+            stored = await self._store.get_meta("roomindex")
+            if stored: self._summaries.load(stored)
+            return stored
+        except:
+            return None
+
+    async def _load_msgstore(self):
+        for gid in self._store.rooms():
+            try:
+                self._first_seq[gid], rows = await self._store.read_recent(gid)
+                self._archives.load_raw({gid: rows})
+            except:
+                pass
+
+    async def _load_reactions(self):
+        try:
+            self._reactions.load(await self._store.get_meta("reactions"))
+        except:
+            pass
+
+    def index_base(self, gid) -> int:
+        """Pulses paged in ahead of a room's boot-time history; ``index - base`` survives ``load_earlier``."""
+        return self._paged_in.get(gid, 0)
+
+    def has_earlier(self, gid) -> bool:
+        return self._first_seq.get(gid, 0) > 0
+
+    async def load_earlier(self, gid, limit=PAGE_SIZE) -> int:
+        """Page the next older slice of a room's history in from the store."""
+        first = self._first_seq.get(gid, 0)
+        if first <= 0: return 0
+        start, rows = await self._store.read_recent(gid, end=first, limit=limit)
+        self._first_seq[gid] = start
+        added = self._archives.room(gid).prepend_dicts(rows)
+        self._paged_in[gid] = self._paged_in.get(gid, 0) + added
+        return added
+
+    async def take_over_persistence(self):
+        """On becoming the leader tab, store whatever this tab archived while another tab owned the store."""
+        await self._store.refresh()
+        for gid, room in self._archives.items():
+            stored = await self._store.read_range(gid, self._first_seq.get(gid, 0), self._store.head(gid))
+            known = {p.get("id") for p in stored}
+            for i in range(len(room)):
+                if room.ids[i] not in known: self._store.append(gid, room.view(i).to_dict())
+        self._save_summaries()
+        self._save_reactions()
+
+    def release_persistence(self):
+        """On losing leadership, drop writes not yet committed: the new leader appends from the stored heads."""
+        self._store.discard()
+
+    def _save_reactions(self):
+        if not self._network.owns_persistence(): return
+        self._store.put_meta("reactions", self._reactions.to_serializable)
+
+    def record_reactions(self, gid, counts, persist=True):
+        self._reactions.apply(gid, counts)
+        if persist: self._save_reactions()
+
+    def reactions(self, gid, target):
+        return self._reactions.top(gid, target)
+
+    def _save_summaries(self):
+        if not self._network.owns_persistence(): return
+        self._store.put_meta("roomindex", self._summaries.to_serializable)
+
+    def _decode_signal(self, data):
+        """StrategicPulse for a chat signal; technical pulses are published to their live handlers instead."""
+        if not isinstance(data, dict): return None
+        rid, _ = split_channel(data.get("roomId", "nexus"))
+        if rid == "varta_global_signaling": return None
+        
+        content = data.get("content", "")
+        asset_type = data.get("assetType", "TEXT")
+        
+        try:
+            payload = json.loads(content)
+            ptype = payload.get("type")
+            if ptype in TECHNICAL_PULSES:
+                nexus_bus.publish(f"REMOTE_{ptype}", (rid, payload))
+                return None
+        except:
+            pass 
+
+        return StrategicPulse(
+            id=data.get("id"),
+            protocol_code=rid,
+            origin_uid=data.get("senderId"),
+            origin_designation=data.get("senderName"),
+            transmission=content,
+            timestamp=data.get("timestamp"),
+            asset_type=asset_type
+        )
+
+    def _ingest_signal(self, data):
+        pulse = self._decode_signal(data)
+        if pulse is None: return
+        # Visual Pop for all incoming non-technical signals
+        nexus_bus.publish("REMOTE_POP_PULSE", (pulse.protocol_code, {"text": pulse.transmission, "name": pulse.origin_designation}))
+        self.archive_pulse(pulse)
+
+    def ingest_batch(self, signals):
+        """Decode, dedup and archive a list of signals in one pass; returns how many were new.
+
+        New pulses go to the store in the same commit and are announced
+        with a single ``PULSES_ARCHIVED`` ``(gid, start, end)`` per room,
+        the range indexing the room's archive, so views render once per
+        batch. Only the newest pulse of each room pops.
+        """
+        persist = self._network.owns_persistence()
+        ranges, newest = {}, {}
+        for data in signals:
+            pulse = self._decode_signal(data)
+            if pulse is None: continue
+            room = self._archives.room(pulse.protocol_code)
+            if not room.append(pulse.id, pulse.origin_uid, pulse.origin_designation, pulse.transmission, pulse.timestamp, pulse.asset_type): continue
+            ranges.setdefault(pulse.protocol_code, len(room) - 1)
+            newest[pulse.protocol_code] = pulse
+            self._summaries.record(pulse.protocol_code, pulse.origin_uid, pulse.origin_designation, pulse.transmission, pulse.timestamp, pulse.asset_type)
+            if persist: self._store.append(pulse.protocol_code, asdict(pulse))
+        if not ranges: return 0
+        self._save_summaries()
+        for gid, start in ranges.items():
+            pulse = newest[gid]
+            nexus_bus.publish("REMOTE_POP_PULSE", (gid, {"text": pulse.transmission, "name": pulse.origin_designation}))
+            nexus_bus.publish("PULSES_ARCHIVED", (gid, start, len(self._archives[gid])))
+        return sum(len(self._archives[gid]) - start for gid, start in ranges.items())
+
+    def archive_pulse(self, pulse: StrategicPulse):
+        room = self._archives.room(pulse.protocol_code)
+        if room.append(pulse.id, pulse.origin_uid, pulse.origin_designation, pulse.transmission, pulse.timestamp, pulse.asset_type):
+            self._summaries.record(pulse.protocol_code, pulse.origin_uid, pulse.origin_designation, pulse.transmission, pulse.timestamp, pulse.asset_type)
+            if self._network.owns_persistence(): self._store.append(pulse.protocol_code, asdict(pulse))
+            self._save_summaries()
+            nexus_bus.publish("PULSE_ARCHIVED", pulse)
+
+    def mark_active(self, gid):
+        if self._summaries.activate(gid): self._save_summaries()
+
+    def room_summary(self, gid):
+        return self._summaries.get(gid)
+
+    def order_by_activity(self, gids):
+        return self._summaries.order(gids)
+
+    def dispatch_pulse(self, liaison, protocol_code, content, asset_type="TEXT"):
+        payload = {
+            "id": f"P-{int(time.time()*1000)}-{random.randint(100,999)}",
+            "roomId": route_channel(protocol_code, content),
+            "senderId": liaison.uid,
+            "senderName": liaison.designation,
+            "content": content,
+            "timestamp": int(time.time()*1000),
+            "assetType": asset_type
+        }
+        
+        if not is_technical_content(content):
+            local_pulse = StrategicPulse(
+                id=payload["id"],
+                protocol_code=protocol_code,
+                origin_uid=payload["senderId"],
+                origin_designation=payload["senderName"],
+                transmission=payload["content"],
+                timestamp=payload["timestamp"],
+                asset_type=payload["assetType"]
+            )
+            self.archive_pulse(local_pulse)
+            
+        self._network.transmit_protocol("send_message", payload)
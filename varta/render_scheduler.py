@@ -0,0 +1,84 @@
+
+import time
+from typing import Callable, Dict, List
+
+# --- [Render Scheduler] ---
+
+class RenderStat:
+    __slots__ = ("marks", "renders", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.marks = 0
+        self.renders = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+class RenderScheduler:
+    """Coalesces UI invalidations into one render per component per animation frame.
+
+    Components render in registration order; a component may mark ones
+    registered after it during a flush and they are picked up in the same pass.
+    """
+
+    def __init__(self, schedule_frame: Callable[[Callable], None], on_error: Callable[[str, Exception], None] = None,
+                 clock=time.perf_counter):
+        self._schedule_frame = schedule_frame
+        self._on_error = on_error
+        self._clock = clock
+        self._order: List[str] = []
+        self._renderers: Dict[str, Callable] = {}
+        self._dirty = set()
+        self._frame_requested = False
+        self._flushing = False
+        self._stats: Dict[str, RenderStat] = {}
+        self.frames = 0
+
+    def register(self, name: str, renderer: Callable):
+        if name not in self._renderers: self._order.append(name)
+        self._renderers[name] = renderer
+        self._stats.setdefault(name, RenderStat())
+
+    def mark(self, *names: str):
+        for name in names:
+            if name not in self._renderers: continue
+            self._stats[name].marks += 1
+            self._dirty.add(name)
+        if self._dirty and not self._frame_requested and not self._flushing:
+            self._frame_requested = True
+            self._schedule_frame(self.flush)
+
+    def is_dirty(self, name: str) -> bool:
+        return name in self._dirty
+
+    def flush(self, *args):
+        self._frame_requested = False
+        if not self._dirty: return
+        self.frames += 1
+        self._flushing = True
+        for name in self._order:
+            if name not in self._dirty: continue
+            self._dirty.discard(name)
+            stat = self._stats[name]
+            start = self._clock()
+            try:
+                self._renderers[name]()
+            except Exception as e:
+                if self._on_error: self._on_error(name, e)
+            elapsed = (self._clock() - start) * 1000.0
+            stat.renders += 1
+            stat.total_ms += elapsed
+            if elapsed > stat.max_ms: stat.max_ms = elapsed
+        self._flushing = False
+        # Anything marked behind the cursor during this pass waits for the next frame.
+        if self._dirty and not self._frame_requested:
+            self._frame_requested = True
+            self._schedule_frame(self.flush)
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: {"marks": s.marks, "renders": s.renders, "coalesced": s.marks - s.renders,
+                       "total_ms": round(s.total_ms, 2), "avg_ms": round(s.total_ms / s.renders, 3) if s.renders else 0.0,
+                       "max_ms": round(s.max_ms, 2)} for name, s in self._stats.items()}
+
+    def reset_stats(self):
+        for name in self._stats: self._stats[name] = RenderStat()
+        self.frames = 0
@@ -0,0 +1,62 @@
+
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+# --- [Room Channels & Interest Management] ---
+
+# Chat, files and reactions travel on the durable channel (the gid itself); high-frequency
+# pulses get ephemeral side channels that are only subscribed while someone views the room.
+EPHEMERAL_KINDS = {"MOUSE_PULSE": "cursor", "BOARD_PULSE": "board"}
+CHANNEL_SEP = "::"
+
+def live_channel(gid: str, kind: str) -> str:
+    return f"{gid}{CHANNEL_SEP}{kind}"
+
+def live_channels(gid: str) -> List[str]:
+    return [live_channel(gid, kind) for kind in EPHEMERAL_KINDS.values()]
+
+def split_channel(rid: str) -> Tuple[str, Optional[str]]:
+    """``GID-1::board`` -> ("GID-1", "board"); durable rooms return (gid, None)."""
+    gid, sep, kind = (rid or "").partition(CHANNEL_SEP)
+    return (gid, kind) if sep else (gid, None)
+
+def route_channel(gid: str, content) -> str:
+    """Socket room a pulse for ``gid`` is sent on, based on its JSON ``type``."""
+    if not isinstance(content, str) or not content.startswith("{"): return gid
+    try:
+        kind = EPHEMERAL_KINDS.get(json.loads(content).get("type"))
+    except:
+        return gid
+    return live_channel(gid, kind) if kind else gid
+
+class InterestSet:
+    """The room each viewer (this tab or a sibling tab) has open.
+
+    The socket subscribes to the ephemeral channels of the union, so one
+    tab switching rooms never unsubscribes a room another tab still shows.
+    """
+
+    def __init__(self):
+        self._focus: Dict[str, str] = {}
+
+    def rooms(self) -> Set[str]:
+        return set(self._focus.values())
+
+    def channels(self) -> Set[str]:
+        return {ch for gid in self.rooms() for ch in live_channels(gid)}
+
+    def focused(self, owner: str) -> Optional[str]:
+        return self._focus.get(owner)
+
+    def focus(self, owner: str, gid: Optional[str]) -> Tuple[List[str], List[str]]:
+        """Point ``owner`` at ``gid`` (None to drop it); returns (channels to join, channels to leave)."""
+        before = self.channels()
+        if gid: self._focus[owner] = gid
+        else: self._focus.pop(owner, None)
+        after = self.channels()
+        return sorted(after - before), sorted(before - after)
+
+    def reset(self) -> List[str]:
+        leaving = sorted(self.channels())
+        self._focus.clear()
+        return leaving
@@ -0,0 +1,87 @@
+
+from typing import Dict, Iterable, List, Optional
+
+# --- [Room Summary Index] ---
+
+PREVIEW_CHARS = 60
+
+class RoomSummary:
+    __slots__ = ("unread", "last_preview", "last_sender", "last_activity", "mention")
+
+    def __init__(self, unread=0, last_preview="", last_sender="", last_activity=0, mention=False):
+        self.unread = unread
+        self.last_preview = last_preview
+        self.last_sender = last_sender
+        self.last_activity = last_activity
+        self.mention = mention
+
+    def to_dict(self) -> dict:
+        return {"unread": self.unread, "last_preview": self.last_preview, "last_sender": self.last_sender,
+                "last_activity": self.last_activity, "mention": self.mention}
+
+def preview_of(transmission: str, asset_type: str) -> str:
+    if asset_type == "FILE":
+        name = transmission.split("|", 1)[0].replace("Shared Protocol Asset: ", "")
+        return f"📎 {name}"[:PREVIEW_CHARS]
+    text = " ".join(transmission.split())
+    return text if len(text) <= PREVIEW_CHARS else text[:PREVIEW_CHARS - 1] + "…"
+
+class RoomSummaryIndex:
+    """Per-room unread count, last pulse preview and activity, kept current in O(1) per pulse."""
+
+    def __init__(self, own_uid: str, own_designation: str = ""):
+        self._own_uid = own_uid
+        self._mention_tag = f"@{own_designation.lower()}" if own_designation else None
+        self._rooms: Dict[str, RoomSummary] = {}
+        self.active_gid: Optional[str] = None
+
+    def get(self, gid: str) -> RoomSummary:
+        summary = self._rooms.get(gid)
+        if summary is None:
+            summary = RoomSummary()
+            self._rooms[gid] = summary
+        return summary
+
+    def record(self, gid, origin_uid, origin_designation, transmission, timestamp, asset_type="TEXT"):
+        summary = self.get(gid)
+        # Late arrivals from a reconnect backlog still count as unread but never replace the preview.
+        if not timestamp or timestamp >= summary.last_activity:
+            summary.last_activity = timestamp or summary.last_activity
+            summary.last_preview = preview_of(transmission or "", asset_type)
+            summary.last_sender = origin_designation or ""
+        if origin_uid == self._own_uid or gid == self.active_gid: return
+        summary.unread += 1
+        if self._mention_tag and asset_type != "FILE" and self._mention_tag in (transmission or "").lower():
+            summary.mention = True
+
+    def activate(self, gid: Optional[str]) -> bool:
+        self.active_gid = gid
+        if gid is None: return False
+        summary = self._rooms.get(gid)
+        if summary and (summary.unread or summary.mention):
+            summary.unread = 0
+            summary.mention = False
+            return True
+        return False
+
+    def rebuild(self, archive):
+        """One-off backfill from decoded histories when no persisted index exists."""
+        self._rooms.clear()
+        for gid, room in archive.items():
+            summary = self.get(gid)
+            if len(room):
+                last = room[-1]
+                summary.last_activity = last.timestamp
+                summary.last_preview = preview_of(last.transmission, last.asset_type)
+                summary.last_sender = last.origin_designation
+
+    def order(self, gids: Iterable[str]) -> List[str]:
+        """Most recently active first; rooms without activity keep their relative order."""
+        return sorted(gids, key=lambda g: -(self._rooms[g].last_activity if g in self._rooms else 0))
+
+    def load(self, data: dict):
+        for gid, fields in (data or {}).items():
+            self._rooms[gid] = RoomSummary(**fields)
+
+    def to_serializable(self) -> dict:
+        return {gid: s.to_dict() for gid, s in self._rooms.items()}
@@ -0,0 +1,86 @@
+
+import hashlib
+import json
+import time
+from typing import Any, List, Optional, Tuple
+
+# --- [Signal Trace Recording] ---
+
+TRACE_VERSION = 1
+# Structural fields a replay needs to route a pulse exactly like the original.
+ROUTING_KEYS = {"type", "kind", "tool", "leave", "uid", "targetId", "senderId"}
+
+def _mask(text: str) -> str:
+    return "x" * len(text)
+
+def _pseudonym(text) -> str:
+    if not text: return text
+    return "N-" + hashlib.sha1(str(text).encode("utf-8")).hexdigest()[:8]
+
+def _redact_value(key, value):
+    if key in ROUTING_KEYS: return value
+    if isinstance(value, str): return _mask(value)
+    if isinstance(value, dict): return {k: _redact_value(k, v) for k, v in value.items()}
+    if isinstance(value, list): return [_redact_value(key, v) for v in value]
+    return value
+
+def redact_signal(signal: dict) -> dict:
+    """Keep ids, rooms, timings and pulse structure; mask text and pseudonymize names."""
+    out = dict(signal)
+    if "senderName" in out: out["senderName"] = _pseudonym(out["senderName"])
+    content = out.get("content")
+    if isinstance(content, str):
+        try:
+            payload = json.loads(content)
+        except:
+            payload = None
+        if isinstance(payload, dict):
+            out["content"] = json.dumps({k: _redact_value(k, v) for k, v in payload.items()})
+        else:
+            out["content"] = _mask(content)
+    return out
+
+class SignalRecorder:
+    """Captures incoming socket signals as ``[ms since start, signal]`` JSON lines."""
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lines: List[str] = []
+        self._started: Optional[float] = None
+        self._redact = False
+        self.active = False
+
+    def start(self, redact: bool = False):
+        self._lines = []
+        self._started = self._clock()
+        self._redact = redact
+        self.active = True
+
+    def stop(self) -> str:
+        self.active = False
+        return self.dump()
+
+    def record(self, signal: Any):
+        if not self.active or not isinstance(signal, dict): return
+        dt = int((self._clock() - self._started) * 1000)
+        data = redact_signal(signal) if self._redact else signal
+        self._lines.append(json.dumps([dt, data], separators=(",", ":"), ensure_ascii=False))
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def dump(self) -> str:
+        header = json.dumps({"v": TRACE_VERSION, "started": self._started, "redacted": self._redact, "signals": len(self._lines)})
+        return "\n".join([header] + self._lines) + "\n"
+
+def load_trace(text: str) -> Tuple[dict, List[Tuple[int, dict]]]:
+    lines = [l for l in text.splitlines() if l.strip()]
+    if not lines: return {"v": TRACE_VERSION, "signals": 0}, []
+    header = json.loads(lines[0])
+    if header.get("v") != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version: {header.get('v')}")
+    events = []
+    for line in lines[1:]:
+        dt, signal = json.loads(line)
+        events.append((int(dt), signal))
+    return header, events
@@ -0,0 +1,124 @@
+
+import importlib.machinery
+import sys
+import time
+from typing import Dict, Iterable, List, Tuple
+
+# --- [Startup Profiling] ---
+
+class ModuleTiming:
+    __slots__ = ("name", "phase", "read_ms", "compile_ms", "exec_ms", "nested_ms")
+
+    def __init__(self, name: str, phase: str):
+        self.name = name
+        self.phase = phase
+        self.read_ms = 0.0
+        self.compile_ms = 0.0
+        self.exec_ms = 0.0
+        self.nested_ms = 0.0
+
+class StartupProfiler:
+    """Read, compile and execute time for every module of one copy of the package.
+
+    Imports made before ``booted()`` are tagged ``boot``; features the
+    controller imports on first use afterwards are tagged ``lazy``.
+    ``exec_ms`` is the module body alone, excluding its own nested imports.
+    """
+
+    def __init__(self, root: str, clock=time.perf_counter):
+        self.root = root
+        self._clock = clock
+        self.phase = "boot"
+        self.modules: Dict[str, ModuleTiming] = {}
+        self.marks: Dict[str, float] = {}
+        self._stack: List[Tuple[ModuleTiming, float]] = []
+        self._started = clock()
+
+    def install(self):
+        _TimingFinder.register(self)
+
+    def mark(self, label: str, value_ms: float):
+        self.marks[label] = value_ms
+
+    def booted(self) -> dict:
+        self.phase = "lazy"
+        self.marks["core_import_ms"] = (self._clock() - self._started) * 1000.0
+        return {"modules": len(self.modules), "core_import_ms": self.marks["core_import_ms"]}
+
+    def _charge(self, name: str, field: str, started: float):
+        timing = self.modules.get(name)
+        if timing: setattr(timing, field, getattr(timing, field) + (self._clock() - started) * 1000.0)
+
+    def _enter(self, name: str):
+        timing = self.modules[name] = ModuleTiming(name, self.phase)
+        self._stack.append((timing, self._clock()))
+
+    def _exit(self):
+        timing, started = self._stack.pop()
+        total = (self._clock() - started) * 1000.0
+        timing.exec_ms = max(0.0, total - timing.read_ms - timing.compile_ms - timing.nested_ms)
+        if self._stack: self._stack[-1][0].nested_ms += total
+
+    def report(self, resources: Iterable[Tuple[str, float, int]] = ()) -> List[dict]:
+        """One row per fetched resource, mark and imported module, in load order."""
+        rows = [{"module": name, "phase": "fetch", "fetch_ms": round(ms, 2), "read_ms": 0.0, "compile_ms": 0.0,
+                 "exec_ms": 0.0, "total_ms": round(ms, 2), "bytes": size} for name, ms, size in resources]
+        rows += [{"module": label, "phase": "mark", "fetch_ms": 0.0, "read_ms": 0.0, "compile_ms": 0.0,
+                  "exec_ms": 0.0, "total_ms": round(ms, 2), "bytes": 0} for label, ms in self.marks.items()]
+        for t in self.modules.values():
+            total = t.read_ms + t.compile_ms + t.exec_ms
+            rows.append({"module": t.name, "phase": t.phase, "fetch_ms": 0.0, "read_ms": round(t.read_ms, 2),
+                         "compile_ms": round(t.compile_ms, 2), "exec_ms": round(t.exec_ms, 2),
+                         "total_ms": round(total, 2), "bytes": 0})
+        return rows
+
+class _TimedLoader(importlib.machinery.SourceFileLoader):
+    def __init__(self, profiler: StartupProfiler, fullname: str, path: str):
+        super().__init__(fullname, path)
+        self._profiler = profiler
+
+    def get_data(self, path):
+        started = self._profiler._clock()
+        try: return super().get_data(path)
+        finally: self._profiler._charge(self.name, "read_ms", started)
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        started = self._profiler._clock()
+        try: return super().source_to_code(data, path, _optimize=_optimize)
+        finally: self._profiler._charge(self.name, "compile_ms", started)
+
+    def exec_module(self, module):
+        self._profiler._enter(self.name)
+        try: super().exec_module(module)
+        finally: self._profiler._exit()
+
+class _TimingFinder:
+    """One meta-path entry shared by every profiler, keyed by top-level package name."""
+    profilers: Dict[str, StartupProfiler] = {}
+
+    @classmethod
+    def register(cls, profiler: StartupProfiler):
+        cls.profilers[profiler.root] = profiler
+        if cls not in sys.meta_path: sys.meta_path.insert(0, cls)
+
+    @classmethod
+    def find_spec(cls, fullname, path=None, target=None):
+        profiler = cls.profilers.get(fullname.partition(".")[0])
+        if profiler is None or path is None: return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is not None and isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            spec.loader = _TimedLoader(profiler, fullname, spec.origin)
+        return spec
+
+def resource_timings(window, suffixes=(".zip", ".py")) -> List[Tuple[str, float, int]]:
+    """Download time and size of the bundle and entry script from the browser's resource timing."""
+    try:
+        entries = window.performance.getEntriesByType("resource")
+    except:
+        return []
+    timings = []
+    for entry in entries:
+        name = str(entry.name).split("?")[0]
+        if name.endswith(suffixes):
+            timings.append((name.rsplit("/", 1)[-1], float(entry.duration), int(entry.transferSize or 0)))
+    return timings
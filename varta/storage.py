@@ -0,0 +1,377 @@
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pyodide.ffi import to_js, create_proxy
+
+# --- [Pulse Storage] ---
+
+DB_VERSION = 1
+PAGE_SIZE = 500
+# Per-liaison localStorage keys the IndexedDB store takes over on first open.
+LEGACY_META = ("protocols", "roomindex", "reactions")
+
+class StorageError(Exception):
+    pass
+
+def _legacy_key(name: str, uid: str) -> str:
+    return f"varta_{name}_{uid}"
+
+class MemoryBackend:
+    """IndexedDB's record layout in plain dicts: pulse rows keyed by ``(gid, seq)`` plus a meta table.
+
+    Rows are JSON-encoded on the way in, standing in for the structured
+    clone a real transaction pays, so headless benchmarks see the cost of
+    what they write.
+    """
+    name = "memory"
+
+    def __init__(self):
+        self._rows: Dict[str, Dict[int, str]] = {}
+        self._meta: Dict[str, str] = {}
+        self.stats = {"transactions": 0, "rows": 0, "meta": 0, "bytes": 0, "reads": 0}
+
+    async def open(self):
+        return self
+
+    async def heads(self) -> Dict[str, int]:
+        return {gid: max(rows) + 1 for gid, rows in self._rows.items() if rows}
+
+    async def commit(self, pulses: List[Tuple[str, int, dict]], meta: Dict[str, Any]):
+        self.stats["transactions"] += 1
+        for gid, seq, row in pulses:
+            encoded = json.dumps(row)
+            self._rows.setdefault(gid, {})[seq] = encoded
+            self.stats["rows"] += 1
+            self.stats["bytes"] += len(encoded)
+        for key, value in meta.items():
+            encoded = json.dumps(value)
+            self._meta[key] = encoded
+            self.stats["meta"] += 1
+            self.stats["bytes"] += len(encoded)
+
+    async def read_range(self, gid: str, start: int, end: int) -> List[dict]:
+        self.stats["reads"] += 1
+        rows = self._rows.get(gid, {})
+        return [json.loads(rows[seq]) for seq in range(start, end) if seq in rows]
+
+    async def get_meta(self, key: str):
+        stored = self._meta.get(key)
+        return json.loads(stored) if stored is not None else None
+
+class LocalStorageBackend:
+    """The original layout: every room under ``varta_msgstore_{uid}``, one key per meta record.
+
+    Used when IndexedDB is unavailable. Rows are kept pre-encoded so a
+    commit joins strings instead of re-serializing the whole archive, but
+    it is still one synchronous ``setItem`` of everything per commit.
+    """
+    name = "localStorage"
+
+    def __init__(self, storage, uid: str):
+        self._storage = storage
+        self._uid = uid
+        self._rooms: Dict[str, List[str]] = {}
+
+    async def open(self):
+        self._rooms = {}
+        try:
+            stored = self._storage.getItem(_legacy_key("msgstore", self._uid))
+            if stored:
+                for gid, pulses in json.loads(stored).items():
+                    self._rooms[gid] = [json.dumps(p) for p in pulses]
+        except:
+            pass
+        return self
+
+    async def heads(self) -> Dict[str, int]:
+        return {gid: len(rows) for gid, rows in self._rooms.items()}
+
+    async def commit(self, pulses: List[Tuple[str, int, dict]], meta: Dict[str, Any]):
+        self.commit_now(pulses, meta)
+
+    def commit_now(self, pulses: List[Tuple[str, int, dict]], meta: Dict[str, Any]):
+        """Synchronous commit, so ``pagehide`` can still write before the page goes away."""
+        for gid, seq, row in pulses:
+            rows = self._rooms.setdefault(gid, [])
+            if seq == len(rows): rows.append(json.dumps(row))
+        try:
+            if pulses:
+                body = ",".join(f"{json.dumps(gid)}:[{','.join(rows)}]" for gid, rows in self._rooms.items())
+                self._storage.setItem(_legacy_key("msgstore", self._uid), "{" + body + "}")
+            for key, value in meta.items():
+                self._storage.setItem(_legacy_key(key, self._uid), json.dumps(value))
+        except Exception as e:
+            raise StorageError(str(e))
+
+    async def read_range(self, gid: str, start: int, end: int) -> List[dict]:
+        rows = self._rooms.get(gid, [])[start:end]
+        return json.loads("[" + ",".join(rows) + "]")
+
+    async def get_meta(self, key: str):
+        stored = self._storage.getItem(_legacy_key(key, self._uid))
+        return json.loads(stored) if stored else None
+
+class IndexedDBBackend:
+    """``varta_{uid}`` database: a ``pulses`` store keyed by ``[gid, seq]`` and a ``meta`` store.
+
+    Per-room heads live in the ``heads`` meta record and are written in the
+    same transaction as the rows they cover.
+    """
+    name = "indexedDB"
+
+    def __init__(self, window, uid: str):
+        self._window = window
+        self._uid = uid
+        self._db = None
+        self._heads: Dict[str, int] = {}
+
+    def _js(self, value):
+        return to_js(value, dict_converter=self._window.Object.fromEntries)
+
+    async def open(self):
+        if self._db is None:
+            request = self._window.indexedDB.open(f"varta_{self._uid}", DB_VERSION)
+            request.onupgradeneeded = create_proxy(self._upgrade)
+            self._db = await _settle(request)
+        self._heads = await self.get_meta("heads") or {}
+        return self
+
+    def _upgrade(self, event):
+        db = event.target.result
+        if not db.objectStoreNames.contains("pulses"):
+            db.createObjectStore("pulses", self._js({"keyPath": ["gid", "seq"]}))
+        if not db.objectStoreNames.contains("meta"):
+            db.createObjectStore("meta")
+
+    async def heads(self) -> Dict[str, int]:
+        return dict(self._heads)
+
+    async def commit(self, pulses: List[Tuple[str, int, dict]], meta: Dict[str, Any]):
+        tx = self._db.transaction(self._js(["pulses", "meta"]), "readwrite", self._js({"durability": "relaxed"}))
+        done = _completion(tx)
+        store, meta_store = tx.objectStore("pulses"), tx.objectStore("meta")
+        heads = dict(self._heads)
+        for gid, seq, row in pulses:
+            store.put(self._js({**row, "gid": gid, "seq": seq}))
+            heads[gid] = max(heads.get(gid, 0), seq + 1)
+        if pulses: meta = {**meta, "heads": heads}
+        for key, value in meta.items():
+            meta_store.put(self._js(value), key)
+        await done
+        self._heads = heads
+
+    async def read_range(self, gid: str, start: int, end: int) -> List[dict]:
+        if end <= start: return []
+        bounds = self._window.IDBKeyRange.bound(self._js([gid, start]), self._js([gid, end - 1]))
+        tx = self._db.transaction("pulses", "readonly")
+        rows = await _settle(tx.objectStore("pulses").getAll(bounds))
+        return rows.to_py()
+
+    async def get_meta(self, key: str):
+        tx = self._db.transaction("meta", "readonly")
+        value = await _settle(tx.objectStore("meta").get(key))
+        return value.to_py() if hasattr(value, "to_py") else value
+
+def _settle(request) -> asyncio.Future:
+    """Future resolved with an IDBRequest's result, or failed with its error."""
+    future = asyncio.get_event_loop().create_future()
+    def succeeded(event):
+        if not future.done(): future.set_result(request.result)
+    def failed(event):
+        if not future.done(): future.set_exception(StorageError(str(request.error)))
+    _bind_once(request, onsuccess=succeeded, onerror=failed)
+    return future
+
+def _completion(tx) -> asyncio.Future:
+    future = asyncio.get_event_loop().create_future()
+    def completed(event):
+        if not future.done(): future.set_result(None)
+    def failed(event):
+        if not future.done(): future.set_exception(StorageError(str(tx.error)))
+    _bind_once(tx, oncomplete=completed, onerror=failed, onabort=failed)
+    return future
+
+def _bind_once(target, **handlers):
+    """Attach event handlers whose proxies are all released after the first one fires."""
+    proxies = []
+    def release():
+        for proxy in proxies:
+            try: proxy.destroy()
+            except: pass
+    for attr, handler in handlers.items():
+        def fire(event, handler=handler):
+            handler(event)
+            release()
+        proxy = create_proxy(fire)
+        proxies.append(proxy)
+        setattr(target, attr, proxy)
+
+class PulseStore:
+    """Write-behind front for a storage backend.
+
+    ``append`` assigns the next sequence number in the room and queues the
+    row; ``put_meta`` queues the latest value per key (a zero-argument
+    callable is resolved at flush time, so hot paths can hand over a
+    snapshot method instead of serializing on every call). Everything
+    queued goes to the backend as one transaction ``delay`` seconds after
+    the first write.
+    """
+
+    def __init__(self, backend, delay: float = 0.05, log: Optional[Callable[[str], None]] = None):
+        self.backend = backend
+        self._delay = delay
+        self._log = log
+        self._heads: Dict[str, int] = {}
+        self._pulses: List[Tuple[str, int, dict]] = []
+        self._meta: Dict[str, Any] = {}
+        self._timer = None
+        self._lock = asyncio.Lock()
+        self.stats = {"appends": 0, "meta": 0, "flushes": 0, "errors": 0}
+
+    async def open(self):
+        self._heads = await self.backend.heads()
+        return self
+
+    async def refresh(self):
+        """Re-read heads after another tab has been writing, e.g. when this one takes over persistence."""
+        await self.flush()
+        await self.backend.open()
+        return await self.open()
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    def rooms(self) -> List[str]:
+        return list(self._heads)
+
+    def head(self, gid: str) -> int:
+        return self._heads.get(gid, 0)
+
+    def append(self, gid: str, row: dict) -> int:
+        seq = self._heads.get(gid, 0)
+        self._heads[gid] = seq + 1
+        self._pulses.append((gid, seq, row))
+        self.stats["appends"] += 1
+        self._schedule()
+        return seq
+
+    def put_meta(self, key: str, value):
+        self._meta[key] = value
+        self.stats["meta"] += 1
+        self._schedule()
+
+    def _schedule(self):
+        if self._timer is None:
+            self._timer = asyncio.get_event_loop().call_later(self._delay, lambda: asyncio.ensure_future(self.flush()))
+
+    def _take(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pulses, self._pulses = self._pulses, []
+        meta, self._meta = self._meta, {}
+        return pulses, {k: v() if callable(v) else v for k, v in meta.items()}
+
+    def _failed(self, pulses, e):
+        self.stats["errors"] += 1
+        if self._log: self._log(f"[Storage] {self.name} commit of {len(pulses)} pulses failed: {e}")
+
+    async def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            if not self._pulses and not self._meta: return
+            pulses, meta = self._take()
+            try:
+                await self.backend.commit(pulses, meta)
+                self.stats["flushes"] += 1
+            except Exception as e:
+                self._failed(pulses, e)
+
+    def discard(self) -> int:
+        """Drop queued writes without committing them; returns how many pulses were dropped."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        dropped = len(self._pulses)
+        self._pulses, self._meta = [], {}
+        return dropped
+
+    def flush_now(self) -> bool:
+        """Commit before returning where the backend can (localStorage); otherwise start an async flush."""
+        commit_now = getattr(self.backend, "commit_now", None)
+        if commit_now is None:
+            asyncio.ensure_future(self.flush())
+            return False
+        if not self._pulses and not self._meta: return True
+        pulses, meta = self._take()
+        try:
+            commit_now(pulses, meta)
+            self.stats["flushes"] += 1
+        except Exception as e:
+            self._failed(pulses, e)
+        return True
+
+    async def read_range(self, gid: str, start: int, end: int) -> List[dict]:
+        await self.flush()
+        return await self.backend.read_range(gid, max(0, start), min(end, self.head(gid)))
+
+    async def read_recent(self, gid: str, end: Optional[int] = None, limit: int = PAGE_SIZE) -> Tuple[int, List[dict]]:
+        """The page of up to ``limit`` rows ending before ``end`` (default: the room's head), with its first seq."""
+        end = self.head(gid) if end is None else end
+        start = max(0, end - limit)
+        return start, await self.read_range(gid, start, end)
+
+    async def get_meta(self, key: str):
+        if key in self._meta:
+            value = self._meta[key]
+            return value() if callable(value) else value
+        return await self.backend.get_meta(key)
+
+async def migrate_legacy(storage, uid: str, backend) -> int:
+    """Copy ``varta_msgstore_*`` and the other legacy keys into ``backend`` once, then drop them.
+
+    Each key is decoded on its own; only keys whose contents were committed
+    are removed. An undecodable message store is left in place and the
+    migration is retried on the next open.
+    """
+    if await backend.get_meta("migrated"): return 0
+    pulses, meta, copied = [], {}, []
+    stored = storage.getItem(_legacy_key("msgstore", uid))
+    try:
+        for gid, rows in (json.loads(stored) if stored else {}).items():
+            pulses.extend((gid, seq, row) for seq, row in enumerate(rows))
+        meta["migrated"] = 1
+        if stored: copied.append("msgstore")
+    except:
+        pulses = []
+    for name in LEGACY_META:
+        stored = storage.getItem(_legacy_key(name, uid))
+        if not stored: continue
+        try:
+            meta[name] = json.loads(stored)
+            copied.append(name)
+        except:
+            pass
+    await backend.commit(pulses, meta)
+    for name in copied:
+        storage.removeItem(_legacy_key(name, uid))
+    return len(pulses)
+
+async def open_store(window, storage, uid: str, log: Optional[Callable[[str], None]] = None) -> PulseStore:
+    """IndexedDB when the browser offers it (migrating localStorage data on first use), else localStorage."""
+    backend = None
+    if getattr(window, "indexedDB", None):
+        try:
+            backend = await IndexedDBBackend(window, uid).open()
+            migrated = await migrate_legacy(storage, uid, backend)
+            if migrated and log: log(f"[Storage] moved {migrated} pulses from localStorage to IndexedDB")
+        except Exception as e:
+            backend = None
+            if log: log(f"[Storage] IndexedDB unavailable, using localStorage: {e}")
+    if backend is None:
+        backend = await LocalStorageBackend(storage, uid).open()
+    return await PulseStore(backend, log=log).open()
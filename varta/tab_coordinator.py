@@ -0,0 +1,112 @@
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Callable, Optional
+
+# --- [Multi-Tab Leader Election] ---
+
+class TabCoordinator:
+    """Elects one tab per liaison as leader via a lease in shared storage.
+
+    The leader owns the socket, the discovery beacon and persistence; other
+    tabs talk to it over a BroadcastChannel. A leader that stops renewing
+    (closed, crashed, frozen) loses the lease after ``lease_ttl`` seconds and
+    the next follower to claim it takes over; the old leader steps down as
+    soon as it hears the new one announce itself.
+    """
+
+    def __init__(self, uid: str, storage, channel, on_role: Callable[[bool], None],
+                 on_message: Callable[[str, Any, str], None], lease_ttl: float = 3.0,
+                 heartbeat: float = 1.0, clock=time.time):
+        self.tab_id = f"TAB-{int(time.time()*1000)}-{random.randint(100,999)}"
+        self.is_leader = False
+        self._lease_key = f"varta_leader_{uid}"
+        self._storage = storage
+        self._channel = channel
+        self._on_role = on_role
+        self._on_message = on_message
+        self._lease_ttl = lease_ttl
+        self._heartbeat = heartbeat
+        self._clock = clock
+        self._leader_seen = 0.0
+        self._wake = None
+
+    def _read_lease(self) -> Optional[dict]:
+        try:
+            raw = self._storage.getItem(self._lease_key)
+            return json.loads(raw) if raw else None
+        except:
+            return None
+
+    def _write_lease(self):
+        self._storage.setItem(self._lease_key, json.dumps({"tab": self.tab_id, "expires": self._clock() + self._lease_ttl}))
+
+    def _set_role(self, leader: bool):
+        if leader == self.is_leader: return
+        self.is_leader = leader
+        if leader: self.post("leader", {})
+        self._on_role(leader)
+
+    def leader_present(self) -> bool:
+        if self.is_leader: return True
+        return self._clock() - self._leader_seen < self._lease_ttl
+
+    async def run(self):
+        while True:
+            await self.tick()
+            self._wake = asyncio.get_event_loop().create_future()
+            try: await asyncio.wait_for(self._wake, self._heartbeat)
+            except asyncio.TimeoutError: pass
+            self._wake = None
+
+    async def tick(self):
+        lease = self._read_lease()
+        now = self._clock()
+        if lease and lease.get("tab") == self.tab_id:
+            self._write_lease()
+            self._set_role(True)
+            return
+        if lease and lease.get("expires", 0) > now:
+            self._leader_seen = now
+            self._set_role(False)
+            return
+        # Lease free or stale: claim, then confirm nobody overwrote us in the same instant.
+        self._write_lease()
+        await asyncio.sleep(0.05)
+        lease = self._read_lease()
+        self._set_role(bool(lease and lease.get("tab") == self.tab_id))
+
+    def resign(self):
+        if not self.is_leader: return
+        lease = self._read_lease()
+        if lease and lease.get("tab") == self.tab_id:
+            self._storage.removeItem(self._lease_key)
+        self.post("resign", {})
+        self.is_leader = False
+
+    def post(self, kind: str, body: Any):
+        try:
+            self._channel.postMessage(json.dumps({"kind": kind, "tab": self.tab_id, "body": body}))
+        except:
+            pass
+
+    def receive(self, raw: str):
+        try:
+            msg = json.loads(raw)
+        except:
+            return
+        kind = msg.get("kind")
+        if kind == "leader" and self.is_leader and msg.get("tab") != self.tab_id:
+            # Our renewals were throttled (hidden tab) and the lease went to another tab: step down now, not on the next tick.
+            self._set_role(False)
+        if kind == "leader" or (kind == "signal" and not self.is_leader):
+            self._leader_seen = self._clock()
+        if kind == "resign":
+            self._leader_seen = 0.0
+            if self._wake and not self._wake.done(): self._wake.set_result(None)
+            return
+        if kind == "signal" and msg.get("body", {}).get("origin_tab") == self.tab_id:
+            return
+        self._on_message(kind, msg.get("body"), msg.get("tab"))